@@ -54,6 +54,10 @@ def initialize_session_state():
     if 'outposts' not in st.session_state:
         st.session_state.outposts = []
 
+    # Bumped whenever the outposts list changes, so pages can cache lookups
+    if 'outposts_version' not in st.session_state:
+        st.session_state.outposts_version = 0
+
     # Initialize current page if not exists
     if 'current_page' not in st.session_state:
         st.session_state.current_page = "Home"
@@ -121,7 +125,7 @@ def render_sidebar():
         st.caption(f"Outposts: {len(st.session_state.outposts)}")
         online_count = sum(
             1 for o in st.session_state.outposts
-            if o.status == OutpostStatus.ONLINE
+            if o.status is OutpostStatus.ONLINE
         )
         st.caption(f"Online: {online_count}")
         st.caption(f"Achievements: {len(user.achievements)}")
@@ -170,8 +174,8 @@ def render_home_page():
 
     with cols[1]:
         completed = sum(
-            1 for ch in user.chapters.values()
-            if ch.status == ChapterStatus.COMPLETED
+            1 for ch in user.chapters
+            if ch.status is ChapterStatus.COMPLETED
         )
         st.metric("Chapters Completed", f"{completed}/10")
 
@@ -247,6 +251,7 @@ def render_outposts_page():
                         ssh_port=ssh_port
                     )
                     st.session_state.outposts.append(new_outpost)
+                    st.session_state.outposts_version += 1
                     st.success(f"✅ Added outpost: {name}")
                     st.rerun()
                 else:
@@ -278,6 +283,7 @@ def render_outposts_page():
                 with cols[3]:
                     if st.button("🗑️ Remove", key=f"remove_{idx}"):
                         st.session_state.outposts.pop(idx)
+                        st.session_state.outposts_version += 1
                         st.rerun()
 
                 st.divider()
@@ -13,12 +13,16 @@ To run this API:
     uvicorn raspberry_pi.api.fishing_fort:app --host 0.0.0.0 --port 8000 --reload
 """
 
-from fastapi import FastAPI, HTTPException, Query, Path, UploadFile, File, Depends
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi import FastAPI, HTTPException, Query, Path, UploadFile, File, Depends, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, FileResponse, Response
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 from datetime import datetime, date
 import sqlite3
+import hashlib
+import json
 from pathlib import Path as FilePath
 import logging
 import os
@@ -34,6 +38,14 @@ logger = logging.getLogger(__name__)
 # Database configuration
 DB_PATH = FilePath(__file__).parent.parent / "db" / "data" / "fishing_fort.db"
 
+# Items with less than this quantity count as low stock
+LOW_STOCK_THRESHOLD = 50
+
+# Most item IDs accepted by one /inventory request. Each ID is a bound SQL
+# variable, and older SQLite builds allow only 999 per statement (the other
+# filters and LIMIT/OFFSET need a few more).
+MAX_IDS_PER_REQUEST = 900
+
 
 # ============================================================================
 # Pydantic Models for Request/Response Validation
@@ -103,6 +115,15 @@ class CatchRecord(BaseModel):
     created_at: Optional[str] = None
 
 
+class InventorySummary(BaseModel):
+    """Aggregate figures for a (filtered) inventory listing."""
+    total_items: int
+    total_value: float
+    categories: int
+    low_stock_items: int
+    low_stock_threshold: int
+
+
 class StatusResponse(BaseModel):
     """Response model for outpost status."""
     outpost_name: str
@@ -130,6 +151,11 @@ app = FastAPI(
 # This provides /auth/login, /auth/me, and /auth/users endpoints
 add_auth_routes(app)
 
+# Educational Note: Compress larger JSON responses (inventory, log lists)
+# for clients that send Accept-Encoding: gzip. Small responses are sent
+# as-is because compressing them costs more CPU than it saves bytes.
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 
 # ============================================================================
 # Database Helper Functions
@@ -163,6 +189,34 @@ def dict_from_row(row: sqlite3.Row) -> Dict[str, Any]:
     return {key: row[key] for key in row.keys()}
 
 
+def conditional_json_response(request: Request, content: Any) -> Response:
+    """
+    Serialize content as JSON with an ETag, honouring If-None-Match.
+
+    Args:
+        request: The incoming request (checked for an If-None-Match header)
+        content: Data to return (models, lists, dicts)
+
+    Returns:
+        A 200 JSON response carrying an ETag, or an empty 304 Not Modified
+        response if the client already holds this exact body
+
+    Educational Note:
+    The ETag is a hash of the response body, so it changes whenever the
+    data does. A client that sends back the ETag it last saw gets a 304
+    with no body when nothing has changed, saving the transfer and the
+    client-side JSON parsing.
+    """
+    body = json.dumps(jsonable_encoder(content), separators=(",", ":")).encode()
+    etag = f'"{hashlib.sha1(body).hexdigest()}"'
+
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
 # ============================================================================
 # Root and Metadata Endpoints
 # ============================================================================
@@ -258,9 +312,12 @@ async def get_outpost_status():
 
 @app.get("/inventory", response_model=List[InventoryItem])
 async def get_inventory(
+    request: Request,
     category: Optional[str] = Query(None, description="Filter by category"),
     min_quantity: Optional[int] = Query(None, ge=0, description="Minimum quantity"),
-    limit: int = Query(100, ge=1, le=1000, description="Maximum results to return")
+    ids: Optional[str] = Query(None, description="Comma-separated item IDs to fetch"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum results to return"),
+    offset: int = Query(0, ge=0, description="Number of results to skip (for paging)")
 ):
     """
     Get inventory items with optional filtering.
@@ -268,15 +325,33 @@ async def get_inventory(
     Args:
         category: Filter by category (food, tools, supplies)
         min_quantity: Only return items with quantity >= this value
+        ids: Only return items with these IDs (e.g. "1,2,3"), at most
+            MAX_IDS_PER_REQUEST of them
         limit: Maximum number of items to return
+        offset: Number of matching items to skip, for fetching later pages
 
     Returns:
         List of inventory items
 
     Educational Note:
     Query parameters allow clients to filter results. This is more efficient
-    than returning all data and filtering client-side.
+    than returning all data and filtering client-side. The ids filter lets a
+    client fetch many specific items in one round trip instead of calling
+    /inventory/{item_id} once per item. Responses carry an ETag so clients
+    can make conditional requests (see conditional_json_response).
     """
+    item_ids = []
+    if ids:
+        try:
+            item_ids = [int(item_id) for item_id in ids.split(',') if item_id.strip()]
+        except ValueError:
+            raise HTTPException(status_code=400, detail="ids must be comma-separated integers")
+        if len(item_ids) > MAX_IDS_PER_REQUEST:
+            raise HTTPException(
+                status_code=400,
+                detail=f"At most {MAX_IDS_PER_REQUEST} ids can be requested at once"
+            )
+
     try:
         conn = get_db_connection()
         cursor = conn.cursor()
@@ -293,8 +368,12 @@ async def get_inventory(
             query += " AND quantity >= ?"
             params.append(min_quantity)
 
-        query += " ORDER BY category, name LIMIT ?"
-        params.append(limit)
+        if item_ids:
+            query += f" AND item_id IN ({','.join('?' * len(item_ids))})"
+            params.extend(item_ids)
+
+        query += " ORDER BY category, name LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
 
         cursor.execute(query, params)
         rows = cursor.fetchall()
@@ -304,13 +383,70 @@ async def get_inventory(
         items = [InventoryItem(**dict_from_row(row)) for row in rows]
 
         logger.info(f"Retrieved {len(items)} inventory items")
-        return items
+        return conditional_json_response(request, items)
 
     except Exception as e:
         logger.error(f"Error fetching inventory: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to fetch inventory: {str(e)}")
 
 
+@app.get("/inventory/summary", response_model=InventorySummary)
+async def get_inventory_summary(
+    category: Optional[str] = Query(None, description="Filter by category"),
+    min_quantity: Optional[int] = Query(None, ge=0, description="Minimum quantity")
+):
+    """
+    Get aggregate figures for the inventory, with the same filters as /inventory.
+
+    Returns:
+        InventorySummary with item count, total value, category count and
+        number of low-stock items
+
+    Educational Note:
+    A dashboard showing totals shouldn't have to download every item just
+    to add them up. SQLite computes the aggregates in one query and only a
+    handful of numbers cross the network, so the client can page through
+    the item list itself.
+    """
+    try:
+        conn = get_db_connection()
+        cursor = conn.cursor()
+
+        query = """
+            SELECT
+                COUNT(*),
+                COALESCE(SUM(value), 0),
+                COUNT(DISTINCT category),
+                COALESCE(SUM(quantity < ?), 0)
+            FROM inventory WHERE 1=1
+        """
+        params: List[Any] = [LOW_STOCK_THRESHOLD]
+
+        if category:
+            query += " AND category = ?"
+            params.append(category)
+
+        if min_quantity is not None:
+            query += " AND quantity >= ?"
+            params.append(min_quantity)
+
+        cursor.execute(query, params)
+        total_items, total_value, categories, low_stock = cursor.fetchone()
+        conn.close()
+
+        return InventorySummary(
+            total_items=total_items,
+            total_value=total_value,
+            categories=categories,
+            low_stock_items=low_stock,
+            low_stock_threshold=LOW_STOCK_THRESHOLD
+        )
+
+    except Exception as e:
+        logger.error(f"Error generating inventory summary: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to generate summary: {str(e)}")
+
+
 @app.get("/inventory/{item_id}", response_model=InventoryItem)
 async def get_inventory_item(
     item_id: int = Path(..., gt=0, description="Inventory item ID")
@@ -488,6 +624,7 @@ async def delete_inventory_item(item_id: int):
 
 @app.get("/catches", response_model=List[CatchRecord])
 async def get_catch_records(
+    request: Request,
     fish_type: Optional[str] = Query(None, description="Filter by fish type"),
     limit: int = Query(50, ge=1, le=500, description="Maximum results")
 ):
@@ -499,7 +636,7 @@ async def get_catch_records(
         limit: Maximum number of records to return
 
     Returns:
-        List of catch records
+        List of catch records (with an ETag for conditional requests)
     """
     try:
         conn = get_db_connection()
@@ -521,7 +658,7 @@ async def get_catch_records(
 
         records = [CatchRecord(**dict_from_row(row)) for row in rows]
         logger.info(f"Retrieved {len(records)} catch records")
-        return records
+        return conditional_json_response(request, records)
 
     except Exception as e:
         logger.error(f"Error fetching catch records: {e}")
@@ -18,6 +18,7 @@ To run this API:
 """
 
 from fastapi import FastAPI, HTTPException, Query, Path, Depends
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
@@ -172,6 +173,11 @@ app = FastAPI(
 # Add authentication routes
 add_auth_routes(app)
 
+# Educational Note: Compress the animal, party and pelt harvest lists
+# for clients that send Accept-Encoding: gzip. Responses under 1KB, such
+# as /health or a single animal, are sent as-is.
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 
 # ============================================================================
 # Database Helper Functions
@@ -415,9 +421,19 @@ async def get_hunting_party(party_id: int = Path(..., gt=0)):
 async def get_pelt_harvests(
     species: Optional[str] = Query(None, description="Filter by species"),
     quality: Optional[str] = Query(None, description="Filter by quality"),
-    party_id: Optional[int] = Query(None, description="Filter by party ID")
+    party_id: Optional[int] = Query(None, description="Filter by party ID"),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Maximum results to return"),
+    offset: int = Query(0, ge=0, description="Number of results to skip (for paging)")
 ):
-    """Get list of pelt harvests with optional filters."""
+    """
+    Get list of pelt harvests with optional filters, newest first.
+
+    Educational Note:
+    A dashboard that shows only the latest few records can pass limit, so
+    the database stops early and the rest of the table is never sent.
+    limit and offset together page through the records one screenful at
+    a time.
+    """
     try:
         conn = get_db_connection()
 
@@ -436,7 +452,13 @@ async def get_pelt_harvests(
             query += " AND party_id = ?"
             params.append(party_id)
 
-        query += " ORDER BY date_harvested DESC"
+        # harvest_id breaks ties so limited results are deterministic
+        query += " ORDER BY date_harvested DESC, harvest_id DESC"
+
+        if limit is not None or offset:
+            # SQLite needs a LIMIT for OFFSET; -1 means no limit
+            query += " LIMIT ? OFFSET ?"
+            params.extend([-1 if limit is None else limit, offset])
 
         rows = conn.execute(query, params).fetchall()
         conn.close()
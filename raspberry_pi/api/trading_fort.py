@@ -17,6 +17,7 @@ To run this API:
 """
 
 from fastapi import FastAPI, HTTPException, Query, Path, Depends
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
@@ -143,6 +144,11 @@ app = FastAPI(
 # Add authentication routes
 add_auth_routes(app)
 
+# Educational Note: Compress the goods, trader and trade record lists
+# for clients that send Accept-Encoding: gzip. Responses under 1KB, such
+# as /health or a single good, are sent as-is.
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 
 # ============================================================================
 # Database Helper Functions
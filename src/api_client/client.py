@@ -14,15 +14,60 @@ This client now supports token-based authentication, allowing secure
 access to protected API endpoints.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+import orjson
 import requests
-from typing import Optional, Dict, Any, List, Callable
-from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from requests_toolbelt import MultipartEncoder
+from typing import Optional, Dict, Any, List, Callable, Tuple
 import logging
 from pathlib import Path
 import time
 
 logger = logging.getLogger(__name__)
 
+# Size of each chunk written to disk while streaming a download
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Most item IDs sent in one /inventory request (the server's cap on ids,
+# which keeps each query under SQLite's 999 bound-variable limit)
+INVENTORY_IDS_PER_REQUEST = 900
+
+# Fixed-path endpoints whose full URLs are built once per client
+COMMON_ENDPOINTS = (
+    '/health',
+    '/status',
+    '/inventory',
+    '/catches',
+    '/catches/summary',
+    '/files/list',
+    '/logs/list',
+    '/system/disk-usage',
+    '/system/info',
+    '/auth/me',
+    '/auth/users',
+    '/admin/stats',
+    '/goods',
+    '/traders',
+    '/trades',
+    '/trades/summary',
+    '/animals',
+    '/parties',
+    '/harvests',
+)
+
+# Read-only endpoints that dashboards poll repeatedly; their response
+# bodies are cached for cache_ttl seconds
+CACHEABLE_ENDPOINTS = frozenset({
+    '/health',
+    '/status',
+    '/files/list',
+    '/logs/list',
+    '/system/disk-usage',
+    '/system/info',
+    '/auth/users',
+})
+
 
 class OutpostAPIClient:
     """
@@ -38,13 +83,38 @@ class OutpostAPIClient:
     include bearer tokens in subsequent requests to protected endpoints.
     """
 
+    # Fixed attribute layout keeps each client small when many outposts are
+    # tracked at once
+    __slots__ = (
+        'base_url',
+        '_urls',
+        'timeout',
+        'session',
+        '_owns_session',
+        '_token',
+        '_token_expires_monotonic',
+        'max_retries',
+        'retry_backoff_factor',
+        'cache_ttl',
+        '_cache',
+        'circuit_failure_threshold',
+        'circuit_cooldown',
+        '_failure_count',
+        '_circuit_open_until',
+    )
+
     def __init__(
         self,
         base_url: str,
         timeout: int = 10,
         token: Optional[str] = None,
         max_retries: int = 3,
-        retry_backoff_factor: float = 2.0
+        retry_backoff_factor: float = 2.0,
+        pool_maxsize: int = 4,
+        cache_ttl: float = 5.0,
+        circuit_failure_threshold: int = 3,
+        circuit_cooldown: float = 30.0,
+        session: Optional[requests.Session] = None
     ):
         """
         Initialize API client with optional authentication and retry configuration.
@@ -65,6 +135,14 @@ class OutpostAPIClient:
             token: Optional pre-existing authentication token
             max_retries: Maximum number of retry attempts for failed requests
             retry_backoff_factor: Multiplier for exponential backoff (default: 2.0)
+            pool_maxsize: Maximum open connections to the outpost (default: 4)
+            cache_ttl: Seconds to cache read-only GET responses (0 disables)
+            circuit_failure_threshold: Consecutive unreachable-outpost failures
+                before requests are skipped (default: 3)
+            circuit_cooldown: Seconds to skip requests once the circuit opens
+            session: Optional Session shared with other clients (see
+                endpoints.make_outpost_clients). The client keeps its auth
+                token off a shared session's headers.
 
         Example:
             # Without authentication
@@ -85,15 +163,47 @@ class OutpostAPIClient:
             client.login("username", "password")
         """
         self.base_url = base_url.rstrip('/')
+        self._urls: Dict[str, str] = {
+            endpoint: f"{self.base_url}{endpoint}" for endpoint in COMMON_ENDPOINTS
+        }
         self.timeout = timeout
-        self.session = requests.Session()
         self._token: Optional[str] = token
-        self._token_expires_at: Optional[datetime] = None
+
+        self._owns_session = session is None
+        if session is None:
+            session = requests.Session()
+            # Bursts of concurrent calls to one outpost share a small pool of
+            # keep-alive connections instead of opening a socket per request.
+            # pool_block makes extra callers wait for a free connection, which
+            # caps the number of sockets the Pi has to hold open.
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, pool_block=True)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            # Ask outposts for gzip only; JSON lists compress well and
+            # zlib decompression is cheap next to a slow link
+            session.headers['Accept-Encoding'] = 'gzip'
+        self.session = session
+
+        # Expiry on the time.monotonic() clock, so NTP steps on the Pi
+        # can't make a token look expired (or valid) early
+        self._token_expires_monotonic: Optional[float] = None
 
         # Retry configuration
         self.max_retries = max_retries
         self.retry_backoff_factor = retry_backoff_factor
 
+        # Short-lived cache for CACHEABLE_ENDPOINTS:
+        # (endpoint, params) -> (expires_at, raw JSON body). The bytes are
+        # decoded on every hit so each caller gets its own dict to modify.
+        self.cache_ttl = cache_ttl
+        self._cache: Dict[Tuple[str, Any], Tuple[float, bytes]] = {}
+
+        # Circuit breaker state (see _record_failure)
+        self.circuit_failure_threshold = circuit_failure_threshold
+        self.circuit_cooldown = circuit_cooldown
+        self._failure_count = 0
+        self._circuit_open_until = 0.0
+
         # If token provided, set it in session headers
         if self._token:
             self._set_auth_header()
@@ -105,7 +215,13 @@ class OutpostAPIClient:
         Educational Note:
         Bearer token authentication uses the Authorization header with format:
         "Bearer <token>". This is a standard authentication method in REST APIs.
+
+        A shared session serves several outposts, so its headers are left
+        alone and the token is added per request in _request_headers().
         """
+        if not self._owns_session:
+            return
+
         if self._token:
             self.session.headers.update({
                 'Authorization': f'Bearer {self._token}'
@@ -116,6 +232,12 @@ class OutpostAPIClient:
             self.session.headers.pop('Authorization', None)
             logger.debug("Authentication header removed from session")
 
+    def _request_headers(self, headers: Optional[Dict[str, str]] = None) -> Optional[Dict[str, str]]:
+        """Add this client's auth header to per-request headers on a shared session."""
+        if self._owns_session or not self._token:
+            return headers
+        return {'Authorization': f'Bearer {self._token}', **(headers or {})}
+
     @property
     def is_authenticated(self) -> bool:
         """
@@ -128,6 +250,17 @@ class OutpostAPIClient:
         """
         return self._token is not None
 
+    @property
+    def is_token_expired(self) -> bool:
+        """
+        Check if the current token has passed its expiry time.
+
+        Tokens without a known expiry are treated as not expired.
+        """
+        if self._token_expires_monotonic is None:
+            return False
+        return time.monotonic() >= self._token_expires_monotonic
+
     @property
     def token(self) -> Optional[str]:
         """Get the current authentication token."""
@@ -147,9 +280,10 @@ class OutpostAPIClient:
         """
         self._token = token
         self._set_auth_header()
+        self.invalidate_cache()
 
         if expires_in:
-            self._token_expires_at = datetime.now() + timedelta(seconds=expires_in)
+            self._token_expires_monotonic = time.monotonic() + expires_in
 
         logger.info("Authentication token set manually")
 
@@ -161,8 +295,9 @@ class OutpostAPIClient:
         Call this to log out or clear authentication state.
         """
         self._token = None
-        self._token_expires_at = None
+        self._token_expires_monotonic = None
         self._set_auth_header()
+        self.invalidate_cache()
         logger.info("Authentication token cleared")
 
     def login(self, username: str, password: str) -> bool:
@@ -190,15 +325,13 @@ class OutpostAPIClient:
                 stats = client.get_admin_stats()
         """
         try:
-            # Temporarily clear auth header for login request
-            old_token = self._token
-            self._token = None
-            self._set_auth_header()
-
-            # Make login request
+            # Send the login request without any existing auth header.
+            # requests drops headers set to None for this call only, so
+            # the session keeps its current token if login fails.
             response = self.session.post(
                 f"{self.base_url}/auth/login",
                 json={"username": username, "password": password},
+                headers={'Authorization': None},
                 timeout=self.timeout
             )
 
@@ -207,25 +340,19 @@ class OutpostAPIClient:
                 self._token = data.get('access_token')
                 expires_in = data.get('expires_in', 3600)
 
-                self._token_expires_at = datetime.now() + timedelta(seconds=expires_in)
+                self._token_expires_monotonic = time.monotonic() + expires_in
                 self._set_auth_header()
+                # Cached per-user responses belong to the previous token
+                self.invalidate_cache()
 
-                logger.info(f"Login successful for user: {username}")
+                logger.info("Login successful for user: %s", username)
                 return True
             else:
-                logger.error(f"Login failed: {response.status_code} - {response.text}")
-                # Restore old token if login failed
-                self._token = old_token
-                if old_token:
-                    self._set_auth_header()
+                logger.error("Login failed: %s - %s", response.status_code, response.text)
                 return False
 
         except Exception as e:
-            logger.error(f"Login error: {e}")
-            # Restore old token if login failed
-            self._token = old_token
-            if old_token:
-                self._set_auth_header()
+            logger.error("Login error: %s", e)
             return False
 
     def get_current_user(self) -> Optional[Dict[str, Any]]:
@@ -325,7 +452,7 @@ class OutpostAPIClient:
         base_delay = 1.0
         delay = base_delay * (self.retry_backoff_factor ** attempt)
 
-        logger.debug(f"Calculated backoff delay: {delay:.2f}s for attempt {attempt}")
+        logger.debug("Calculated backoff delay: %.2fs for attempt %d", delay, attempt)
         return delay
 
     def _make_request_with_retry(
@@ -335,6 +462,8 @@ class OutpostAPIClient:
         params: Optional[Dict] = None,
         json_data: Optional[Dict] = None,
         files: Optional[Dict] = None,
+        data: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
         retry_enabled: bool = True
     ) -> requests.Response:
         """
@@ -347,12 +476,18 @@ class OutpostAPIClient:
         3. Try again up to max_retries times
         4. If all retries fail, raise the last exception
 
+        The request is prepared once (URL encoding, header merging, body
+        serialization) and the same PreparedRequest is re-sent on each
+        attempt, so retries skip all of that work.
+
         Args:
             method: HTTP method
             url: Full URL to request
             params: Query parameters
             json_data: JSON body data
             files: Files for upload
+            data: Raw request body (e.g. a streaming MultipartEncoder)
+            headers: Extra headers for this request only
             retry_enabled: Whether to enable retries (default: True)
 
         Returns:
@@ -364,23 +499,38 @@ class OutpostAPIClient:
         last_exception = None
         max_attempts = self.max_retries + 1 if retry_enabled else 1
 
+        prepared = self.session.prepare_request(requests.Request(
+            method=method,
+            url=url,
+            params=params,
+            json=json_data,
+            files=files,
+            data=data,
+            headers=self._request_headers(headers)
+        ))
+        send_kwargs = self.session.merge_environment_settings(
+            prepared.url, {}, None, None, None
+        )
+
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
         for attempt in range(max_attempts):
             try:
-                logger.debug(f"Request attempt {attempt + 1}/{max_attempts}: {method} {url}")
-
-                response = self.session.request(
-                    method=method,
-                    url=url,
-                    params=params,
-                    json=json_data,
-                    files=files,
-                    timeout=self.timeout
+                if debug_enabled:
+                    logger.debug("Request attempt %d/%d: %s %s", attempt + 1, max_attempts, method, url)
+
+                response = self.session.send(
+                    prepared,
+                    timeout=self.timeout,
+                    **send_kwargs
                 )
-                response.raise_for_status()
+                # Only pay for raise_for_status() on the (rare) error path
+                if not 200 <= response.status_code < 300:
+                    response.raise_for_status()
 
                 # Success!
                 if attempt > 0:
-                    logger.info(f"Request succeeded on attempt {attempt + 1}/{max_attempts}")
+                    logger.info("Request succeeded on attempt %d/%d", attempt + 1, max_attempts)
 
                 return response
 
@@ -391,14 +541,14 @@ class OutpostAPIClient:
                 if attempt < max_attempts - 1 and self._is_retryable_error(e):
                     delay = self._calculate_backoff_delay(attempt)
                     logger.warning(
-                        f"Request failed (attempt {attempt + 1}/{max_attempts}): {str(e)}. "
-                        f"Retrying in {delay:.2f}s..."
+                        "Request failed (attempt %d/%d): %s. Retrying in %.2fs...",
+                        attempt + 1, max_attempts, e, delay
                     )
                     time.sleep(delay)
                 else:
                     # Last attempt or non-retryable error
                     logger.error(
-                        f"Request failed on attempt {attempt + 1}/{max_attempts}: {str(e)}"
+                        "Request failed on attempt %d/%d: %s", attempt + 1, max_attempts, e
                     )
                     raise
 
@@ -407,6 +557,29 @@ class OutpostAPIClient:
             raise last_exception
         raise RuntimeError("Request failed with unknown error")
 
+    @property
+    def is_circuit_open(self) -> bool:
+        """
+        Check if requests to this outpost are currently being skipped.
+
+        Educational Note:
+        A circuit breaker stops calling a server that keeps failing. While
+        the circuit is open, requests return None immediately instead of
+        waiting out timeouts and retries against an outpost that is down.
+        """
+        return time.monotonic() < self._circuit_open_until
+
+    def _record_failure(self):
+        """Count an unreachable-outpost failure and open the circuit at the threshold."""
+        self._failure_count += 1
+        if self._failure_count >= self.circuit_failure_threshold:
+            self._circuit_open_until = time.monotonic() + self.circuit_cooldown
+            self._failure_count = 0
+            logger.warning(
+                "Circuit opened for %s: skipping requests for %.0fs",
+                self.base_url, self.circuit_cooldown
+            )
+
     def _make_request(
         self,
         method: str,
@@ -414,6 +587,8 @@ class OutpostAPIClient:
         params: Optional[Dict] = None,
         json_data: Optional[Dict] = None,
         files: Optional[Dict] = None,
+        data: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
         retry_enabled: bool = True
     ) -> Optional[Any]:
         """
@@ -434,12 +609,28 @@ class OutpostAPIClient:
             params: Query parameters
             json_data: JSON body data
             files: Files for upload
+            data: Raw request body (e.g. a streaming MultipartEncoder)
+            headers: Extra headers for this request only
             retry_enabled: Whether to enable retries (default: True)
 
         Returns:
             Response data or None if failed
         """
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        cache_key = None
+        if method == 'GET' and self.cache_ttl > 0 and endpoint in CACHEABLE_ENDPOINTS:
+            cache_key = (endpoint, tuple(sorted(params.items())) if params else None)
+            cached = self._cache.get(cache_key)
+            if cached and cached[0] > time.monotonic():
+                return orjson.loads(cached[1])
+        elif method != 'GET':
+            # Writes can change anything the cached GETs report
+            self._cache.clear()
+
+        url = self._urls.get(endpoint) or f"{self.base_url}/{endpoint.lstrip('/')}"
+
+        if self.is_circuit_open:
+            logger.warning("Skipping request, outpost marked unreachable: %s", url)
+            return None
 
         try:
             response = self._make_request_with_retry(
@@ -448,25 +639,35 @@ class OutpostAPIClient:
                 params=params,
                 json_data=json_data,
                 files=files,
+                data=data,
+                headers=headers,
                 retry_enabled=retry_enabled
             )
+            self._failure_count = 0
 
-            # Return JSON if content type is JSON
+            # Return JSON if content type is JSON. The outposts always send
+            # UTF-8, so parse the raw bytes with orjson and skip requests'
+            # charset detection and the bytes -> str decode of response.json()
             if 'application/json' in response.headers.get('Content-Type', ''):
-                return response.json()
+                content = response.content
+                if cache_key is not None:
+                    self._cache[cache_key] = (time.monotonic() + self.cache_ttl, content)
+                return orjson.loads(content)
             else:
                 return response
 
         except requests.exceptions.Timeout:
-            logger.error(f"Request timed out after {self.max_retries} retries: {url}")
+            logger.error("Request timed out after %d retries: %s", self.max_retries, url)
+            self._record_failure()
             return None
         except requests.exceptions.ConnectionError as e:
-            logger.error(f"Connection failed after {self.max_retries} retries: {url}")
-            logger.error(f"  Hint: Check if the API server is running at {self.base_url}")
+            self._record_failure()
+            logger.error("Connection failed after %d retries: %s", self.max_retries, url)
+            logger.error("  Hint: Check if the API server is running at %s", self.base_url)
             return None
         except requests.exceptions.HTTPError as e:
             status_code = e.response.status_code if e.response else "unknown"
-            logger.error(f"HTTP {status_code} error: {url}")
+            logger.error("HTTP %s error: %s", status_code, url)
 
             # Provide helpful error messages based on status code
             if status_code == 401:
@@ -482,11 +683,55 @@ class OutpostAPIClient:
 
             return None
         except Exception as e:
-            logger.error(f"Unexpected error: {url}")
-            logger.error(f"  Error type: {type(e).__name__}")
-            logger.error(f"  Error message: {str(e)}")
+            logger.error("Unexpected error: %s", url)
+            logger.error("  Error type: %s", type(e).__name__)
+            logger.error("  Error message: %s", e)
             return None
 
+    def invalidate_cache(self):
+        """
+        Drop all cached read-only responses.
+
+        Educational Note:
+        Call this when you know the outpost changed (e.g. after an SSH
+        command) and the next status call must hit the network.
+        """
+        self._cache.clear()
+
+    def batch_get(
+        self,
+        endpoints: List[str],
+        params: Optional[Dict[str, Dict]] = None
+    ) -> Dict[str, Optional[Any]]:
+        """
+        GET several endpoints concurrently.
+
+        Educational Note:
+        Independent reads don't need to wait for each other. Each request
+        runs on its own thread over this client's Session, so the total wait
+        is the slowest response instead of the sum of all of them. The
+        Session's connection pool (pool_maxsize) still caps how many
+        connections are open to the outpost at once.
+
+        Args:
+            endpoints: API endpoint paths to fetch
+            params: Optional query parameters, keyed by endpoint path
+
+        Returns:
+            Dict mapping each endpoint to its response data (None if that
+            request failed)
+        """
+        if not endpoints:
+            return {}
+
+        params = params or {}
+        with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+            results = executor.map(
+                lambda endpoint: self._make_request('GET', endpoint, params=params.get(endpoint)),
+                endpoints
+            )
+            return dict(zip(endpoints, results))
+
     # Health and Status
     def health_check(self) -> Optional[Dict[str, Any]]:
         """Check API health."""
@@ -506,6 +751,38 @@ class OutpostAPIClient:
         """Get specific inventory item."""
         return self._make_request('GET', f'/inventory/{item_id}')
 
+    def get_inventory_items(self, item_ids: List[int]) -> Optional[List[Dict]]:
+        """
+        Get several inventory items in a single request.
+
+        Educational Note:
+        Calling get_inventory_item() in a loop costs one network round trip
+        per item. The ids filter on /inventory returns them all at once
+        (in batches of INVENTORY_IDS_PER_REQUEST, the most IDs the server
+        accepts per request). Results are filtered again client-side so an
+        outpost that ignores the ids parameter can't return unrelated items.
+
+        Args:
+            item_ids: IDs of the items to fetch
+
+        Returns:
+            List of matching inventory items or None if the request failed
+        """
+        if not item_ids:
+            return []
+
+        items: List[Dict] = []
+        for start in range(0, len(item_ids), INVENTORY_IDS_PER_REQUEST):
+            batch = item_ids[start:start + INVENTORY_IDS_PER_REQUEST]
+            params = {'ids': ','.join(str(item_id) for item_id in batch), 'limit': len(batch)}
+            page = self._make_request('GET', '/inventory', params=params)
+            if page is None:
+                return None
+            items.extend(page)
+
+        wanted = set(item_ids)
+        return [item for item in items if item.get('item_id') in wanted]
+
     def create_inventory_item(self, item_data: Dict) -> Optional[Dict]:
         """Create new inventory item."""
         return self._make_request('POST', '/inventory', json_data=item_data)
@@ -529,32 +806,127 @@ class OutpostAPIClient:
         """Get catch summary statistics."""
         return self._make_request('GET', '/catches/summary')
 
+    # Trading Fort Operations
+    def get_goods(
+        self,
+        category: Optional[str] = None,
+        quality: Optional[str] = None
+    ) -> Optional[List[Dict]]:
+        """Get trade goods, optionally filtered by category and quality."""
+        params = {}
+        if category:
+            params['category'] = category
+        if quality:
+            params['quality'] = quality
+        return self._make_request('GET', '/goods', params=params or None)
+
+    def get_traders(self, trader_type: Optional[str] = None) -> Optional[List[Dict]]:
+        """Get registered traders."""
+        params = {'trader_type': trader_type} if trader_type else None
+        return self._make_request('GET', '/traders', params=params)
+
+    def get_trades(self, trade_type: Optional[str] = None) -> Optional[List[Dict]]:
+        """Get trade records."""
+        params = {'trade_type': trade_type} if trade_type else None
+        return self._make_request('GET', '/trades', params=params)
+
+    def get_trade_summary(self) -> Optional[Dict]:
+        """Get trade summary statistics grouped by trade type."""
+        return self._make_request('GET', '/trades/summary')
+
+    # Hunting Fort Operations
+    def get_animals(
+        self,
+        category: Optional[str] = None,
+        status: Optional[str] = None
+    ) -> Optional[List[Dict]]:
+        """Get game animals, optionally filtered by category and population status."""
+        params = {}
+        if category:
+            params['category'] = category
+        if status:
+            params['status'] = status
+        return self._make_request('GET', '/animals', params=params or None)
+
+    def get_hunting_parties(self, status: Optional[str] = None) -> Optional[List[Dict]]:
+        """Get hunting parties."""
+        params = {'status': status} if status else None
+        return self._make_request('GET', '/parties', params=params)
+
+    def get_harvests(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> Optional[List[Dict]]:
+        """Get pelt harvest records, newest first: at most limit, skipping offset."""
+        params = {}
+        if limit:
+            params['limit'] = limit
+        if offset:
+            params['offset'] = offset
+        return self._make_request('GET', '/harvests', params=params or None)
+
     # File Operations
     def list_files(self) -> Optional[Dict]:
         """List uploaded files."""
         return self._make_request('GET', '/files/list')
 
     def upload_file(self, file_path: str) -> Optional[Dict]:
-        """Upload a file to the outpost."""
+        """
+        Upload a file to the outpost.
+
+        Educational Note:
+        MultipartEncoder streams the file over the socket in chunks rather
+        than reading it into memory to build the multipart body. A streamed
+        body can only be sent once, so retries are disabled for uploads.
+        """
         path = Path(file_path)
         if not path.exists():
-            logger.error(f"File not found: {file_path}")
+            logger.error("File not found: %s", file_path)
             return None
 
         with open(path, 'rb') as f:
-            files = {'file': (path.name, f)}
-            return self._make_request('POST', '/files/upload', files=files)
+            encoder = MultipartEncoder(
+                fields={'file': (path.name, f, 'application/octet-stream')}
+            )
+            return self._make_request(
+                'POST',
+                '/files/upload',
+                data=encoder,
+                headers={'Content-Type': encoder.content_type},
+                retry_enabled=False
+            )
 
     def download_file(self, filename: str, destination: str) -> bool:
-        """Download a file from the outpost."""
-        response = self._make_request('GET', f'/files/download/{filename}')
+        """
+        Download a file from the outpost.
 
-        if response and hasattr(response, 'content'):
-            with open(destination, 'wb') as f:
-                f.write(response.content)
+        Educational Note:
+        The response body is streamed straight to disk in fixed-size chunks
+        instead of being loaded into memory first, so peak memory stays at
+        DOWNLOAD_CHUNK_SIZE no matter how large the file is.
+        """
+        url = f"{self.base_url}/files/download/{filename}"
+
+        try:
+            with self.session.get(
+                url,
+                stream=True,
+                timeout=self.timeout,
+                headers=self._request_headers({'Accept-Encoding': 'identity'})
+            ) as response:
+                response.raise_for_status()
+                with open(destination, 'wb') as f:
+                    for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
             return True
 
-        return False
+        except requests.exceptions.RequestException as e:
+            logger.error("Download failed: %s - %s", url, e)
+            return False
+        except OSError as e:
+            logger.error("Could not write download to %s: %s", destination, e)
+            return False
 
     def delete_file(self, filename: str) -> bool:
         """Delete a file from the outpost."""
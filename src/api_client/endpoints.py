@@ -10,9 +10,55 @@ operations from simple client methods.
 """
 
 from typing import List, Dict, Any, Optional
+import requests
+from requests.adapters import HTTPAdapter
 from .client import OutpostAPIClient
 
 
+def make_outpost_clients(
+    base_urls: List[str],
+    shared_session: bool = True,
+    pool_maxsize: int = 4,
+    **client_kwargs
+) -> List[OutpostAPIClient]:
+    """
+    Create one API client per outpost, optionally sharing a single Session.
+
+    Args:
+        base_urls: Base URLs of the outposts
+        shared_session: Give every client the same Session (default: True)
+        pool_maxsize: Maximum open connections per outpost
+        **client_kwargs: Extra arguments passed to each OutpostAPIClient
+
+    Returns:
+        List of clients in the same order as base_urls
+
+    Educational Note:
+    Every Session owns its own connection pools. Sharing one Session means
+    a single adapter keeps a pool per host, so N outposts cost one set of
+    pools and sockets instead of N. Each client still sends its own auth
+    token, because tokens are added per request rather than to the shared
+    session headers.
+    """
+    if not shared_session:
+        return [
+            OutpostAPIClient(url, pool_maxsize=pool_maxsize, **client_kwargs)
+            for url in base_urls
+        ]
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=max(len(base_urls), 1),
+        pool_maxsize=pool_maxsize,
+        pool_block=True
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers['Accept-Encoding'] = 'gzip'
+
+    return [OutpostAPIClient(url, session=session, **client_kwargs) for url in base_urls]
+
+
 def get_all_inventory_across_outposts(clients: List[OutpostAPIClient]) -> Dict[str, List]:
     """
     Fetch inventory from multiple outposts.
@@ -25,11 +71,14 @@ def get_all_inventory_across_outposts(clients: List[OutpostAPIClient]) -> Dict[s
 
     Educational Note:
     This demonstrates a multi-endpoint workflow - fetching data
-    from multiple distributed nodes.
+    from multiple distributed nodes. Outposts whose circuit breaker is
+    open are skipped so one dead node doesn't stall the whole fan-out.
     """
     results = {}
 
     for i, client in enumerate(clients):
+        if client.is_circuit_open:
+            continue
         inventory = client.get_inventory()
         if inventory:
             results[f"outpost_{i}"] = inventory
@@ -50,6 +99,8 @@ def get_combined_status(clients: List[OutpostAPIClient]) -> List[Dict]:
     statuses = []
 
     for client in clients:
+        if client.is_circuit_open:
+            continue
         status = client.get_status()
         if status:
             status['api_url'] = client.base_url
@@ -72,6 +123,8 @@ def aggregate_catch_summaries(clients: List[OutpostAPIClient]) -> Dict[str, Any]
     total_catches = 0
 
     for client in clients:
+        if client.is_circuit_open:
+            continue
         summary = client.get_catch_summary()
         if summary:
             all_summaries.append(summary)
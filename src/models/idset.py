@@ -0,0 +1,137 @@
+"""
+Compact sets of string IDs backed by an integer bitmask.
+
+Task and achievement IDs come from a small, fixed vocabulary shared by every
+learner. Instead of each profile holding its own Python set of strings, the
+IDs are interned once into a shared vocabulary (ID -> bit position) and each
+set stores a single int.
+
+Educational Note:
+A Python set of strings costs a hash table per instance (~200+ bytes even
+when nearly empty). With a shared vocabulary, membership is a dict lookup
+plus a bit test, adding an ID is a bitwise OR, and len() is int.bit_count().
+The ID strings are only materialized when the set is iterated, e.g. when a
+profile is serialized.
+"""
+
+import threading
+from collections.abc import MutableSet
+from typing import Dict, Iterable, Iterator, Optional
+
+
+class IdVocabulary:
+    """
+    Shared, append-only mapping of ID strings to bit positions.
+
+    Vocabularies are registered by name so that pickled sets reattach to the
+    same vocabulary (bit positions are only meaningful within a process).
+    """
+
+    __slots__ = ('name', '_index', '_ids', '_lock')
+
+    _registry: Dict[str, 'IdVocabulary'] = {}
+    _registry_lock = threading.Lock()
+
+    def __new__(cls, name: str):
+        with cls._registry_lock:
+            vocabulary = cls._registry.get(name)
+            if vocabulary is None:
+                vocabulary = super().__new__(cls)
+                vocabulary.name = name
+                vocabulary._index = {}
+                vocabulary._ids = []
+                vocabulary._lock = threading.Lock()
+                cls._registry[name] = vocabulary
+            return vocabulary
+
+    def __reduce__(self):
+        return (IdVocabulary, (self.name,))
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def lookup(self, id_: str) -> Optional[int]:
+        """Return the bit position for an ID, or None if it was never interned."""
+        return self._index.get(id_)
+
+    def intern(self, id_: str) -> int:
+        """Return the bit position for an ID, assigning the next free one if new."""
+        bit = self._index.get(id_)
+        if bit is None:
+            with self._lock:
+                bit = self._index.get(id_)
+                if bit is None:
+                    bit = len(self._ids)
+                    self._ids.append(id_)
+                    self._index[id_] = bit
+        return bit
+
+    def id_at(self, bit: int) -> str:
+        """Return the ID interned at a bit position."""
+        return self._ids[bit]
+
+
+class InternedIdSet(MutableSet):
+    """
+    Mutable set of string IDs stored as a bitmask over an IdVocabulary.
+
+    Supports the usual set operations (add, discard, in, len, iteration,
+    comparison with other sets). Iteration yields IDs in the order they were
+    first interned.
+
+    Example:
+        >>> tasks = InternedIdSet(IdVocabulary('tasks'))
+        >>> tasks.add('ch1_connect')
+        >>> 'ch1_connect' in tasks
+        True
+    """
+
+    __slots__ = ('_vocabulary', '_bits')
+
+    def __init__(self, vocabulary: IdVocabulary, ids: Iterable[str] = ()):
+        self._vocabulary = vocabulary
+        self._bits = 0
+        for id_ in ids:
+            self.add(id_)
+
+    def __contains__(self, id_: object) -> bool:
+        bit = self._vocabulary.lookup(id_) if isinstance(id_, str) else None
+        return bit is not None and (self._bits >> bit) & 1 == 1
+
+    def __iter__(self) -> Iterator[str]:
+        bits = self._bits
+        while bits:
+            lowest = bits & -bits
+            yield self._vocabulary.id_at(lowest.bit_length() - 1)
+            bits ^= lowest
+
+    def __len__(self) -> int:
+        return self._bits.bit_count()
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, InternedIdSet) and other._vocabulary is self._vocabulary:
+            return self._bits == other._bits
+        return super().__eq__(other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._vocabulary.name!r}, {list(self)!r})"
+
+    def _from_iterable(self, ids: Iterable[str]) -> 'InternedIdSet':
+        # Used by the Set mixins (|, &, -, ^) to build their results
+        return type(self)(self._vocabulary, ids)
+
+    def __reduce__(self):
+        # Pickle the IDs, not the bits: bit positions differ between processes
+        return (type(self), (self._vocabulary, list(self)))
+
+    def add(self, id_: str) -> None:
+        """Add an ID to the set."""
+        self._bits |= 1 << self._vocabulary.intern(id_)
+
+    def discard(self, id_: str) -> None:
+        """Remove an ID from the set if present."""
+        bit = self._vocabulary.lookup(id_)
+        if bit is not None:
+            self._bits &= ~(1 << bit)
@@ -6,11 +6,15 @@ distributed learning system. Each outpost represents a thematic frontier fort
 with unique APIs and data.
 """
 
+import time
 from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import datetime
 from typing import Optional, Dict, Any
 from enum import Enum
 
+from src.models.serialization import EpochSeconds, fast_todict
+
 
 class OutpostType(Enum):
     """Thematic types for different outpost forts."""
@@ -20,6 +24,12 @@ class OutpostType(Enum):
     EXPLORATION = "exploration"
 
 
+@lru_cache(maxsize=64)
+def _normalize_endpoint(endpoint: str) -> str:
+    """Ensure an endpoint path starts with '/' (cached: paths are a small fixed set)."""
+    return endpoint if endpoint.startswith('/') else '/' + endpoint
+
+
 class OutpostStatus(Enum):
     """Current operational status of an outpost."""
     ONLINE = "online"
@@ -28,7 +38,12 @@ class OutpostStatus(Enum):
     MAINTENANCE = "maintenance"
 
 
-@dataclass
+@fast_todict(rename={
+    'outpost_type': 'type',
+    '_api_base_url': 'api_base_url',
+    'last_seen_ts': 'last_seen',
+})
+@dataclass(slots=True)
 class Outpost:
     """
     Represents a single Raspberry Pi outpost in the frontier network.
@@ -40,8 +55,10 @@ class Outpost:
         port: Port number for the FastAPI server (default: 8000)
         ssh_port: SSH port for remote access (default: 22)
         status: Current operational status
-        api_base_url: Computed base URL for API endpoints
-        last_seen: Timestamp of last successful connection
+        api_base_url: Base URL for API endpoints, computed once from ip_address
+            and port (call _refresh_url() if either is changed)
+        last_seen_ts: Epoch seconds of last successful connection (0.0 if
+            never seen); the last_seen property gives it as a datetime
         metadata: Additional thematic or custom data about the outpost
     """
 
@@ -51,29 +68,52 @@ class Outpost:
     port: int = 8000
     ssh_port: int = 22
     status: OutpostStatus = OutpostStatus.OFFLINE
-    last_seen: Optional[datetime] = None
+    _api_base_url: str = field(default='', init=False, repr=False, compare=False)
+    last_seen_ts: EpochSeconds = 0.0
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self):
+        """Build the base URL once instead of formatting it on every access."""
+        self._refresh_url()
+
+    def _refresh_url(self) -> None:
+        """Recompute the cached base URL after ip_address or port changes."""
+        self._api_base_url = f"http://{self.ip_address}:{self.port}"
+
     @property
     def api_base_url(self) -> str:
-        """Construct the base URL for API endpoints."""
-        return f"http://{self.ip_address}:{self.port}"
+        """Base URL for API endpoints."""
+        return self._api_base_url
+
+    @property
+    def last_seen(self) -> Optional[datetime]:
+        """Timestamp of last successful connection, or None if never seen."""
+        return datetime.fromtimestamp(self.last_seen_ts) if self.last_seen_ts else None
+
+    @last_seen.setter
+    def last_seen(self, value: Optional[datetime]) -> None:
+        self.last_seen_ts = value.timestamp() if value else 0.0
 
     @property
     def is_online(self) -> bool:
         """Check if the outpost is currently online."""
-        return self.status == OutpostStatus.ONLINE
+        return self.status is OutpostStatus.ONLINE
 
     def update_status(self, status: OutpostStatus) -> None:
         """
         Update the outpost status and timestamp.
 
+        Educational Note:
+        Status polls call this for every outpost on every refresh. Storing
+        time.time() as a float avoids building a datetime object each time;
+        one is only created when last_seen is actually read or serialized.
+
         Args:
             status: New status to set
         """
         self.status = status
-        if status == OutpostStatus.ONLINE:
-            self.last_seen = datetime.now()
+        if status is OutpostStatus.ONLINE:
+            self.last_seen_ts = time.time()
 
     def get_endpoint_url(self, endpoint: str) -> str:
         """
@@ -85,27 +125,11 @@ class Outpost:
         Returns:
             Full URL including base URL and endpoint
         """
-        # Ensure endpoint starts with /
-        if not endpoint.startswith('/'):
-            endpoint = f'/{endpoint}'
-        return f"{self.api_base_url}{endpoint}"
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert outpost to dictionary representation."""
-        return {
-            'name': self.name,
-            'type': self.outpost_type.value,
-            'ip_address': self.ip_address,
-            'port': self.port,
-            'ssh_port': self.ssh_port,
-            'status': self.status.value,
-            'api_base_url': self.api_base_url,
-            'last_seen': self.last_seen.isoformat() if self.last_seen else None,
-            'metadata': self.metadata
-        }
-
-
-@dataclass
+        return self._api_base_url + _normalize_endpoint(endpoint)
+
+
+@fast_todict
+@dataclass(slots=True)
 class OutpostInventoryItem:
     """
     Represents an inventory item stored at an outpost.
@@ -120,14 +144,3 @@ class OutpostInventoryItem:
     quantity: int
     description: str = ""
     value: float = 0.0
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert inventory item to dictionary."""
-        return {
-            'item_id': self.item_id,
-            'name': self.name,
-            'category': self.category,
-            'quantity': self.quantity,
-            'description': self.description,
-            'value': self.value
-        }
@@ -0,0 +1,154 @@
+"""
+Generated serializers for the model dataclasses.
+
+This module builds a specialized to_dict() method for a dataclass once, when
+the class is defined, instead of hand-writing (or introspecting) the
+conversion on every call.
+
+Educational Note:
+Generic helpers like dataclasses.asdict() walk fields() and recurse on every
+call. Since a dataclass's fields never change after definition, we can write
+the equivalent straight-line function as source code once, compile it, and
+attach it to the class. Each call then runs a single dict literal with no
+loops or introspection.
+
+The generated dicts contain only native JSON types, so to_json_bytes()
+can hand them straight to orjson.
+"""
+
+from collections.abc import Set as AbstractSet
+from dataclasses import fields, is_dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, NewType, Optional, Union, get_args, get_origin
+
+import orjson
+
+
+# Annotation for timestamps stored as time.time() floats. to_dict() renders
+# them as ISO strings, with 0.0 meaning "never" (None).
+EpochSeconds = NewType('EpochSeconds', float)
+
+
+def _field_expression(name: str, field_type: Any, enum_maps: Dict[str, Dict]) -> str:
+    """
+    Build the source expression that converts one field to a plain value.
+
+    Args:
+        name: Field name on the instance
+        field_type: The field's annotated type
+        enum_maps: Collects {member: value} lookup tables the expression uses
+
+    Returns:
+        Python source for the converted value
+    """
+    attr = f"self.{name}"
+    origin = get_origin(field_type)
+
+    # Optional[X] -> convert X, keeping None as None
+    if origin is Union:
+        args = [arg for arg in get_args(field_type) if arg is not type(None)]
+        if len(args) == 1:
+            inner = _field_expression(name, args[0], enum_maps)
+            if inner != attr:
+                return f"({inner} if {attr} is not None else None)"
+        return attr
+
+    if isinstance(field_type, type) and issubclass(field_type, Enum):
+        # Look values up in a prebuilt {member: value} dict rather than going
+        # through the Enum .value descriptor on every call
+        map_name = f"_{name}_values"
+        enum_maps[map_name] = {member: member.value for member in field_type}
+        return f"{map_name}[{attr}]"
+    if field_type is datetime:
+        return f"_iso({attr})"
+    if field_type is EpochSeconds:
+        return f"(_iso(_fromts({attr})) if {attr} else None)"
+    if origin in (set, frozenset) or (
+        isinstance(field_type, type) and issubclass(field_type, AbstractSet)
+    ):
+        return f"list({attr})"
+    if origin is dict:
+        value_type = get_args(field_type)[1] if get_args(field_type) else None
+        if is_dataclass(value_type) and hasattr(value_type, 'to_dict'):
+            return f"{{k: v.to_dict() for k, v in {attr}.items()}}"
+    return attr
+
+
+def _to_json_bytes(self) -> bytes:
+    """Serialize to JSON bytes with orjson (int dict keys become strings)."""
+    return orjson.dumps(self.to_dict(), option=orjson.OPT_NON_STR_KEYS)
+
+
+def fast_todict(
+    cls=None,
+    *,
+    rename: Optional[Dict[str, str]] = None,
+    computed: Optional[Dict[str, str]] = None
+):
+    """
+    Class decorator that generates a to_dict() method for a dataclass.
+
+    A to_json_bytes() method is added as well, for callers that only need
+    the encoded JSON (e.g. API responses or caching).
+
+    Fields are emitted in declaration order. Enums become their values,
+    datetimes and EpochSeconds become ISO strings, sets become lists and dicts of nested
+    dataclasses are converted with their own to_dict(). Fields whose
+    names start with an underscore are treated as internal and skipped.
+
+    Args:
+        rename: Map of field name -> output key (e.g. {'outpost_type': 'type'})
+        computed: Output keys mapped to a source expression using `self`
+            (e.g. {'total': 'self.total()'}). A key matching a field's output
+            key replaces that field's conversion in place; other keys are
+            appended after the fields.
+
+    Example:
+        @fast_todict(rename={'outpost_type': 'type'})
+        @dataclass
+        class Outpost:
+            ...
+    """
+    rename = rename or {}
+    computed = computed or {}
+
+    def wrap(cls):
+        entries = []
+        enum_maps: Dict[str, Dict] = {}
+        extra = dict(computed)
+        for f in fields(cls):
+            if f.name.startswith('_') and f.name not in rename:
+                continue
+            key = rename.get(f.name, f.name)
+            if key in extra:
+                expression = extra.pop(key)
+            else:
+                expression = _field_expression(f.name, f.type, enum_maps)
+            entries.append(f"{key!r}: {expression}")
+        for key, expression in extra.items():
+            entries.append(f"{key!r}: {expression}")
+
+        # Lookup tables are bound as default arguments so the generated
+        # function reads them as fast locals instead of globals
+        defaults = ''.join(f", {map_name}={map_name}" for map_name in enum_maps)
+        source = (
+            f"def to_dict(self, _iso=_iso, _fromts=_fromts{defaults}):\n"
+            f"    return {{{', '.join(entries)}}}\n"
+        )
+        namespace: Dict[str, Any] = {
+            '_iso': datetime.isoformat,
+            '_fromts': datetime.fromtimestamp,
+            **enum_maps,
+        }
+        exec(compile(source, f"<to_dict {cls.__qualname__}>", 'exec'), namespace)
+
+        to_dict = namespace['to_dict']
+        to_dict.__qualname__ = f"{cls.__qualname__}.to_dict"
+        to_dict.__doc__ = f"Convert {cls.__name__} to dictionary representation."
+        cls.to_dict = to_dict
+        cls.to_json_bytes = _to_json_bytes
+        cls._to_dict_enum_values = enum_maps
+        return cls
+
+    return wrap if cls is None else wrap(cls)
@@ -5,11 +5,15 @@ This module defines structures to track user progress, achievements, and
 learning state throughout the 10-chapter journey.
 """
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Set, Optional
+from typing import Callable, Dict, List, Optional
 from enum import Enum
 
+from src.models.idset import IdVocabulary, InternedIdSet
+from src.models.serialization import EpochSeconds, fast_todict
+
 
 class ChapterStatus(Enum):
     """Status of a chapter in the learning journey."""
@@ -19,7 +23,18 @@ class ChapterStatus(Enum):
     LOCKED = "locked"
 
 
-@dataclass
+# Task and achievement IDs are interned once and shared by every profile;
+# each profile stores its completed IDs as a bitmask over these
+_TASK_IDS = IdVocabulary('tasks')
+_ACHIEVEMENT_IDS = IdVocabulary('achievements')
+
+
+# Statuses of a chapter the user can currently work on
+_ACTIVE_CHAPTER_STATES = frozenset((ChapterStatus.NOT_STARTED, ChapterStatus.IN_PROGRESS))
+
+
+@fast_todict
+@dataclass(slots=True)
 class ChapterProgress:
     """
     Tracks progress for a single chapter.
@@ -31,18 +46,29 @@ class ChapterProgress:
         completed_at: When the user completed all chapter requirements
         tasks_completed: Set of completed task IDs within the chapter
         notes: User's personal notes about the chapter
+
+    Every change to status, including direct assignment, is reported to
+    the owning UserProfile so its cached progress stays in sync.
     """
 
     chapter_number: int
     status: ChapterStatus = ChapterStatus.NOT_STARTED
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
-    tasks_completed: Set[str] = field(default_factory=set)
+    tasks_completed: InternedIdSet = field(default_factory=lambda: InternedIdSet(_TASK_IDS))
     notes: str = ""
+    _on_status_change: Optional[Callable[['ChapterProgress', ChapterStatus], None]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        """Accept a plain set of task IDs for tasks_completed."""
+        if not isinstance(self.tasks_completed, InternedIdSet):
+            self.tasks_completed = InternedIdSet(_TASK_IDS, self.tasks_completed)
 
     def start_chapter(self) -> None:
         """Mark the chapter as started."""
-        if self.status == ChapterStatus.NOT_STARTED:
+        if self.status is ChapterStatus.NOT_STARTED:
             self.status = ChapterStatus.IN_PROGRESS
             self.started_at = datetime.now()
 
@@ -54,8 +80,10 @@ class ChapterProgress:
             task_id: Unique identifier for the task
         """
         self.tasks_completed.add(task_id)
-        if self.status == ChapterStatus.NOT_STARTED:
-            self.start_chapter()
+        if self.status is ChapterStatus.NOT_STARTED:
+            # Same transition as start_chapter(), inlined for this hot path
+            self.status = ChapterStatus.IN_PROGRESS
+            self.started_at = datetime.now()
 
     def complete_chapter(self) -> None:
         """Mark the entire chapter as completed."""
@@ -76,19 +104,40 @@ class ChapterProgress:
             return 0.0
         return (len(self.tasks_completed) / total_tasks) * 100
 
-    def to_dict(self) -> Dict:
-        """Convert to dictionary representation."""
-        return {
-            'chapter_number': self.chapter_number,
-            'status': self.status.value,
-            'started_at': self.started_at.isoformat() if self.started_at else None,
-            'completed_at': self.completed_at.isoformat() if self.completed_at else None,
-            'tasks_completed': list(self.tasks_completed),
-            'notes': self.notes
-        }
 
+# Replace the status slot with a property over it, so that any assignment
+# (not just the methods above) notifies the owning profile. Reads go straight
+# to the slot descriptor.
+_status_slot = ChapterProgress.status
 
-@dataclass
+
+def _assign_status(chapter: ChapterProgress, status: ChapterStatus) -> None:
+    """Store a chapter's status and notify its profile with the old one."""
+    try:
+        old_status = _status_slot.__get__(chapter)
+    except AttributeError:
+        # First assignment, from __init__; no profile is attached yet
+        _status_slot.__set__(chapter, status)
+        return
+    _status_slot.__set__(chapter, status)
+    if old_status is not status and chapter._on_status_change is not None:
+        chapter._on_status_change(chapter, old_status)
+
+
+ChapterProgress.status = property(
+    _status_slot.__get__, _assign_status, doc="Current completion status."
+)
+
+
+@fast_todict(
+    rename={'created_at_ts': 'created_at', 'last_active_ts': 'last_active'},
+    computed={
+        # Keep the {chapter_number: progress} wire format of the old dict field
+        'chapters': '{ch.chapter_number: ch.to_dict() for ch in self.chapters}',
+        'overall_progress': 'self.get_overall_progress()',
+    },
+)
+@dataclass(slots=True)
 class UserProfile:
     """
     Comprehensive user profile tracking progress through the entire adventure.
@@ -97,9 +146,10 @@ class UserProfile:
         username: Unique username for the learner
         display_name: Friendly display name
         email: Optional contact email
-        created_at: When the profile was created
-        last_active: Last time the user was active
-        chapters: Progress tracking for each chapter
+        created_at_ts: When the profile was created (epoch seconds)
+        last_active_ts: Last time the user was active (epoch seconds)
+        chapters: Progress tracking for each chapter, indexed by
+            chapter_number - 1 (use get_chapter() for 1-based access)
         achievements: Set of earned achievement IDs
         preferences: User preferences for UI and experience
     """
@@ -107,25 +157,69 @@ class UserProfile:
     username: str
     display_name: str
     email: Optional[str] = None
-    created_at: datetime = field(default_factory=datetime.now)
-    last_active: datetime = field(default_factory=datetime.now)
-    chapters: Dict[int, ChapterProgress] = field(default_factory=dict)
-    achievements: Set[str] = field(default_factory=set)
+    created_at_ts: EpochSeconds = field(default_factory=time.time)
+    last_active_ts: EpochSeconds = field(default_factory=time.time)
+    chapters: List[ChapterProgress] = field(default_factory=list)
+    achievements: InternedIdSet = field(default_factory=lambda: InternedIdSet(_ACHIEVEMENT_IDS))
     preferences: Dict[str, any] = field(default_factory=dict)
+    # Cached answer for get_current_chapter(), recomputed only after a
+    # chapter's status changes
+    _current_chapter: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    _current_chapter_stale: bool = field(default=True, init=False, repr=False, compare=False)
+    # Number of chapters in COMPLETED status, kept in step with status changes
+    _completed_count: int = field(default=0, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Initialize chapter progress if not provided."""
+        if not isinstance(self.achievements, InternedIdSet):
+            self.achievements = InternedIdSet(_ACHIEVEMENT_IDS, self.achievements)
+
         if not self.chapters:
             # Initialize all 10 chapters
-            for i in range(1, 11):
-                self.chapters[i] = ChapterProgress(
+            self.chapters = [
+                ChapterProgress(
                     chapter_number=i,
                     status=ChapterStatus.LOCKED if i > 1 else ChapterStatus.NOT_STARTED
                 )
+                for i in range(1, 11)
+            ]
+
+        for chapter in self.chapters:
+            chapter._on_status_change = self._chapter_status_changed
+            if chapter.status is ChapterStatus.COMPLETED:
+                self._completed_count += 1
+
+    def _chapter_status_changed(self, chapter: ChapterProgress, old_status: ChapterStatus) -> None:
+        """Update cached progress when any chapter changes status."""
+        self._current_chapter_stale = True
+        was_completed = old_status is ChapterStatus.COMPLETED
+        is_completed = chapter.status is ChapterStatus.COMPLETED
+        if is_completed and not was_completed:
+            self._completed_count += 1
+        elif was_completed and not is_completed:
+            self._completed_count -= 1
+
+    @property
+    def created_at(self) -> datetime:
+        """When the profile was created."""
+        return datetime.fromtimestamp(self.created_at_ts)
+
+    @created_at.setter
+    def created_at(self, value: datetime) -> None:
+        self.created_at_ts = value.timestamp()
+
+    @property
+    def last_active(self) -> datetime:
+        """Last time the user was active."""
+        return datetime.fromtimestamp(self.last_active_ts)
+
+    @last_active.setter
+    def last_active(self, value: datetime) -> None:
+        self.last_active_ts = value.timestamp()
 
     def update_activity(self) -> None:
         """Update the last active timestamp."""
-        self.last_active = datetime.now()
+        self.last_active_ts = time.time()
 
     def get_chapter(self, chapter_number: int) -> Optional[ChapterProgress]:
         """
@@ -137,7 +231,9 @@ class UserProfile:
         Returns:
             ChapterProgress object or None if invalid chapter
         """
-        return self.chapters.get(chapter_number)
+        if 1 <= chapter_number <= len(self.chapters):
+            return self.chapters[chapter_number - 1]
+        return None
 
     def unlock_chapter(self, chapter_number: int) -> bool:
         """
@@ -152,17 +248,17 @@ class UserProfile:
         if chapter_number < 1 or chapter_number > 10:
             return False
 
-        chapter = self.chapters.get(chapter_number)
+        chapter = self.get_chapter(chapter_number)
         if not chapter:
             return False
 
         # Check if previous chapter is completed
         if chapter_number > 1:
-            prev_chapter = self.chapters.get(chapter_number - 1)
-            if not prev_chapter or prev_chapter.status != ChapterStatus.COMPLETED:
+            prev_chapter = self.chapters[chapter_number - 2]
+            if prev_chapter.status is not ChapterStatus.COMPLETED:
                 return False
 
-        if chapter.status == ChapterStatus.LOCKED:
+        if chapter.status is ChapterStatus.LOCKED:
             chapter.status = ChapterStatus.NOT_STARTED
             return True
 
@@ -182,38 +278,32 @@ class UserProfile:
         """
         Calculate overall progress percentage across all chapters.
 
+        Uses a running count of completed chapters, so this is cheap enough
+        to call from every to_dict().
+
         Returns:
             Percentage of chapters completed (0-100)
         """
-        completed = sum(
-            1 for ch in self.chapters.values()
-            if ch.status == ChapterStatus.COMPLETED
-        )
-        return (completed / 10) * 100
+        return self._completed_count * 10.0
 
     def get_current_chapter(self) -> Optional[int]:
         """
         Get the current chapter the user should be working on.
 
+        The answer is cached and only recomputed after a chapter's status
+        changes, so repeated calls from the UI are a single attribute read.
+
         Returns:
             Chapter number or None if all completed
         """
-        for i in range(1, 11):
-            chapter = self.chapters.get(i)
-            if chapter and chapter.status in [ChapterStatus.NOT_STARTED, ChapterStatus.IN_PROGRESS]:
-                return i
+        if self._current_chapter_stale:
+            self._current_chapter = self._find_current_chapter()
+            self._current_chapter_stale = False
+        return self._current_chapter
+
+    def _find_current_chapter(self) -> Optional[int]:
+        """Scan chapters for the first one not yet completed or locked."""
+        for chapter in self.chapters:
+            if chapter.status in _ACTIVE_CHAPTER_STATES:
+                return chapter.chapter_number
         return None
-
-    def to_dict(self) -> Dict:
-        """Convert user profile to dictionary."""
-        return {
-            'username': self.username,
-            'display_name': self.display_name,
-            'email': self.email,
-            'created_at': self.created_at.isoformat(),
-            'last_active': self.last_active.isoformat(),
-            'chapters': {num: ch.to_dict() for num, ch in self.chapters.items()},
-            'achievements': list(self.achievements),
-            'preferences': self.preferences,
-            'overall_progress': self.get_overall_progress()
-        }
@@ -8,11 +8,17 @@ and file transfer capabilities using Paramiko.
 from src.ssh_module.executor import (
     SSHExecutor,
     SSHResult,
-    execute_remote_command
+    execute_remote_command,
+    fanout_execute,
+    close_all_connections,
+    provision_host_key
 )
 
 __all__ = [
     'SSHExecutor',
     'SSHResult',
     'execute_remote_command',
+    'fanout_execute',
+    'close_all_connections',
+    'provision_host_key',
 ]
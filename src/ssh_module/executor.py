@@ -10,34 +10,93 @@ SSH (Secure Shell) provides encrypted remote access to servers. Paramiko
 is a Python implementation of SSHv2 that allows programmatic SSH operations.
 """
 
+import atexit
+import hashlib
+import os
+import threading
 import paramiko
-from typing import Tuple, Optional, Dict, Any
-from dataclasses import dataclass
+from paramiko.hostkeys import HostKeyEntry
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Tuple, Optional, Dict, Any, List
+from dataclasses import dataclass, field
 import logging
+import re
+import select
+import shutil
+import socket
+import time
+import uuid
 from io import StringIO
 
 # Configure logging for SSH operations
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+# Channel flow-control tuning for file transfers. Paramiko's defaults
+# (2MB window, 32KB packets) stall a LAN link waiting for window updates.
+SFTP_WINDOW_SIZE = 2 ** 27
+SFTP_MAX_PACKET_SIZE = 2 ** 19
+
+# Buffer size used when copying a downloaded file to disk
+SFTP_COPY_CHUNK_SIZE = 1024 * 1024
+
+# Algorithms we never want to negotiate with the outposts. Classic
+# Diffie-Hellman key exchange (especially group-exchange, which costs an
+# extra round trip) is much slower than curve25519/ECDH, and the CBC/3DES
+# ciphers are both slow and legacy. Raspberry Pi OS ships an OpenSSH that
+# supports the remaining fast options.
+SSH_DISABLED_ALGORITHMS = {
+    'kex': [
+        'diffie-hellman-group1-sha1',
+        'diffie-hellman-group14-sha1',
+        'diffie-hellman-group14-sha256',
+        'diffie-hellman-group16-sha512',
+        'diffie-hellman-group-exchange-sha1',
+        'diffie-hellman-group-exchange-sha256',
+    ],
+    'ciphers': ['aes128-cbc', 'aes192-cbc', 'aes256-cbc', '3des-cbc'],
+    'keys': ['ssh-dss'],
+}
+
+
+@dataclass(slots=True)
 class SSHResult:
     """
     Container for SSH command execution results.
 
     Attributes:
         success: Whether the command executed successfully
-        stdout: Standard output from the command
-        stderr: Standard error output
+        stdout_bytes: Raw standard output from the command
+        stderr_bytes: Raw standard error output
         exit_code: Command exit code (0 typically means success)
         error_message: Human-readable error message if failed
+
+    Educational Note:
+    Output is kept as the raw bytes received and only decoded to text the
+    first time stdout/stderr is read. Callers that just check success or
+    exit_code (e.g. health pings) never pay for decoding large outputs.
     """
 
     success: bool
-    stdout: str
-    stderr: str
+    stdout_bytes: bytes
+    stderr_bytes: bytes
     exit_code: int
     error_message: Optional[str] = None
+    _stdout: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _stderr: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def stdout(self) -> str:
+        """Standard output decoded as UTF-8 (decoded once, on first access)."""
+        if self._stdout is None:
+            self._stdout = self.stdout_bytes.decode('utf-8', errors='replace')
+        return self._stdout
+
+    @property
+    def stderr(self) -> str:
+        """Standard error decoded as UTF-8 (decoded once, on first access)."""
+        if self._stderr is None:
+            self._stderr = self.stderr_bytes.decode('utf-8', errors='replace')
+        return self._stderr
 
     def __str__(self) -> str:
         """String representation of the result."""
@@ -87,6 +146,9 @@ class SSHExecutor:
         self.port = port
         self.timeout = timeout
         self.client: Optional[paramiko.SSHClient] = None
+        self._sftp: Optional[paramiko.SFTPClient] = None
+        self._shell: Optional[paramiko.Channel] = None
+        self._shell_marker = f"__END_{uuid.uuid4().hex}__"
 
     def connect(self) -> bool:
         """
@@ -96,26 +158,43 @@ class SSHExecutor:
             True if connection successful, False otherwise
 
         Educational Note:
-        AutoAddPolicy automatically adds unknown host keys. In production,
-        you'd want to verify host keys manually for security. We use it
-        here for educational simplicity.
+        Host keys come from ~/.ssh/known_hosts (parsed once and reused until
+        the file changes) and unknown hosts are rejected. This makes
+        verification a simple lookup and,
+        unlike AutoAddPolicy, never trusts (or writes) a key silently
+        mid-connect. Enroll a new outpost once with provision_host_key().
         """
         try:
             self.client = paramiko.SSHClient()
-            # Auto-add unknown hosts (not recommended for production)
-            self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+            # Same effect as load_system_host_keys(), without re-parsing
+            # known_hosts on every connect
+            self.client._system_host_keys = _system_host_keys()
+            self.client.set_missing_host_key_policy(paramiko.RejectPolicy())
+
+            connect_kwargs = {
+                'hostname': self.hostname,
+                'port': self.port,
+                'username': self.username,
+                'password': self.password,
+                'timeout': self.timeout,
+                'banner_timeout': self.timeout,
+                'allow_agent': False,  # Don't use SSH agent
+                'disabled_algorithms': SSH_DISABLED_ALGORITHMS,
+            }
+            if self.key_filename:
+                connect_kwargs['key_filename'] = self.key_filename
+            else:
+                # Password-only: don't probe ~/.ssh/id_* for keys to try
+                connect_kwargs['look_for_keys'] = False
 
             # Attempt connection
-            self.client.connect(
-                hostname=self.hostname,
-                port=self.port,
-                username=self.username,
-                password=self.password,
-                key_filename=self.key_filename,
-                timeout=self.timeout,
-                allow_agent=False,  # Don't use SSH agent
-                look_for_keys=True if self.key_filename else False
-            )
+            self.client.connect(**connect_kwargs)
+
+            # Channels opened from now on (including SFTP) use the larger
+            # window, so transfers aren't throttled by flow control
+            transport = self.client.get_transport()
+            transport.default_window_size = SFTP_WINDOW_SIZE
+            transport.default_max_packet_size = SFTP_MAX_PACKET_SIZE
 
             logger.info(f"Successfully connected to {self.hostname}")
             return True
@@ -138,11 +217,30 @@ class SSHExecutor:
         Always close connections when done to free resources and
         maintain security.
         """
+        if self._sftp:
+            self._sftp.close()
+            self._sftp = None
+        if self._shell:
+            self._shell.close()
+            self._shell = None
         if self.client:
             self.client.close()
             logger.info(f"Disconnected from {self.hostname}")
             self.client = None
 
+    def _get_sftp(self) -> paramiko.SFTPClient:
+        """
+        Return the SFTP session for this connection, opening it on first use.
+
+        Educational Note:
+        Opening an SFTP session takes several round trips over the encrypted
+        channel. Keeping one session open for the life of the connection
+        means transferring N files pays that cost once instead of N times.
+        """
+        if self._sftp is None:
+            self._sftp = self.client.open_sftp()
+        return self._sftp
+
     def execute_command(
         self,
         command: str,
@@ -165,8 +263,8 @@ class SSHExecutor:
         if not self.client:
             return SSHResult(
                 success=False,
-                stdout="",
-                stderr="",
+                stdout_bytes=b"",
+                stderr_bytes=b"",
                 exit_code=-1,
                 error_message="Not connected to SSH host"
             )
@@ -181,8 +279,8 @@ class SSHExecutor:
 
             # Wait for command to complete and get results
             exit_code = stdout.channel.recv_exit_status()
-            stdout_text = stdout.read().decode('utf-8')
-            stderr_text = stderr.read().decode('utf-8')
+            stdout_data = stdout.read()
+            stderr_data = stderr.read()
 
             success = exit_code == 0
 
@@ -192,8 +290,8 @@ class SSHExecutor:
 
             return SSHResult(
                 success=success,
-                stdout=stdout_text,
-                stderr=stderr_text,
+                stdout_bytes=stdout_data,
+                stderr_bytes=stderr_data,
                 exit_code=exit_code,
                 error_message=None if success else "Command failed"
             )
@@ -202,8 +300,8 @@ class SSHExecutor:
             logger.error(f"SSH error executing command: {e}")
             return SSHResult(
                 success=False,
-                stdout="",
-                stderr="",
+                stdout_bytes=b"",
+                stderr_bytes=b"",
                 exit_code=-1,
                 error_message=f"SSH error: {str(e)}"
             )
@@ -211,16 +309,230 @@ class SSHExecutor:
             logger.error(f"Unexpected error executing command: {e}")
             return SSHResult(
                 success=False,
-                stdout="",
-                stderr="",
+                stdout_bytes=b"",
+                stderr_bytes=b"",
                 exit_code=-1,
                 error_message=f"Unexpected error: {str(e)}"
             )
 
+    def execute_batch(
+        self,
+        commands: List[str],
+        timeout: Optional[int] = None
+    ) -> List[SSHResult]:
+        """
+        Run several commands in sequence over a single SSH channel.
+
+        Each command runs in turn (even if an earlier one fails) and gets
+        its own SSHResult with its own output and exit code.
+
+        Unlike separate execute_command() calls, the commands share one
+        shell: a `cd` or an exported variable carries over to the commands
+        after it. A command that ends the shell (`exit N`) or contains a
+        shell syntax error gets the batch's exit code and remaining
+        output; the commands after it are reported as not run.
+
+        Args:
+            commands: Shell commands to execute, in order
+            timeout: Command timeout for the whole batch (optional)
+
+        Returns:
+            One SSHResult per command, in the same order
+
+        Educational Note:
+        Calling execute_command() in a loop opens a channel and starts a
+        remote shell per command. Here the commands are joined into one
+        script, and after each one we print a separator line carrying its
+        exit code ($?) to both stdout and stderr. Splitting the output on
+        those separators recovers the per-command results.
+        """
+        if not commands:
+            return []
+
+        separator = f"__SEP_{uuid.uuid4().hex}__"
+        script = "".join(
+            f"{{ {command}\n}}; __rc=$?; "
+            f"printf '\\n{separator}%d\\n' $__rc; "
+            f"printf '\\n{separator}%d\\n' $__rc >&2\n"
+            for command in commands
+        )
+        batch = self.execute_command(script, timeout=timeout)
+
+        # split() yields [output, exit code, output, exit code, ..., trailing]
+        pattern = re.compile(b"\n" + separator.encode() + rb"(-?\d+)\n")
+        stdout_parts = pattern.split(batch.stdout_bytes)
+        stderr_parts = pattern.split(batch.stderr_bytes)
+        finished = len(stdout_parts) // 2
+
+        results = []
+        for i in range(len(commands)):
+            stdout = stdout_parts[2 * i] if 2 * i < len(stdout_parts) else b""
+            stderr = stderr_parts[2 * i] if 2 * i < len(stderr_parts) else b""
+            if i < finished:
+                exit_code = int(stdout_parts[2 * i + 1])
+                success = exit_code == 0
+                error_message = None if success else "Command failed"
+            elif i == finished:
+                # The shell stopped during this command (`exit`, a syntax
+                # error or a dropped connection), so the batch's own exit
+                # status and trailing output are this command's
+                exit_code = batch.exit_code
+                success = batch.success
+                error_message = batch.error_message
+            else:
+                results.append(SSHResult(
+                    success=False,
+                    stdout_bytes=b"",
+                    stderr_bytes=b"",
+                    exit_code=-1,
+                    error_message=(
+                        batch.error_message if batch.exit_code == -1
+                        else "Command did not run"
+                    )
+                ))
+                continue
+            results.append(SSHResult(
+                success=success,
+                stdout_bytes=stdout,
+                stderr_bytes=stderr,
+                exit_code=exit_code,
+                error_message=error_message
+            ))
+        return results
+
+    def open_shell(self) -> bool:
+        """
+        Start a long-lived remote shell for execute_command_fast().
+
+        Returns:
+            True if the shell is running, False otherwise
+
+        Educational Note:
+        exec_command() opens a new SSH channel and the server starts a new
+        shell process for every command. For rapid polling (e.g. reading
+        the CPU temperature every second) that setup dominates. Here one
+        /bin/sh stays running and we write commands to its stdin instead.
+        We run the shell without a PTY, so there is no prompt or echo to
+        filter out of the output.
+        """
+        if self._shell and not self._shell.closed:
+            return True
+        if not self.client:
+            logger.error("Not connected to SSH host")
+            return False
+
+        try:
+            self._shell = self.client.get_transport().open_session()
+            self._shell.exec_command('/bin/sh')
+            return True
+        except Exception as e:
+            logger.error(f"Could not open shell on {self.hostname}: {e}")
+            self._shell = None
+            return False
+
+    def execute_command_fast(
+        self,
+        command: str,
+        timeout: Optional[int] = None
+    ) -> SSHResult:
+        """
+        Execute a command in the persistent shell opened by open_shell().
+
+        The shell is opened automatically on first use. After the command,
+        a unique marker line is printed on both stdout (carrying the exit
+        code) and stderr; each stream is read up to its marker. The
+        command's stdin is /dev/null.
+
+        Args:
+            command: Shell command to execute
+            timeout: Seconds to wait for the command to finish (optional)
+
+        Returns:
+            SSHResult containing output and status
+
+        Educational Note:
+        The shell is shared between calls, so commands like `cd` or
+        `export` affect later commands - unlike execute_command().
+        sshd relays the command's stdout and stderr pipes independently,
+        so output on one stream can arrive after the marker on the other;
+        that is why both streams get a marker.
+        """
+        if not self.open_shell():
+            return SSHResult(
+                success=False,
+                stdout_bytes=b"",
+                stderr_bytes=b"",
+                exit_code=-1,
+                error_message="Could not open remote shell"
+            )
+
+        end = b"\n" + self._shell_marker.encode()
+        stdout_data = b""
+        stderr_data = b""
+
+        try:
+            # The braces keep `cd`/`export` in this shell while pointing the
+            # command's stdin at /dev/null, so a command that reads input
+            # can't swallow the marker lines that follow it
+            self._shell.sendall(
+                f"{{ {command}\n}} </dev/null\n"
+                f"printf '\\n{self._shell_marker}%d\\n' $?\n"
+                f"printf '\\n{self._shell_marker}\\n' >&2\n".encode()
+            )
+
+            # Read both streams until "\n<marker><exit code>\n" is complete
+            # on stdout and "\n<marker>\n" on stderr
+            deadline = time.monotonic() + (timeout or self.timeout)
+            while True:
+                marker_at = stdout_data.find(end)
+                if marker_at != -1:
+                    status_start = marker_at + len(end)
+                    status_end = stdout_data.find(b"\n", status_start)
+                    stderr_at = stderr_data.find(end + b"\n")
+                    if status_end != -1 and stderr_at != -1:
+                        break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise socket.timeout("Timed out waiting for command to finish")
+                select.select([self._shell], [], [], remaining)
+
+                if self._shell.recv_ready():
+                    stdout_data += self._shell.recv(32768)
+                elif self._shell.recv_stderr_ready():
+                    stderr_data += self._shell.recv_stderr(32768)
+                elif self._shell.closed or self._shell.eof_received:
+                    raise paramiko.SSHException("Remote shell closed")
+
+            exit_code = int(stdout_data[status_start:status_end])
+            success = exit_code == 0
+
+            return SSHResult(
+                success=success,
+                stdout_bytes=stdout_data[:marker_at],
+                stderr_bytes=stderr_data[:stderr_at],
+                exit_code=exit_code,
+                error_message=None if success else "Command failed"
+            )
+
+        except (paramiko.SSHException, socket.timeout) as e:
+            logger.error(f"Shell error executing command: {e}")
+            # The shell's output stream is now out of sync; start fresh next time
+            self._shell.close()
+            self._shell = None
+            return SSHResult(
+                success=False,
+                stdout_bytes=b"",
+                stderr_bytes=b"",
+                exit_code=-1,
+                error_message=f"SSH error: {str(e)}"
+            )
+
     def upload_file(
         self,
         local_path: str,
-        remote_path: str
+        remote_path: str,
+        confirm: bool = True
     ) -> bool:
         """
         Upload a file to the remote host via SFTP.
@@ -228,6 +540,8 @@ class SSHExecutor:
         Args:
             local_path: Path to local file
             remote_path: Destination path on remote host
+            confirm: Stat the remote file afterwards to verify its size.
+                Pass False to skip that extra round trip.
 
         Returns:
             True if upload successful, False otherwise
@@ -241,9 +555,9 @@ class SSHExecutor:
             return False
 
         try:
-            sftp = self.client.open_sftp()
-            sftp.put(local_path, remote_path)
-            sftp.close()
+            sftp = self._get_sftp()
+            with open(local_path, 'rb') as local_file:
+                sftp.putfo(local_file, remote_path, confirm=confirm)
             logger.info(f"Uploaded {local_path} to {self.hostname}:{remote_path}")
             return True
 
@@ -265,15 +579,22 @@ class SSHExecutor:
 
         Returns:
             True if download successful, False otherwise
+
+        Educational Note:
+        prefetch() asks the server for every block of the file up front, so
+        reads are served from data already in flight instead of one request
+        and reply per block.
         """
         if not self.client:
             logger.error("Not connected to SSH host")
             return False
 
         try:
-            sftp = self.client.open_sftp()
-            sftp.get(remote_path, local_path)
-            sftp.close()
+            sftp = self._get_sftp()
+            with sftp.open(remote_path, 'rb') as remote_file:
+                remote_file.prefetch()
+                with open(local_path, 'wb') as local_file:
+                    shutil.copyfileobj(remote_file, local_file, SFTP_COPY_CHUNK_SIZE)
             logger.info(f"Downloaded {self.hostname}:{remote_path} to {local_path}")
             return True
 
@@ -291,6 +612,213 @@ class SSHExecutor:
         self.disconnect()
 
 
+# Parsed known_hosts files shared by every connect():
+# path -> ((mtime, size), keys)
+_KNOWN_HOSTS: Dict[str, Tuple[Tuple[int, int], paramiko.HostKeys]] = {}
+_KNOWN_HOSTS_LOCK = threading.Lock()
+
+
+def _read_known_hosts(path: str) -> paramiko.HostKeys:
+    """
+    Parse a known_hosts file, skipping lines paramiko can't read.
+
+    HostKeys.load() raises on some valid OpenSSH lines (such as
+    @cert-authority markers), which would stop every connection; those
+    lines are ignored here instead.
+    """
+    host_keys = paramiko.HostKeys()
+    with open(path, 'r') as f:
+        for lineno, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            try:
+                entry = HostKeyEntry.from_line(line, lineno)
+            except Exception:
+                continue
+            if entry is not None:
+                for name in entry.hostnames:
+                    host_keys.add(name, entry.key.get_name(), entry.key)
+    return host_keys
+
+
+def _system_host_keys(known_hosts_path: Optional[str] = None) -> paramiko.HostKeys:
+    """
+    Get the parsed known_hosts keys, re-reading the file only if it changed.
+
+    Educational Note:
+    A fleet operation connects to many outposts in a row. Parsing
+    known_hosts once and sharing the result turns host verification into
+    an in-memory lookup; the file's modification time and size tell us
+    when a new key (e.g. from provision_host_key) has to be picked up.
+    """
+    path = known_hosts_path or os.path.expanduser('~/.ssh/known_hosts')
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return paramiko.HostKeys()
+    version = (stat.st_mtime_ns, stat.st_size)
+
+    with _KNOWN_HOSTS_LOCK:
+        cached = _KNOWN_HOSTS.get(path)
+        if cached is None or cached[0] != version:
+            cached = (version, _read_known_hosts(path))
+            _KNOWN_HOSTS[path] = cached
+        return cached[1]
+
+
+def provision_host_key(
+    hostname: str,
+    port: int = 22,
+    known_hosts_path: Optional[str] = None,
+    timeout: int = 10
+) -> bool:
+    """
+    Fetch an outpost's host key and record it in known_hosts.
+
+    This is a one-time enrollment step for new outposts; afterwards
+    SSHExecutor.connect() verifies the host against the stored key.
+
+    Args:
+        hostname: Outpost hostname or IP address
+        port: SSH port
+        known_hosts_path: File to update (default: ~/.ssh/known_hosts)
+        timeout: Connection timeout in seconds
+
+    Returns:
+        True if the key was recorded, False otherwise
+
+    Educational Note:
+    This trusts whatever key the host presents, exactly like AutoAddPolicy
+    does - so only run it on a network you trust. Only the key exchange
+    is performed; no credentials are needed.
+    """
+    path = known_hosts_path or os.path.expanduser('~/.ssh/known_hosts')
+    transport = None
+    try:
+        sock = socket.create_connection((hostname, port), timeout=timeout)
+        transport = paramiko.Transport(sock)
+        transport.start_client(timeout=timeout)
+        key = transport.get_remote_server_key()
+
+        # known_hosts uses "[host]:port" for non-standard ports
+        entry = hostname if port == 22 else f"[{hostname}]:{port}"
+        if _system_host_keys(path).check(entry, key):
+            logger.info(f"{key.get_name()} host key for {entry} already known")
+            return True
+
+        # Append one line rather than rewriting the file, so the user's
+        # comments and any entries paramiko can't parse are left alone
+        line = HostKeyEntry([entry], key).to_line()
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        with open(path, 'ab+') as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    line = '\n' + line
+            f.write(line.encode())
+        logger.info(f"Recorded {key.get_name()} host key for {entry}")
+        return True
+
+    except Exception as e:
+        logger.error(f"Failed to provision host key for {hostname}: {e}")
+        return False
+    finally:
+        if transport is not None:
+            transport.close()
+
+
+# Connected executors shared by execute_remote_command, keyed by
+# (hostname, username, port, credential fingerprint)
+_POOL: Dict[Tuple[str, str, int, str], SSHExecutor] = {}
+# Guards _POOL and _POOL_KEY_LOCKS; held only for dict updates, never I/O
+_POOL_LOCK = threading.Lock()
+# One lock per pool key, held while that key's connection is opened
+_POOL_KEY_LOCKS: Dict[Tuple[str, str, int, str], threading.Lock] = {}
+
+
+def _credential_fingerprint(
+    password: Optional[str],
+    key_filename: Optional[str]
+) -> str:
+    """
+    Hash the credentials so they can be part of a pool key.
+
+    Educational Note:
+    A pooled connection is already authenticated, so handing it to a
+    caller with different credentials would skip authentication entirely.
+    Keying on a digest (rather than the password itself) keeps the secret
+    out of the pool's keys.
+    """
+    return hashlib.sha256(repr((password, key_filename)).encode('utf-8')).hexdigest()
+
+
+def _get_or_connect(
+    hostname: str,
+    username: str,
+    password: Optional[str],
+    key_filename: Optional[str],
+    port: int
+) -> Optional[SSHExecutor]:
+    """
+    Return a live pooled executor for these credentials, connecting if needed.
+
+    Returns:
+        Connected SSHExecutor, or None if the connection failed
+    """
+    key = (hostname, username, port,
+           _credential_fingerprint(password, key_filename))
+    with _POOL_LOCK:
+        key_lock = _POOL_KEY_LOCKS.setdefault(key, threading.Lock())
+
+    # Connecting can take up to the SSH timeout, so only callers for this
+    # host and credentials wait on it; commands to other outposts (e.g.
+    # from fanout_execute) carry on
+    with key_lock:
+        with _POOL_LOCK:
+            executor = _POOL.get(key)
+        if executor and executor.client:
+            transport = executor.client.get_transport()
+            if transport is not None and transport.is_active():
+                return executor
+        if executor:
+            # Connection dropped (e.g. the Pi rebooted); rebuild it
+            executor.disconnect()
+            with _POOL_LOCK:
+                _POOL.pop(key, None)
+
+        executor = SSHExecutor(
+            hostname=hostname,
+            username=username,
+            password=password,
+            key_filename=key_filename,
+            port=port
+        )
+        if not executor.connect():
+            executor.disconnect()
+            return None
+        with _POOL_LOCK:
+            _POOL[key] = executor
+        return executor
+
+
+def close_all_connections() -> None:
+    """
+    Close every pooled connection opened by execute_remote_command().
+
+    Called automatically at interpreter exit.
+    """
+    with _POOL_LOCK:
+        executors = list(_POOL.values())
+        _POOL.clear()
+    for executor in executors:
+        executor.disconnect()
+
+
+atexit.register(close_all_connections)
+
+
 def execute_remote_command(
     hostname: str,
     username: str,
@@ -314,8 +842,11 @@ def execute_remote_command(
         SSHResult containing command output and status
 
     Educational Note:
-    This is a simplified interface for one-off commands. For multiple
-    commands, use SSHExecutor with context manager to reuse connections.
+    This is a simplified interface for one-off commands. The authenticated
+    connection is kept in a pool and reused by later calls to the same
+    host and user with the same credentials, so a dashboard refreshing
+    every few seconds doesn't repeat the SSH handshake each time. Use close_all_connections() to
+    release them early.
 
     Example:
         result = execute_remote_command(
@@ -326,11 +857,100 @@ def execute_remote_command(
         )
         print(result.stdout)
     """
-    with SSHExecutor(
-        hostname=hostname,
-        username=username,
-        password=password,
-        key_filename=key_filename,
-        port=port
-    ) as executor:
-        return executor.execute_command(command)
+    executor = _get_or_connect(hostname, username, password, key_filename, port)
+    if executor is None:
+        return SSHResult(
+            success=False,
+            stdout_bytes=b"",
+            stderr_bytes=b"",
+            exit_code=-1,
+            error_message=f"Could not connect to {hostname}"
+        )
+    return executor.execute_command(command)
+
+
+def fanout_execute(
+    hosts: List[str],
+    username: str,
+    command: str,
+    password: Optional[str] = None,
+    key_filename: Optional[str] = None,
+    port: int = 22,
+    max_workers: Optional[int] = None
+) -> Dict[str, SSHResult]:
+    """
+    Run the same command on several outposts in parallel.
+
+    Args:
+        hosts: IP addresses or hostnames of the Raspberry Pis
+        username: SSH username (shared by all hosts)
+        command: Command to execute on every host
+        password: Password for authentication (optional)
+        key_filename: Path to private key file (optional)
+        port: SSH port (default 22)
+        max_workers: Maximum concurrent connections (default: one per host, up to 32)
+
+    Returns:
+        Dictionary mapping each host to its SSHResult
+
+    Educational Note:
+    Most of the time in an SSH call is spent waiting on the network for the
+    TCP handshake, key exchange and authentication. Paramiko releases the
+    GIL while it waits, so threads let those handshakes overlap: scanning
+    10 outposts takes about as long as the slowest one, not the sum of all.
+
+    Example:
+        results = fanout_execute(
+            ["192.168.1.100", "192.168.1.101"],
+            username="pi",
+            password="raspberry",
+            command="df -h /"
+        )
+        for host, result in results.items():
+            print(host, result.stdout)
+    """
+    if not hosts:
+        return {}
+
+    def run_on_host(hostname: str) -> SSHResult:
+        executor = SSHExecutor(
+            hostname=hostname,
+            username=username,
+            password=password,
+            key_filename=key_filename,
+            port=port
+        )
+        if not executor.connect():
+            executor.disconnect()
+            return SSHResult(
+                success=False,
+                stdout_bytes=b"",
+                stderr_bytes=b"",
+                exit_code=-1,
+                error_message=f"Could not connect to {hostname}"
+            )
+        try:
+            return executor.execute_command(command)
+        finally:
+            executor.disconnect()
+
+    results: Dict[str, SSHResult] = {}
+    workers = max_workers or min(32, len(hosts))
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(run_on_host, hostname): hostname for hostname in hosts}
+        for future in as_completed(futures):
+            hostname = futures[future]
+            try:
+                results[hostname] = future.result()
+            except Exception as e:
+                logger.error(f"Unexpected error running command on {hostname}: {e}")
+                results[hostname] = SSHResult(
+                    success=False,
+                    stdout_bytes=b"",
+                    stderr_bytes=b"",
+                    exit_code=-1,
+                    error_message=f"Unexpected error: {str(e)}"
+                )
+
+    return results
@@ -12,18 +12,76 @@ Educational Focus:
 - Understanding JSON data structures
 """
 
+import functools
+import threading
 import streamlit as st
+import orjson
 import requests
-import pandas as pd
-from typing import Optional, List, Dict, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Sequence, Tuple
 from datetime import datetime
 import sys
 from pathlib import Path
 
 # Add project root to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+_PROJECT_ROOT = str(Path(__file__).parents[3])
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
 from src.models.outpost import Outpost, OutpostStatus
+from src.ui.components.metrics import render_metrics
+
+# One HTTP session shared by every fetch in this chapter. Streamlit reruns
+# this page on every widget interaction; module globals survive reruns, so
+# the session's pooled keep-alive connections are reused instead of opening
+# a new TCP connection for each request. The adapter also retries (with a
+# short backoff) when the outpost's server is briefly unavailable.
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+# (ETag, decoded body) of the last response per (URL, query params), for
+# conditional GETs. Kept at module level rather than in session_state: the
+# bodies are the same for every session, and the cached fetch functions
+# that use it are shared across sessions too.
+_ETAG_CACHE: Dict[Tuple[str, Tuple], Tuple[str, Any]] = {}
+_ETAG_CACHE_MAX_ENTRIES = 64
+_ETAG_CACHE_LOCK = threading.Lock()
+
+# Inventory items fetched per request; "Load more" fetches the next page
+INVENTORY_PAGE_SIZE = 200
+
+# Static UI labels and table layouts, built once at import instead of on
+# every rerun
+_CH1_TABS = ("📦 Inventory", "🎣 Catch Records", "📊 Statistics", "📚 Learning Notes")
+_CATEGORY_OPTIONS = ("All", "food", "tools", "supplies")
+
+_INVENTORY_COLS = ("name", "category", "quantity", "unit", "value", "description")
+_INVENTORY_COLUMN_CONFIG = {
+    "name": st.column_config.TextColumn("Item Name"),
+    "category": st.column_config.TextColumn("Category"),
+    "quantity": st.column_config.NumberColumn("Quantity"),
+    "unit": st.column_config.TextColumn("Unit"),
+    "value": st.column_config.NumberColumn("Value ($)", format="$%.2f"),
+    "description": st.column_config.TextColumn("Description"),
+}
+
+_CATCH_COLS = ("catch_date", "fish_type", "quantity", "weight_pounds", "location", "quality")
+_CATCH_COLUMN_CONFIG = {
+    "catch_date": st.column_config.TextColumn("Date"),
+    "fish_type": st.column_config.TextColumn("Fish Type"),
+    "quantity": st.column_config.NumberColumn("Count"),
+    "weight_pounds": st.column_config.NumberColumn("Weight (lbs)"),
+    "location": st.column_config.TextColumn("Location"),
+    "quality": st.column_config.TextColumn("Quality"),
+}
 
 
 def render_chapter1_page():
@@ -62,12 +120,7 @@ def render_chapter1_page():
     render_outpost_status(fishing_fort)
 
     # Tabs for different views
-    tab1, tab2, tab3, tab4 = st.tabs([
-        "📦 Inventory",
-        "🎣 Catch Records",
-        "📊 Statistics",
-        "📚 Learning Notes"
-    ])
+    tab1, tab2, tab3, tab4 = st.tabs(_CH1_TABS)
 
     with tab1:
         render_inventory_tab(fishing_fort)
@@ -91,16 +144,25 @@ def get_fishing_fort_outpost() -> Optional[Outpost]:
 
     Educational Note:
     This demonstrates how to access shared state across the application.
+    Rather than scanning every outpost on each rerun, an index of outposts
+    by type is kept in session state and rebuilt only when the outposts
+    list changes (main.py bumps outposts_version on add/remove).
     """
     if 'outposts' not in st.session_state:
         return None
 
-    # Look for a fishing fort in configured outposts
-    for outpost in st.session_state.outposts:
-        if outpost.outpost_type.value == 'fishing':
-            return outpost
+    outposts = st.session_state.outposts
+    key = (id(outposts), len(outposts), st.session_state.get('outposts_version', 0))
+    cached = st.session_state.get('_outposts_by_type')
+    if cached is None or cached[0] != key:
+        by_type: Dict[str, Outpost] = {}
+        for outpost in outposts:
+            # First outpost of each type wins, as with a linear scan
+            by_type.setdefault(outpost.outpost_type.value, outpost)
+        cached = (key, by_type)
+        st.session_state['_outposts_by_type'] = cached
 
-    return None
+    return cached[1].get('fishing')
 
 
 def render_outpost_setup_guide():
@@ -148,7 +210,14 @@ def render_outpost_status(outpost: Outpost):
 
     Educational Note:
     Status checks verify API connectivity before attempting operations.
+    The check only runs when "Test Connection" is clicked; its result is
+    kept in session state so ordinary reruns (any widget click) don't
+    block on a network request just to draw the status badge. The health
+    and status endpoints are queried at the same time, so the test takes
+    as long as the slower request rather than both added together.
     """
+    health_key = f"ch1_health_ok_{outpost.api_base_url}"
+
     with st.expander("🏰 Outpost Connection Status", expanded=False):
         col1, col2, col3 = st.columns(3)
 
@@ -159,48 +228,160 @@ def render_outpost_status(outpost: Outpost):
             st.metric("Type", outpost.outpost_type.value.title())
 
         with col3:
-            # Try to check status
-            status = check_outpost_health(outpost)
-            if status:
-                st.metric("Status", "🟢 Online")
-            else:
-                st.metric("Status", "🔴 Offline")
+            # Filled in below, after a possible connection test
+            status_slot = st.empty()
 
         st.caption(f"API Base URL: `{outpost.api_base_url}`")
 
         if st.button("🔄 Test Connection"):
             with st.spinner("Testing connection..."):
-                result = check_outpost_health(outpost)
+                results = _parallel_fetch(outpost.api_base_url, ("/health", "/status"))
+                result = results["/health"]
+                status = results["/status"]
+                st.session_state[health_key] = result is not None
                 if result:
                     st.success(f"✅ Connected successfully! {result.get('inventory_items', 0)} items in database.")
+                    if status:
+                        st.caption(
+                            f"Status: {status.get('status', 'unknown')} · "
+                            f"{status.get('recent_catches_count', 0)} catches in the last 7 days"
+                        )
                 else:
                     st.error("❌ Connection failed. Check that the API server is running.")
 
+        health_ok = st.session_state.get(health_key)
+        if health_ok is None:
+            status_slot.metric("Status", "⚪ Not tested")
+        elif health_ok:
+            status_slot.metric("Status", "🟢 Online")
+        else:
+            status_slot.metric("Status", "🔴 Offline")
+
 
-def check_outpost_health(outpost: Outpost) -> Optional[Dict[str, Any]]:
+def _parallel_fetch(
+    api_base_url: str,
+    paths: Sequence[str]
+) -> Dict[str, Optional[Dict[str, Any]]]:
     """
-    Check if outpost API is accessible.
+    GET several endpoints of one outpost concurrently.
 
     Args:
-        outpost: The outpost to check
+        api_base_url: Base URL of the outpost
+        paths: Endpoint paths to fetch (e.g. ("/health", "/status"))
 
     Returns:
-        Health check response data or None if failed
+        Map of path -> parsed JSON, or None for requests that failed
 
     Educational Note:
     Health checks use simple GET requests to verify API availability.
-    This is a common pattern in distributed systems.
+    This is a common pattern in distributed systems. Each request mostly
+    waits on the network, so running them in threads makes the total wait
+    roughly that of the slowest request.
+    """
+    def get(path: str) -> Optional[Dict[str, Any]]:
+        try:
+            return _get_json(_endpoint(api_base_url, path), timeout=5)
+        except requests.exceptions.RequestException:
+            return None
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        return dict(zip(paths, executor.map(get, paths)))
+
+
+@functools.lru_cache(maxsize=64)
+def _endpoint(api_base_url: str, path: str) -> str:
+    """
+    Join an outpost's API base URL and an endpoint path.
+
+    Educational Note:
+    The same handful of URLs is rebuilt on every rerun. Caching on the
+    (api_base_url, path) strings - which, unlike Outpost objects, are
+    hashable - turns each rebuild into a dictionary lookup.
+    """
+    return api_base_url.rstrip("/") + "/" + path.lstrip("/")
+
+
+def _get_json(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    timeout: int = 10,
+    conditional: bool = False
+) -> Any:
+    """
+    GET a URL with the shared session and return the decoded JSON body.
+
+    Args:
+        url: Full endpoint URL
+        params: Optional query parameters
+        timeout: Request timeout in seconds
+        conditional: Send the ETag from the last response for this URL and
+            params as If-None-Match, reusing the stored body on a 304
+
+    Raises:
+        requests.exceptions.RequestException: On network errors, non-2xx
+            responses (as HTTPError) and invalid JSON
+
+    Educational Note:
+    Every kind of failure surfaces as a RequestException, so callers need a
+    single except clause. A non-2xx status is detected with response.ok
+    rather than raise_for_status(), which also formats a long message.
+
+    With conditional=True an unchanged resource costs one round trip and an
+    empty 304 response instead of a full JSON payload.
+    """
+    cache_key = (url, tuple(sorted(params.items())) if params else ())
+    cached = _ETAG_CACHE.get(cache_key) if conditional else None
+    headers = {"If-None-Match": cached[0]} if cached else None
+
+    response = _SESSION.get(url, params=params, timeout=timeout, headers=headers)
+    if cached and response.status_code == 304:
+        return cached[1]
+    if not response.ok:
+        raise requests.exceptions.HTTPError(
+            f"HTTP {response.status_code} from {url}", response=response
+        )
+    data = _decode_json(response)
+
+    etag = response.headers.get("ETag")
+    if conditional and etag:
+        with _ETAG_CACHE_LOCK:
+            if cache_key not in _ETAG_CACHE and len(_ETAG_CACHE) >= _ETAG_CACHE_MAX_ENTRIES:
+                # Evict the oldest entry (dicts keep insertion order)
+                del _ETAG_CACHE[next(iter(_ETAG_CACHE))]
+            _ETAG_CACHE[cache_key] = (etag, data)
+    return data
+
+
+def _decode_json(response: requests.Response) -> Any:
+    """
+    Parse a JSON response body with orjson.
+
+    Educational Note:
+    orjson parses the raw response bytes several times faster than the
+    standard library decoder used by response.json(), which matters for
+    large inventory pages. Invalid JSON is re-raised as a requests error so
+    callers only need to handle RequestException.
     """
     try:
-        url = outpost.get_endpoint_url('/health')
-        response = requests.get(url, timeout=5)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        st.error(f"Connection error: {e}")
-        return None
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise requests.exceptions.InvalidJSONError(
+            f"Invalid JSON from {response.url}: {e}", response=response
+        ) from e
 
 
+def _render_request_error(what: str, error: requests.exceptions.RequestException) -> None:
+    """Show one friendly message for a failed API request."""
+    if isinstance(error, requests.exceptions.Timeout):
+        detail = "⏱️ Request timed out. The outpost may be unreachable."
+    elif isinstance(error, requests.exceptions.ConnectionError):
+        detail = "🔌 Connection failed. Is the API server running?"
+    else:
+        detail = str(error)
+    st.error(f"❌ Failed to fetch {what}. {detail}")
+
+
+@st.fragment
 def render_inventory_tab(outpost: Outpost):
     """
     Render the inventory management tab.
@@ -210,6 +391,9 @@ def render_inventory_tab(outpost: Outpost):
 
     Educational Note:
     This demonstrates fetching and displaying API data in a user-friendly format.
+
+    The tabs are Streamlit fragments: changing a filter or clicking Refresh
+    here reruns only this tab, not the whole Chapter 1 page.
     """
     st.subheader("📦 Fort Inventory")
 
@@ -228,7 +412,7 @@ def render_inventory_tab(outpost: Outpost):
     with col1:
         category_filter = st.selectbox(
             "Category Filter",
-            options=["All", "food", "tools", "supplies"],
+            options=_CATEGORY_OPTIONS,
             help="Filter inventory by category"
         )
 
@@ -245,59 +429,61 @@ def render_inventory_tab(outpost: Outpost):
         st.write("")  # Spacing
         refresh = st.button("🔄 Refresh", use_container_width=True)
 
-    # Fetch inventory data
-    inventory_data = fetch_inventory(
-        outpost,
-        category=None if category_filter == "All" else category_filter,
-        min_quantity=min_quantity
-    )
+    category = None if category_filter == "All" else category_filter
 
-    if inventory_data is None:
-        st.error("❌ Failed to fetch inventory data. Check your connection.")
+    if refresh:
+        fetch_inventory.clear()
+        fetch_inventory_summary.clear()
+
+    # Pages of items loaded so far; back to one page when the filters change
+    filters = (category, min_quantity)
+    if st.session_state.get("ch1_inventory_filters") != filters:
+        st.session_state.ch1_inventory_filters = filters
+        st.session_state.ch1_inventory_pages = 1
+
+    # Fetch the totals and the loaded pages of inventory data
+    try:
+        summary = fetch_inventory_summary(outpost.api_base_url, category, min_quantity)
+        inventory_data = []
+        for page in range(st.session_state.ch1_inventory_pages):
+            inventory_data.extend(fetch_inventory(
+                outpost.api_base_url,
+                category=category,
+                min_quantity=min_quantity,
+                offset=page * INVENTORY_PAGE_SIZE
+            ))
+    except requests.exceptions.RequestException as e:
+        _render_request_error("inventory data", e)
         return
 
     if not inventory_data:
         st.info("📭 No inventory items match your filters.")
         return
 
-    # Display as DataFrame
-    df = pd.DataFrame(inventory_data)
-
-    # Format the dataframe for display
-    display_df = df[[
-        'name', 'category', 'quantity', 'unit', 'value', 'description'
-    ]].copy()
-
-    display_df.columns = [
-        'Item Name', 'Category', 'Quantity', 'Unit', 'Value ($)', 'Description'
-    ]
-
-    # Display metrics
-    col1, col2, col3, col4 = st.columns(4)
-
-    with col1:
-        st.metric("Total Items", len(df))
-
-    with col2:
-        total_value = df['value'].sum()
-        st.metric("Total Value", f"${total_value:.2f}")
-
-    with col3:
-        categories = df['category'].nunique()
-        st.metric("Categories", categories)
-
-    with col4:
-        low_stock = len(df[df['quantity'] < 50])
-        st.metric("Low Stock Items", low_stock)
-
-    # Display table
+    # Display metrics (computed by the server over all matching items)
+    render_metrics((
+        ("Total Items", summary['total_items']),
+        ("Total Value", f"${summary['total_value']:.2f}"),
+        ("Categories", summary['categories']),
+        ("Low Stock Items", summary['low_stock_items']),
+    ))
+
+    # Display table. The API records are passed as-is; column_order picks
+    # the columns and column_config supplies display labels and formatting,
+    # so no renamed copy of the data is built.
     st.dataframe(
-        display_df,
+        inventory_data,
+        column_order=_INVENTORY_COLS,
+        column_config=_INVENTORY_COLUMN_CONFIG,
         use_container_width=True,
         hide_index=True,
         height=400
     )
 
+    if len(inventory_data) < summary['total_items']:
+        st.caption(f"Showing {len(inventory_data)} of {summary['total_items']} items")
+        st.button("⬇️ Load more", on_click=_load_more_inventory)
+
     # Show raw JSON option
     with st.expander("🔍 View Raw JSON Data"):
         st.json(inventory_data)
@@ -308,58 +494,84 @@ def render_inventory_tab(outpost: Outpost):
         """)
 
 
+def _load_more_inventory() -> None:
+    """Button callback: show one more page of inventory items."""
+    st.session_state.ch1_inventory_pages += 1
+
+
+@st.cache_data(ttl=30, show_spinner=False)
 def fetch_inventory(
-    outpost: Outpost,
+    api_base_url: str,
     category: Optional[str] = None,
-    min_quantity: Optional[int] = None
-) -> Optional[List[Dict[str, Any]]]:
+    min_quantity: Optional[int] = None,
+    offset: int = 0
+) -> List[Dict[str, Any]]:
     """
-    Fetch inventory data from the outpost API.
+    Fetch one page of inventory data from the outpost API.
 
     Args:
-        outpost: The outpost to query
+        api_base_url: Base URL of the outpost to query
         category: Optional category filter
         min_quantity: Optional minimum quantity filter
+        offset: Index of the first item to return (page size is
+            INVENTORY_PAGE_SIZE)
 
     Returns:
-        List of inventory items or None if failed
+        List of inventory items
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails
 
     Educational Note:
     This function demonstrates how to construct API requests with query
     parameters and handle responses.
+
+    Streamlit reruns the whole page on every widget change, so results are
+    cached for 30 seconds per (URL, filters). Errors are raised rather than
+    returned so that failures are never cached - the caller shows them.
     """
-    try:
-        url = outpost.get_endpoint_url('/inventory')
+    url = _endpoint(api_base_url, "/inventory")
 
-        # Build query parameters
-        params = {}
-        if category:
-            params['category'] = category
-        if min_quantity is not None and min_quantity > 0:
-            params['min_quantity'] = min_quantity
+    # Build query parameters
+    params = _inventory_filter_params(category, min_quantity)
+    params['limit'] = INVENTORY_PAGE_SIZE
+    params['offset'] = offset
 
-        # Make the request
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
+    # Make the request and parse the JSON response
+    return _get_json(url, params=params, conditional=True)
 
-        # Parse JSON response
-        data = response.json()
-        return data
 
-    except requests.exceptions.Timeout:
-        st.error("⏱️ Request timed out. The outpost may be unreachable.")
-        return None
-    except requests.exceptions.ConnectionError:
-        st.error("🔌 Connection failed. Is the API server running?")
-        return None
-    except requests.exceptions.HTTPError as e:
-        st.error(f"❌ HTTP Error: {e}")
-        return None
-    except Exception as e:
-        st.error(f"❌ Unexpected error: {e}")
-        return None
+@st.cache_data(ttl=30, show_spinner=False)
+def fetch_inventory_summary(
+    api_base_url: str,
+    category: Optional[str] = None,
+    min_quantity: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Fetch inventory totals (count, value, categories, low stock) from the API.
+
+    Educational Note:
+    The server aggregates over every matching item, so the metrics are
+    correct even when only the first page of items has been downloaded.
+    """
+    params = _inventory_filter_params(category, min_quantity)
+    return _get_json(_endpoint(api_base_url, "/inventory/summary"), params=params)
+
+
+def _inventory_filter_params(
+    category: Optional[str],
+    min_quantity: Optional[int]
+) -> Dict[str, Any]:
+    """Build the query parameters shared by /inventory and /inventory/summary."""
+    params = {}
+    if category:
+        params['category'] = category
+    if min_quantity is not None and min_quantity > 0:
+        params['min_quantity'] = min_quantity
+    return params
 
 
+@st.fragment
 def render_catch_records_tab(outpost: Outpost):
     """Render the catch records view."""
     st.subheader("🎣 Recent Catches")
@@ -370,96 +582,79 @@ def render_catch_records_tab(outpost: Outpost):
     """)
 
     # Fetch catch records
-    catches = fetch_catch_records(outpost)
-
-    if catches is None:
-        st.error("Failed to fetch catch records.")
+    try:
+        catches = fetch_catch_records(outpost.api_base_url)
+    except requests.exceptions.RequestException as e:
+        _render_request_error("catch records", e)
         return
 
     if not catches:
         st.info("No catch records found.")
         return
 
-    # Display summary metrics
-    df = pd.DataFrame(catches)
-
-    col1, col2, col3 = st.columns(3)
-
-    with col1:
-        st.metric("Total Catches", len(df))
+    # One pass over the records collects the metrics
+    total_weight = 0.0
+    fish_types = set()
+    for catch in catches:
+        total_weight += catch['weight_pounds']
+        fish_types.add(catch['fish_type'])
 
-    with col2:
-        total_weight = df['weight_pounds'].sum()
-        st.metric("Total Weight", f"{total_weight:.1f} lbs")
-
-    with col3:
-        fish_types = df['fish_type'].nunique()
-        st.metric("Fish Types", fish_types)
+    # Display summary metrics
+    render_metrics((
+        ("Total Catches", len(catches)),
+        ("Total Weight", f"{total_weight:.1f} lbs"),
+        ("Fish Types", len(fish_types)),
+    ))
 
     # Display table
-    display_df = df[[
-        'catch_date', 'fish_type', 'quantity', 'weight_pounds', 'location', 'quality'
-    ]].copy()
-
-    display_df.columns = [
-        'Date', 'Fish Type', 'Count', 'Weight (lbs)', 'Location', 'Quality'
-    ]
 
-    st.dataframe(display_df, use_container_width=True, hide_index=True, height=400)
+    st.dataframe(
+        catches,
+        column_order=_CATCH_COLS,
+        column_config=_CATCH_COLUMN_CONFIG,
+        use_container_width=True,
+        hide_index=True,
+        height=400
+    )
 
 
-def fetch_catch_records(outpost: Outpost) -> Optional[List[Dict[str, Any]]]:
-    """Fetch catch records from the API."""
-    try:
-        url = outpost.get_endpoint_url('/catches')
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        return response.json()
-    except Exception as e:
-        st.error(f"Error fetching catch records: {e}")
-        return None
+@st.cache_data(ttl=30, show_spinner=False)
+def fetch_catch_records(api_base_url: str) -> List[Dict[str, Any]]:
+    """Fetch catch records from the API (cached; raises on failure)."""
+    return _get_json(_endpoint(api_base_url, "/catches"), conditional=True)
 
 
+@st.fragment
 def render_statistics_tab(outpost: Outpost):
     """Render statistics and summary view."""
     st.subheader("📊 Outpost Statistics")
 
     # Fetch status
-    status = fetch_outpost_status(outpost)
+    try:
+        status = fetch_outpost_status(outpost.api_base_url)
+    except requests.exceptions.RequestException as e:
+        _render_request_error("status", e)
+        return
 
     if status:
-        col1, col2, col3 = st.columns(3)
-
-        with col1:
-            st.metric("Inventory Items", status.get('total_inventory_items', 0))
-
-        with col2:
-            st.metric("Inventory Value", f"${status.get('total_inventory_value', 0):.2f}")
-
-        with col3:
-            st.metric("Recent Catches (7 days)", status.get('recent_catches_count', 0))
+        render_metrics((
+            ("Inventory Items", status.get('total_inventory_items', 0)),
+            ("Inventory Value", f"${status.get('total_inventory_value', 0):.2f}"),
+            ("Recent Catches (7 days)", status.get('recent_catches_count', 0)),
+        ))
 
         st.divider()
         st.caption(f"Last updated: {status.get('last_updated', 'Unknown')}")
 
 
-def fetch_outpost_status(outpost: Outpost) -> Optional[Dict[str, Any]]:
-    """Fetch outpost status from API."""
-    try:
-        url = outpost.get_endpoint_url('/status')
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        return response.json()
-    except Exception as e:
-        st.error(f"Error fetching status: {e}")
-        return None
-
+@st.cache_data(ttl=30, show_spinner=False)
+def fetch_outpost_status(api_base_url: str) -> Dict[str, Any]:
+    """Fetch outpost status from API (cached; raises on failure)."""
+    return _get_json(_endpoint(api_base_url, "/status"))
 
-def render_learning_notes_tab():
-    """Render educational content about the chapter."""
-    st.subheader("📚 Learning Notes: REST APIs and HTTP GET")
 
-    st.markdown("""
+# Static learning-notes text, kept out of the render function
+_LEARNING_NOTES_MD = """
     ### What You're Learning in Chapter 1
 
     #### REST APIs
@@ -521,7 +716,14 @@ def render_learning_notes_tab():
     ---
 
     💡 **Remember**: Every time you interact with the UI, you're making real API calls!
-    """)
+    """
+
+
+def render_learning_notes_tab():
+    """Render educational content about the chapter."""
+    st.subheader("📚 Learning Notes: REST APIs and HTTP GET")
+
+    st.markdown(_LEARNING_NOTES_MD)
 
 
 # Make this module callable directly
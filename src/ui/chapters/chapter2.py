@@ -14,14 +14,19 @@ Educational Focus:
 import streamlit as st
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 # Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+_PROJECT_ROOT = str(Path(__file__).parents[3])
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
 from src.models.outpost import Outpost
 from src.ui.components.ssh_terminal import render_ssh_terminal
 
+# Tab labels, built once at import instead of on every rerun
+_CH2_TABS = ("🖥️ Terminal", "📊 System Monitor", "📚 Learning Guide")
+
 
 def render_chapter2_page():
     """
@@ -57,11 +62,7 @@ def render_chapter2_page():
         return
 
     # Main content tabs
-    tab1, tab2, tab3 = st.tabs([
-        "🖥️ Terminal",
-        "📊 System Monitor",
-        "📚 Learning Guide"
-    ])
+    tab1, tab2, tab3 = st.tabs(_CH2_TABS)
 
     with tab1:
         render_terminal_tab(outpost)
@@ -90,15 +91,14 @@ def select_outpost() -> Optional[Outpost]:
         col1, col2 = st.columns([3, 1])
 
         with col1:
-            outpost_names = [f"{o.name} ({o.outpost_type.value})" for o in outposts]
+            outpost_names, name_to_index = _outpost_labels(outposts)
             selected_name = st.selectbox(
                 "Choose an outpost",
                 outpost_names,
                 key="chapter2_outpost"
             )
 
-            selected_idx = outpost_names.index(selected_name)
-            selected_outpost = outposts[selected_idx]
+            selected_outpost = outposts[name_to_index[selected_name]]
 
         with col2:
             st.metric("Type", selected_outpost.outpost_type.value.title())
@@ -108,11 +108,30 @@ def select_outpost() -> Optional[Outpost]:
     return selected_outpost
 
 
-def render_setup_guide():
-    """Display setup instructions if no outposts configured."""
-    st.warning("⚠️ No outposts configured!")
+def _outpost_labels(outposts: List[Outpost]) -> Tuple[List[str], Dict[str, int]]:
+    """
+    Return the selectbox labels for the outposts and a label -> index map.
 
-    st.markdown("""
+    Educational Note:
+    Streamlit reruns this page on every interaction, but the outpost list
+    rarely changes. The labels are cached in session state and only rebuilt
+    when the outposts list changes (main.py bumps outposts_version on
+    add/remove), so a rerun does no per-outpost work.
+    """
+    key = (id(outposts), len(outposts), st.session_state.get('outposts_version', 0))
+    cached = st.session_state.get("_outpost_names_cache")
+    if cached is None or cached[0] != key:
+        names = [f"{o.name} ({o.outpost_type.value})" for o in outposts]
+        name_to_index: Dict[str, int] = {}
+        for i, name in enumerate(names):
+            name_to_index.setdefault(name, i)  # first match, like list.index()
+        cached = (key, names, name_to_index)
+        st.session_state["_outpost_names_cache"] = cached
+    return cached[1], cached[2]
+
+
+# SSH setup instructions shown when no outpost is configured
+_SETUP_GUIDE_MD = """
     ### Setup Required
 
     To complete this chapter, you need to:
@@ -142,9 +161,17 @@ def render_setup_guide():
     ```
 
     💡 **Tip**: Use Demo Mode to explore without hardware!
-    """)
+    """
+
+
+def render_setup_guide():
+    """Display setup instructions if no outposts configured."""
+    st.warning("⚠️ No outposts configured!")
 
+    st.markdown(_SETUP_GUIDE_MD)
 
+
+@st.fragment
 def render_terminal_tab(outpost: Outpost):
     """
     Render the SSH terminal tab.
@@ -202,6 +229,7 @@ def render_terminal_tab(outpost: Outpost):
         """)
 
 
+@st.fragment
 def render_system_monitor_tab(outpost: Outpost):
     """
     Render system monitoring dashboard.
@@ -270,11 +298,8 @@ def render_system_monitor_tab(outpost: Outpost):
     """)
 
 
-def render_learning_guide_tab():
-    """Render educational content for Chapter 2."""
-    st.subheader("📚 Learning Guide: SSH and Remote Command Execution")
-
-    st.markdown("""
+# Static learning-guide text, kept out of the render function
+_LEARNING_GUIDE_MD = """
     ### What is SSH?
 
     **SSH (Secure Shell)** is a network protocol for secure remote access to computers.
@@ -412,7 +437,14 @@ def render_learning_guide_tab():
     💡 **Practice Tip**: Try executing various commands in the Terminal tab.
     Understanding command-line operations is essential for DevOps and system
     administration!
-    """)
+    """
+
+
+def render_learning_guide_tab():
+    """Render educational content for Chapter 2."""
+    st.subheader("📚 Learning Guide: SSH and Remote Command Execution")
+
+    st.markdown(_LEARNING_GUIDE_MD)
 
 
 # Make module callable directly
@@ -12,9 +12,15 @@ This chapter builds on previous chapters by adding:
 - Secure data access patterns
 """
 
+import functools
+import threading
 import streamlit as st
 import pandas as pd
-from typing import Optional
+from collections import Counter
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Tuple, Callable
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 from src.api_client.client import OutpostAPIClient
 from src.ui.components.auth_components import (
     initialize_auth_session_state,
@@ -22,10 +28,9 @@ from src.ui.components.auth_components import (
     render_user_status_badge,
     render_user_profile_card,
     render_logout_button,
-    require_authentication,
-    get_authenticated_client,
     is_authenticated
 )
+from src.ui.components.api_cache import get_api_client, require_result
 import logging
 
 logger = logging.getLogger(__name__)
@@ -34,6 +39,109 @@ logger = logging.getLogger(__name__)
 TRADING_FORT_API = "http://localhost:8001"  # Update with actual Pi address
 
 
+@dataclass(frozen=True)
+class _FortConfig:
+    """
+    Connection settings for one fort's API.
+
+    Attributes:
+        name: Fort name shown in the UI
+        url: Base URL of the fort's API
+    """
+
+    name: str
+    url: str
+
+    @property
+    def docs_url(self) -> str:
+        """URL of the API's interactive documentation."""
+        return f"{self.url}/docs"
+
+
+@st.cache_resource
+def _trading_fort() -> _FortConfig:
+    """
+    Get the Trading Fort's connection settings.
+
+    Educational Note:
+    Every section reads the fort's address through this one function, so
+    pointing the chapter at another Pi (or choosing between several) only
+    means changing what it returns. st.cache_resource builds the object
+    once per server process and shares it across sessions and reruns.
+    """
+    return _FortConfig(name="Trading Fort", url=TRADING_FORT_API)
+
+
+# Runs requests that a section starts early and waits on later
+_BACKGROUND = ThreadPoolExecutor(max_workers=2)
+
+# Static UI labels, built once at import instead of on every rerun
+_CH3_TABS = (
+    "📚 Overview",
+    "🔐 Authentication",
+    "📦 Trade Goods",
+    "👥 Traders",
+    "💼 Trade Records",
+    "📊 Admin Dashboard",
+)
+_GOODS_CATEGORY_OPTIONS = ("All", "furs", "tools", "trade_goods", "provisions")
+_GOODS_QUALITY_OPTIONS = ("All", "poor", "fair", "good", "excellent")
+
+# Number of trade records shown in the Recent Trades table
+RECENT_TRADES_SHOWN = 20
+
+# Columns shown in each table. DataFrames are built with only these
+# columns, so unused API fields are never copied into pandas or sent to
+# the browser.
+_GOODS_COLS = ('name', 'category', 'quantity', 'unit', 'current_price', 'quality', 'origin')
+_TRADER_COLS = ('name', 'trader_type', 'reputation', 'total_trades', 'total_value')
+_TRADE_COLS = ('trade_type', 'quantity', 'price_per_unit', 'total_value', 'trade_date', 'payment_method')
+
+# Low-cardinality text columns stored as pandas Categoricals: one small
+# integer code per row plus a shared list of labels, instead of a Python
+# string object per cell
+_GOODS_DTYPES = dict.fromkeys(('category', 'quality', 'origin'), 'category')
+_TRADER_DTYPES = dict.fromkeys(('trader_type', 'reputation'), 'category')
+_TRADE_DTYPES = dict.fromkeys(('trade_type', 'payment_method'), 'category')
+
+
+def with_trading_client(
+    header: str,
+    login_message: str = "This feature requires authentication"
+) -> Callable[[Callable[[OutpostAPIClient], None]], Callable[[], None]]:
+    """
+    Decorator for sections that need a logged-in Trading Fort client.
+
+    The wrapper draws the section header, then calls the section with the
+    shared client for the current user. When nobody is logged in it shows
+    login_message instead and skips the section.
+
+    Args:
+        header: Section header text
+        login_message: Shown to users who are not logged in
+
+    Educational Note:
+    The authentication check and client lookup live in one place instead
+    of being repeated at the top of every protected section. Logged-out
+    users are pointed to the Authentication tab rather than given a login
+    form in each tab (Streamlit forms need unique keys, so only one login
+    form can be on the page).
+    """
+    def decorator(section: Callable[[OutpostAPIClient], None]) -> Callable[[], None]:
+        @functools.wraps(section)
+        def wrapper() -> None:
+            st.header(header)
+
+            if not is_authenticated():
+                st.warning(f"🔒 {login_message}")
+                st.caption("Log in on the 🔐 Authentication tab.")
+                return
+
+            section(get_api_client(_trading_fort().url, st.session_state.auth_token))
+        return wrapper
+    return decorator
+
+
 def render_chapter3():
     """
     Main render function for Chapter 3.
@@ -67,15 +175,11 @@ def render_chapter3():
 
     st.markdown("---")
 
+    if is_authenticated():
+        _prefetch_trading_data(_trading_fort().url, st.session_state.auth_token)
+
     # Create tabs for different sections
-    tabs = st.tabs([
-        "📚 Overview",
-        "🔐 Authentication",
-        "📦 Trade Goods",
-        "👥 Traders",
-        "💼 Trade Records",
-        "📊 Admin Dashboard"
-    ])
+    tabs = st.tabs(_CH3_TABS)
 
     with tabs[0]:
         render_overview()
@@ -96,11 +200,14 @@ def render_chapter3():
         render_admin_section()
 
 
+@st.fragment
 def render_overview():
     """Render chapter overview and introduction."""
     st.header("📚 Trading Fort Overview")
 
-    st.markdown("""
+    fort = _trading_fort()
+
+    st.markdown(f"""
     ### Welcome to the Trading Fort!
 
     The Trading Fort is the economic heart of the frontier, where trappers,
@@ -137,9 +244,9 @@ def render_overview():
 
     ### API Information
 
-    - **Endpoint:** `{TRADING_FORT_API}`
+    - **Endpoint:** `{fort.url}`
     - **Authentication:** Bearer Token (JWT)
-    - **Documentation:** `{TRADING_FORT_API}/docs`
+    - **Documentation:** `{fort.docs_url}`
     """)
 
     # Show API health status
@@ -150,26 +257,22 @@ def render_overview():
     with col1:
         if st.button("Check Health", use_container_width=True):
             try:
-                client = OutpostAPIClient(TRADING_FORT_API)
-                health = client.health_check()
-                if health:
-                    st.success(f"✅ {health['service']} is healthy")
-                    st.json(health)
-                else:
-                    st.error("❌ Health check failed")
+                health = _cached_health(fort.url)
+                st.success(f"✅ {health['service']} is healthy")
+                st.json(health)
+            except ConnectionError:
+                st.error("❌ Health check failed")
             except Exception as e:
                 st.error(f"❌ Error: {str(e)}")
 
     with col2:
         if st.button("Get Status", use_container_width=True):
             try:
-                client = OutpostAPIClient(TRADING_FORT_API)
-                status = client.get_status()
-                if status:
-                    st.success("✅ Status retrieved")
-                    st.json(status)
-                else:
-                    st.error("❌ Failed to get status")
+                status = _cached_status(fort.url)
+                st.success("✅ Status retrieved")
+                st.json(status)
+            except ConnectionError:
+                st.error("❌ Failed to get status")
             except Exception as e:
                 st.error(f"❌ Error: {str(e)}")
 
@@ -178,6 +281,11 @@ def render_authentication_section():
     """Render authentication and login section."""
     st.header("🔐 Authentication")
 
+    # Set by the login callback below, shown once after the post-login rerun
+    welcome_message = st.session_state.pop('ch3_welcome_message', None)
+    if welcome_message:
+        st.success(welcome_message)
+
     if is_authenticated():
         st.success("✅ You are logged in!")
 
@@ -190,17 +298,14 @@ def render_authentication_section():
             st.markdown("### 🎮 Actions")
 
             if st.button("🔄 Refresh User Info", use_container_width=True):
-                client = get_authenticated_client('trading', TRADING_FORT_API)
-                if client:
-                    user_info = client.get_current_user()
-                    if user_info:
-                        st.json(user_info)
-                    else:
-                        st.error("Failed to get user info")
+                user_info = get_api_client(_trading_fort().url, st.session_state.auth_token).get_current_user()
+                if user_info:
+                    st.json(user_info)
+                else:
+                    st.error("Failed to get user info")
 
             if st.button("📋 List Available Users", use_container_width=True):
-                client = OutpostAPIClient(TRADING_FORT_API)
-                users = client.list_available_users()
+                users = get_api_client(_trading_fort().url).list_available_users()
                 if users:
                     st.json(users)
 
@@ -211,173 +316,162 @@ def render_authentication_section():
         st.info("👋 Please log in to access Trading Fort features")
 
         render_login_form(
-            TRADING_FORT_API,
-            on_success=lambda user: st.success(f"Welcome, {user['username']}!")
+            _trading_fort().url,
+            on_success=_store_welcome_message
         )
 
 
-def render_goods_section():
-    """Render trade goods management section."""
-    st.header("📦 Trade Goods")
+def _store_welcome_message(user: Dict[str, Any]) -> None:
+    """
+    Login callback: keep the welcome message for the next run.
+
+    Educational Note:
+    render_login_form() reruns the script right after a successful login,
+    which discards anything drawn in the current run. Saving the message
+    in session state lets the rerun, which renders the logged-in page
+    anyway, show it without any extra work.
+    """
+    st.session_state['ch3_welcome_message'] = f"Welcome, {user['username']}!"
+
 
-    if not require_authentication(TRADING_FORT_API, "Please log in to view trade goods"):
-        return
+@st.fragment
+@with_trading_client("📦 Trade Goods", "Please log in to view trade goods")
+def render_goods_section(client: OutpostAPIClient):
+    """
+    Render trade goods management section.
 
-    client = get_authenticated_client('trading', TRADING_FORT_API)
-    if not client:
-        st.error("Failed to get authenticated client")
-        return
+    Args:
+        client: Authenticated Trading Fort client
 
+    Educational Note:
+    The sections with widgets are Streamlit fragments: changing a goods
+    filter or clicking a button reruns only that section, not every tab
+    (and every API call) in the chapter.
+    """
     # Filters
     col1, col2, col3 = st.columns(3)
 
     with col1:
-        category_filter = st.selectbox(
+        st.selectbox(
             "Category",
-            ["All", "furs", "tools", "trade_goods", "provisions"],
+            _GOODS_CATEGORY_OPTIONS,
+            key="ch3_goods_category",
             help="Filter goods by category"
         )
 
     with col2:
-        quality_filter = st.selectbox(
+        st.selectbox(
             "Quality",
-            ["All", "poor", "fair", "good", "excellent"],
+            _GOODS_QUALITY_OPTIONS,
+            key="ch3_goods_quality",
             help="Filter goods by quality"
         )
 
     with col3:
-        if st.button("🔄 Refresh Goods", use_container_width=True):
-            st.rerun()
+        st.button("🔄 Refresh Goods", on_click=_refresh_goods, use_container_width=True)
 
     # Fetch goods
     with st.spinner("Loading trade goods..."):
         try:
-            category = None if category_filter == "All" else category_filter
-            quality = None if quality_filter == "All" else quality_filter
-
-            # Note: Need to add filter support to client method
-            goods = client.get_goods()
+            # The API applies the filters, so only matching goods are sent
+            goods = _cached_goods(client.base_url, client.token, *_goods_query())
 
             if goods:
-                # Convert to DataFrame
-                df = pd.DataFrame(goods)
-
-                # Apply filters
-                if category:
-                    df = df[df['category'] == category]
-                if quality:
-                    df = df[df['quality'] == quality]
+                # Convert to DataFrame (displayed columns only)
+                df = pd.DataFrame(goods, columns=_GOODS_COLS).astype(_GOODS_DTYPES)
 
                 st.success(f"Found {len(df)} goods")
 
                 # Display as table
-                st.dataframe(
-                    df[['name', 'category', 'quantity', 'unit', 'current_price', 'quality', 'origin']],
-                    use_container_width=True
-                )
+                st.dataframe(df, use_container_width=True)
 
                 # Detailed view
                 with st.expander("📊 Detailed View"):
+                    # Index the API records (which have every field) by name
+                    # once, so the selected good is a dict lookup rather than
+                    # a scan. setdefault keeps the first good with a given name.
+                    goods_by_name: Dict[str, Dict] = {}
+                    for good in goods:
+                        goods_by_name.setdefault(good['name'], good)
+
                     selected_good = st.selectbox(
                         "Select a good for details",
-                        df['name'].tolist()
+                        list(goods_by_name)
                     )
 
-                    good_details = df[df['name'] == selected_good].iloc[0].to_dict()
-                    st.json(good_details)
+                    st.json(goods_by_name[selected_good])
 
             else:
                 st.warning("No goods found")
 
         except Exception as e:
-            logger.error(f"Error fetching goods: {e}")
+            logger.error("Error fetching goods: %s", e)
             st.error(f"❌ Error: {str(e)}")
 
 
-def render_traders_section():
+@with_trading_client("👥 Traders Registry", "Please log in to view traders")
+def render_traders_section(client: OutpostAPIClient):
     """Render traders registry section."""
-    st.header("👥 Traders Registry")
-
-    if not require_authentication(TRADING_FORT_API, "Please log in to view traders"):
-        return
-
-    client = get_authenticated_client('trading', TRADING_FORT_API)
-    if not client:
-        st.error("Failed to get authenticated client")
-        return
-
     # Fetch traders
     with st.spinner("Loading traders..."):
         try:
-            traders = client.get_traders()
+            traders = _cached_traders(client.base_url, client.token)
 
             if traders:
-                df = pd.DataFrame(traders)
-
-                st.success(f"Found {len(df)} registered traders")
+                st.success(f"Found {len(traders)} registered traders")
 
-                # Summary metrics
+                # Summary metrics, counted straight from the API records;
+                # the DataFrame below is only needed for the table
+                type_counts = Counter(trader['trader_type'] for trader in traders)
+                top_reputation = Counter(trader['reputation'] for trader in traders).most_common(1)
                 col1, col2, col3, col4 = st.columns(4)
 
                 with col1:
-                    st.metric("Total Traders", len(df))
+                    st.metric("Total Traders", len(traders))
 
                 with col2:
-                    st.metric("Trappers", len(df[df['trader_type'] == 'trapper']))
+                    st.metric("Trappers", type_counts['trapper'])
 
                 with col3:
-                    st.metric("Merchants", len(df[df['trader_type'] == 'merchant']))
+                    st.metric("Merchants", type_counts['merchant'])
 
                 with col4:
-                    avg_reputation = df['reputation'].value_counts()
-                    st.metric("Most Common Rep", avg_reputation.index[0] if len(avg_reputation) > 0 else "N/A")
+                    st.metric("Most Common Rep", top_reputation[0][0] if top_reputation else "N/A")
 
                 # Display table
-                st.dataframe(
-                    df[['name', 'trader_type', 'reputation', 'total_trades', 'total_value']],
-                    use_container_width=True
-                )
+                df = pd.DataFrame(traders, columns=_TRADER_COLS).astype(_TRADER_DTYPES)
+                st.dataframe(df, use_container_width=True)
 
             else:
                 st.warning("No traders found")
 
         except Exception as e:
-            logger.error(f"Error fetching traders: {e}")
+            logger.error("Error fetching traders: %s", e)
             st.error(f"❌ Error: {str(e)}")
 
 
-def render_trades_section():
+@with_trading_client("💼 Trade Records", "Please log in to view trade records")
+def render_trades_section(client: OutpostAPIClient):
     """Render trade records section."""
-    st.header("💼 Trade Records")
-
-    if not require_authentication(TRADING_FORT_API, "Please log in to view trade records"):
-        return
-
-    client = get_authenticated_client('trading', TRADING_FORT_API)
-    if not client:
-        st.error("Failed to get authenticated client")
-        return
-
     # Trade summary
     st.subheader("📊 Trade Summary")
 
     with st.spinner("Loading trade summary..."):
         try:
-            summary = client.get_trade_summary()
-
-            if summary and 'summary_by_type' in summary:
-                col1, col2, col3 = st.columns(3)
-
-                for i, (trade_type, stats) in enumerate(summary['summary_by_type'].items()):
-                    with [col1, col2, col3][i % 3]:
-                        st.metric(
-                            f"{trade_type.capitalize()} Trades",
-                            stats['count'],
-                            delta=f"${stats['total_value']:.2f}"
-                        )
+            summary = _cached_trade_summary(client.base_url, client.token)
+
+            if summary and summary.get('summary_by_type'):
+                # One column per trade type, however many the fort reports
+                by_type = summary['summary_by_type'].items()
+                for col, (trade_type, stats) in zip(st.columns(len(by_type)), by_type):
+                    col.metric(
+                        f"{trade_type.capitalize()} Trades",
+                        stats['count'],
+                        delta=f"${stats['total_value']:.2f}"
+                    )
 
         except Exception as e:
-            logger.error(f"Error fetching trade summary: {e}")
+            logger.error("Error fetching trade summary: %s", e)
             st.error(f"❌ Error: {str(e)}")
 
     st.markdown("---")
@@ -387,37 +481,48 @@ def render_trades_section():
 
     with st.spinner("Loading trade records..."):
         try:
-            trades = client.get_trades()
+            trades = _cached_trades(client.base_url, client.token)
 
             if trades:
-                df = pd.DataFrame(trades)
-                st.success(f"Found {len(df)} trade records")
+                st.success(f"Found {len(trades)} trade records")
 
-                st.dataframe(
-                    df[['trade_type', 'quantity', 'price_per_unit', 'total_value', 'trade_date', 'payment_method']].head(20),
-                    use_container_width=True
-                )
+                # Only the 20 most recent trades are shown, so only those
+                # are converted to a DataFrame
+                df = pd.DataFrame(trades[:RECENT_TRADES_SHOWN], columns=_TRADE_COLS).astype(_TRADE_DTYPES)
+                st.dataframe(df, use_container_width=True)
 
             else:
                 st.warning("No trade records found")
 
         except Exception as e:
-            logger.error(f"Error fetching trades: {e}")
+            logger.error("Error fetching trades: %s", e)
             st.error(f"❌ Error: {str(e)}")
 
 
-def render_admin_section():
+@st.fragment
+@with_trading_client("📊 Admin Dashboard")
+def render_admin_section(client: OutpostAPIClient):
     """
     Render admin dashboard (protected section).
 
+    Args:
+        client: Authenticated Trading Fort client
+
     Educational Note:
     This demonstrates role-based access. Only users with appropriate
     permissions can view this section.
-    """
-    st.header("📊 Admin Dashboard")
 
-    if not require_authentication(TRADING_FORT_API):
-        return
+    When the stats button was clicked, the request is started before the
+    rest of the section is laid out and only awaited where the metrics
+    are drawn, so the network wait overlaps the rendering work.
+    """
+    # A clicked button's value is already in session state when the run
+    # starts, so the fetch can begin before the button is drawn
+    stats_future = None
+    if st.session_state.get('ch3_admin_stats_clicked'):
+        stats_future = _BACKGROUND.submit(
+            _with_script_ctx(_cached_admin_stats), client.base_url, client.token
+        )
 
     st.info("🔐 This section demonstrates protected endpoint access")
 
@@ -433,53 +538,188 @@ def render_admin_section():
     Try accessing this with different user roles to see permissions in action.
     """)
 
-    if st.button("🔓 Get Admin Statistics", use_container_width=True):
-        client = get_authenticated_client('trading', TRADING_FORT_API)
+    clicked = st.button(
+        "🔓 Get Admin Statistics", key='ch3_admin_stats_clicked', use_container_width=True
+    )
+    if clicked and stats_future is not None:
+        with st.spinner("Fetching admin statistics..."):
+            try:
+                stats = stats_future.result()
+
+                if stats:
+                    st.success(f"✅ Statistics retrieved by: {stats['requested_by']}")
+
+                    # Display statistics
+                    col1, col2 = st.columns(2)
+
+                    with col1:
+                        st.markdown("#### 📦 Inventory Stats")
+                        inv = stats['inventory']
+                        st.metric("Total Items", inv['total_items'])
+                        st.metric("Total Quantity", inv['total_quantity'])
+                        st.metric("Total Value", f"${inv['total_value']:.2f}")
+
+                    with col2:
+                        st.markdown("#### 💼 Trade Stats")
+                        trades = stats['catches']
+                        st.metric("Total Records", trades['total_records'])
+                        st.metric("Total Items Traded", trades['total_fish'])
+
+                    # System stats
+                    st.markdown("#### 💾 System Information")
+                    sys = stats['system']
+                    st.metric("Disk Usage", f"{sys['disk_percent_used']:.1f}%")
+                    st.progress(sys['disk_percent_used'] / 100)
+
+                    # Full JSON
+                    with st.expander("📋 Full Statistics JSON"):
+                        st.json(stats)
+
+                else:
+                    st.error("Failed to retrieve statistics")
+
+            except Exception as e:
+                logger.error("Error getting admin stats: %s", e)
+                if "401" in str(e) or "Unauthorized" in str(e):
+                    st.error("❌ Unauthorized: Your token may have expired or be invalid")
+                    st.info("💡 Try logging out and logging in again")
+                else:
+                    st.error(f"❌ Error: {str(e)}")
+
+
+# ============================================================================
+# Cached API Fetches
+# ============================================================================
+
+# Streamlit reruns the whole chapter on every widget interaction and tab
+# switch. These wrappers keep each response for a short TTL, keyed on the
+# API URL and the auth token (so users never see each other's data), and
+# let reruns read it from memory instead of calling the Trading Fort again.
+
+@st.cache_data(ttl=15, show_spinner=False)
+def _cached_health(api_url: str) -> Dict:
+    """Check API health (cached for 15 seconds, so repeat clicks are instant)."""
+    return require_result(get_api_client(api_url).health_check(), "health status")
 
-        if client:
-            with st.spinner("Fetching admin statistics..."):
-                try:
-                    stats = client.get_admin_stats()
 
-                    if stats:
-                        st.success(f"✅ Statistics retrieved by: {stats['requested_by']}")
+@st.cache_data(ttl=15, show_spinner=False)
+def _cached_status(api_url: str) -> Dict:
+    """Fetch outpost status (cached for 15 seconds)."""
+    return require_result(get_api_client(api_url).get_status(), "outpost status")
 
-                        # Display statistics
-                        col1, col2 = st.columns(2)
 
-                        with col1:
-                            st.markdown("#### 📦 Inventory Stats")
-                            inv = stats['inventory']
-                            st.metric("Total Items", inv['total_items'])
-                            st.metric("Total Quantity", inv['total_quantity'])
-                            st.metric("Total Value", f"${inv['total_value']:.2f}")
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_goods(
+    api_url: str,
+    token: str,
+    category: Optional[str] = None,
+    quality: Optional[str] = None,
+    refresh_count: int = 0
+) -> List[Dict]:
+    """
+    Fetch trade goods matching the filters (cached for 30 seconds per filter).
+
+    refresh_count is only part of the cache key: bumping it (see
+    _refresh_goods) forces a fresh fetch for this session alone.
+    """
+    return require_result(get_api_client(api_url, token).get_goods(category, quality), "trade goods")
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_traders(api_url: str, token: str) -> List[Dict]:
+    """Fetch registered traders (cached for 30 seconds)."""
+    return require_result(get_api_client(api_url, token).get_traders(), "traders")
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_trades(api_url: str, token: str) -> List[Dict]:
+    """Fetch trade records (cached for 30 seconds)."""
+    return require_result(get_api_client(api_url, token).get_trades(), "trade records")
 
-                        with col2:
-                            st.markdown("#### 💼 Trade Stats")
-                            trades = stats['catches']
-                            st.metric("Total Records", trades['total_records'])
-                            st.metric("Total Items Traded", trades['total_fish'])
 
-                        # System stats
-                        st.markdown("#### 💾 System Information")
-                        sys = stats['system']
-                        st.metric("Disk Usage", f"{sys['disk_percent_used']:.1f}%")
-                        st.progress(sys['disk_percent_used'] / 100)
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_trade_summary(api_url: str, token: str) -> Dict:
+    """Fetch trade summary statistics (cached for 30 seconds)."""
+    return require_result(
+        get_api_client(api_url, token).get_trade_summary(), "trade summary"
+    )
 
-                        # Full JSON
-                        with st.expander("📋 Full Statistics JSON"):
-                            st.json(stats)
 
-                    else:
-                        st.error("Failed to retrieve statistics")
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_admin_stats(api_url: str, token: str) -> Dict:
+    """Fetch admin statistics (cached for 30 seconds)."""
+    return require_result(
+        get_api_client(api_url, token).get_admin_stats(), "admin statistics"
+    )
 
-                except Exception as e:
-                    logger.error(f"Error getting admin stats: {e}")
-                    if "401" in str(e) or "Unauthorized" in str(e):
-                        st.error("❌ Unauthorized: Your token may have expired or be invalid")
-                        st.info("💡 Try logging out and logging in again")
-                    else:
-                        st.error(f"❌ Error: {str(e)}")
+
+def _prefetch_trading_data(api_url: str, token: str) -> None:
+    """
+    Warm the caches for the goods, traders, trades and summary tabs at once.
+
+    Educational Note:
+    Streamlit renders every tab on each run, so all four reads are needed
+    anyway. Issuing them from a thread pool makes the wait max(request)
+    instead of sum(request); each tab then reads its data from the cache.
+    Failures are not cached, so a tab whose fetch failed retries it and
+    shows the error itself.
+    """
+    # Worker threads can't read st.session_state, so the goods query is
+    # resolved here
+    fetches = (
+        (_cached_goods, (api_url, token, *_goods_query())),
+        (_cached_traders, (api_url, token)),
+        (_cached_trades, (api_url, token)),
+        (_cached_trade_summary, (api_url, token)),
+    )
+    with ThreadPoolExecutor(max_workers=len(fetches)) as executor:
+        for fetch, args in fetches:
+            executor.submit(_with_script_ctx(fetch), *args)
+
+
+def _with_script_ctx(fetch: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Wrap a cached fetch so it can run on a worker thread.
+
+    Educational Note:
+    st.cache_data and st.cache_resource look up the session's
+    ScriptRunContext, which only the script thread has; without it
+    Streamlit logs a "missing ScriptRunContext" warning. The wrapper
+    captures the context on the script thread and attaches it to
+    whichever worker runs the fetch. Pool threads are reused across
+    sessions, so it is attached afresh for every call.
+    """
+    ctx = get_script_run_ctx()
+
+    @functools.wraps(fetch)
+    def run(*args: Any) -> Any:
+        if ctx is not None:
+            add_script_run_ctx(threading.current_thread(), ctx)
+        return fetch(*args)
+    return run
+
+
+def _goods_query() -> Tuple[Optional[str], Optional[str], int]:
+    """Return the goods tab's (category, quality, refresh_count) for _cached_goods."""
+    category = st.session_state.get('ch3_goods_category', "All")
+    quality = st.session_state.get('ch3_goods_quality', "All")
+    return (
+        None if category == "All" else category,
+        None if quality == "All" else quality,
+        st.session_state.get('goods_refresh', 0),
+    )
+
+
+def _refresh_goods() -> None:
+    """
+    Button callback: change the goods cache key so the next fetch is fresh.
+
+    Educational Note:
+    Callbacks run before the script reruns, so the prefetch and the goods
+    tab both see the new key. Unlike _cached_goods.clear(), this leaves
+    other users' cached goods alone.
+    """
+    st.session_state['goods_refresh'] = st.session_state.get('goods_refresh', 0) + 1
 
 
 # ============================================================================
@@ -489,20 +729,18 @@ def render_admin_section():
 def get_goods():
     """Helper to fetch goods with error handling."""
     try:
-        client = get_authenticated_client('trading', TRADING_FORT_API)
-        if client:
-            return client.get_goods()
+        if is_authenticated():
+            return get_api_client(_trading_fort().url, st.session_state.auth_token).get_goods()
     except Exception as e:
-        logger.error(f"Error fetching goods: {e}")
+        logger.error("Error fetching goods: %s", e)
     return None
 
 
 def get_traders():
     """Helper to fetch traders with error handling."""
     try:
-        client = get_authenticated_client('trading', TRADING_FORT_API)
-        if client:
-            return client.get_traders()
+        if is_authenticated():
+            return get_api_client(_trading_fort().url, st.session_state.auth_token).get_traders()
     except Exception as e:
-        logger.error(f"Error fetching traders: {e}")
+        logger.error("Error fetching traders: %s", e)
     return None
@@ -17,20 +17,90 @@ cross-fort workflow demonstrations.
 """
 
 import streamlit as st
-from typing import Optional, Dict, Any, List
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Callable, Tuple
 import pandas as pd
 from src.api_client.client import OutpostAPIClient
 from src.ui.components.auth_components import (
     initialize_auth_session_state,
     is_authenticated,
     render_auth_status_sidebar,
-    get_authenticated_client,
     require_authentication
 )
+from src.ui.components.api_cache import get_api_client, require_result
+from src.ui.components.metrics import render_metrics
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Tab labels, built once at import instead of on every rerun
+_CH4_TABS = (
+    "📋 Overview",
+    "🦌 Game Animals",
+    "👥 Hunting Parties",
+    "🎯 Pelt Harvests",
+    "📊 Seasonal Reports",
+    "🔐 Admin Dashboard",
+    "🌐 Multi-Fort Analytics",
+)
+
+# Game animals table: columns shown and how they are labelled
+_ANIMAL_COLS = (
+    "species", "category", "typical_size", "population_status",
+    "pelt_value", "meat_yield", "best_season", "habitat",
+)
+_ANIMAL_COLUMN_CONFIG = {
+    "species": st.column_config.TextColumn("Species"),
+    "category": st.column_config.TextColumn("Category"),
+    "typical_size": st.column_config.TextColumn("Size"),
+    "population_status": st.column_config.TextColumn("Status"),
+    "pelt_value": st.column_config.NumberColumn("Pelt Value", format="$%.2f"),
+    "meat_yield": st.column_config.TextColumn("Meat Yield"),
+    "best_season": st.column_config.TextColumn("Best Season"),
+    "habitat": st.column_config.TextColumn("Habitat"),
+}
+
+# Seasonal report columns used by the trend charts
+_TREND_COLS = ("season", "year", "total_pelts", "total_value")
+
+# Harvest records fetched per page under Recent Harvests ("Load more" adds
+# another page)
+HARVEST_PAGE_SIZE = 20
+
+# Icon shown next to each hunting party, by party status
+STATUS_ICONS = {
+    "planning": "📋",
+    "active": "🔥",
+    "completed": "✅",
+    "cancelled": "❌",
+}
+
+# Star rating shown next to each pelt quality grade
+QUALITY_ICONS = {
+    "exceptional": "⭐⭐⭐⭐⭐",
+    "prime": "⭐⭐⭐⭐",
+    "good": "⭐⭐⭐",
+    "fair": "⭐⭐",
+    "poor": "⭐",
+}
+
+# Forts compared on the multi-fort tab: (name, default URL, primary activity)
+_FORTS = (
+    ("Fishing Fort", "http://localhost:8000", "Fish Catch Records"),
+    ("Trading Fort", "http://localhost:8001", "Trade Goods Management"),
+    ("Hunting Fort", "http://localhost:8002", "Pelt Harvests"),
+)
+
+# Longest the multi-fort tab waits for the slowest fort's status (seconds)
+FORT_STATUS_TIMEOUT = 5
+
+# Worker threads for the multi-fort status fan-out, started once and shared
+# by every click and session. Sized for two rounds of three forts, so a
+# fort still retrying from the last click doesn't hold up the next one.
+_STATUS_POOL = ThreadPoolExecutor(max_workers=6, thread_name_prefix="fort-status")
+
 
 def render_chapter4():
     """
@@ -63,50 +133,42 @@ def render_chapter4():
     initialize_auth_session_state()
 
     # Fort configuration
-    HUNTING_FORT_URL = st.text_input(
-        "Hunting Fort API URL",
-        value="http://localhost:8002",
-        help="URL of the Hunting Fort API"
-    )
+    col1, col2 = st.columns([4, 1])
 
-    # Create tabs for different sections
-    tabs = st.tabs([
-        "📋 Overview",
-        "🦌 Game Animals",
-        "👥 Hunting Parties",
-        "🎯 Pelt Harvests",
-        "📊 Seasonal Reports",
-        "🔐 Admin Dashboard",
-        "🌐 Multi-Fort Analytics"
-    ])
-
-    # Tab 1: Overview
-    with tabs[0]:
-        render_overview_tab(HUNTING_FORT_URL)
-
-    # Tab 2: Game Animals
-    with tabs[1]:
-        render_game_animals_tab(HUNTING_FORT_URL)
-
-    # Tab 3: Hunting Parties
-    with tabs[2]:
-        render_hunting_parties_tab(HUNTING_FORT_URL)
-
-    # Tab 4: Pelt Harvests
-    with tabs[3]:
-        render_pelt_harvests_tab(HUNTING_FORT_URL)
+    with col1:
+        HUNTING_FORT_URL = st.text_input(
+            "Hunting Fort API URL",
+            value="http://localhost:8002",
+            help="URL of the Hunting Fort API"
+        )
 
-    # Tab 5: Seasonal Reports
-    with tabs[4]:
-        render_seasonal_reports_tab(HUNTING_FORT_URL)
+    with col2:
+        st.button(
+            "🔄 Refresh",
+            on_click=_refresh_hunting_data,
+            args=(HUNTING_FORT_URL,),
+            help="Fetch fresh data from the Hunting Fort instead of the cache"
+        )
 
-    # Tab 6: Admin Dashboard
-    with tabs[5]:
-        render_admin_dashboard_tab(HUNTING_FORT_URL)
+    # Create tabs for different sections. on_change="rerun" makes the tabs
+    # track which one is selected, so only that tab's renderer runs and the
+    # hidden tabs make no API calls at all.
+    tabs = st.tabs(_CH4_TABS, key="ch4_active_tab", on_change="rerun")
+
+    tab_renderers = (
+        (render_overview_tab, (HUNTING_FORT_URL,)),
+        (render_game_animals_tab, (HUNTING_FORT_URL,)),
+        (render_hunting_parties_tab, (HUNTING_FORT_URL,)),
+        (render_pelt_harvests_tab, (HUNTING_FORT_URL,)),
+        (render_seasonal_reports_tab, (HUNTING_FORT_URL,)),
+        (render_admin_dashboard_tab, (HUNTING_FORT_URL,)),
+        (render_multi_fort_analytics_tab, ()),
+    )
 
-    # Tab 7: Multi-Fort Analytics
-    with tabs[6]:
-        render_multi_fort_analytics_tab()
+    for tab, (render, args) in zip(tabs, tab_renderers):
+        if tab.open:
+            with tab:
+                render(*args)
 
 
 def render_overview_tab(api_url: str):
@@ -131,26 +193,20 @@ def render_overview_tab(api_url: str):
     st.subheader("Fort Status")
 
     try:
-        client = OutpostAPIClient(api_url)
-        status = client.get_status()
+        status = _fetch_or_none(_cached_status, api_url)
 
         if status:
-            col1, col2 = st.columns(2)
-
-            with col1:
-                st.write(f"**Fort Name:** {status.get('fort_name', 'Unknown')}")
-                st.write(f"**Last Updated:** {status.get('timestamp', 'Unknown')}")
-
-            with col2:
-                stats = status.get('statistics', {})
-                st.metric("Tracked Species", stats.get('tracked_species', 0))
-                st.metric("Active Parties", stats.get('active_parties', 0))
-
-            col3, col4 = st.columns(2)
-            with col3:
-                st.metric("Pelts This Season", stats.get('pelts_this_season', 0))
-            with col4:
-                st.metric("Season Value", f"${stats.get('value_this_season', 0):.2f}")
+            st.write(f"**Fort Name:** {status.get('fort_name', 'Unknown')}")
+            st.write(f"**Last Updated:** {status.get('timestamp', 'Unknown')}")
+
+            # All four metrics share one row of columns
+            stats = status.get('statistics', {})
+            render_metrics((
+                ("Tracked Species", stats.get('tracked_species', 0)),
+                ("Active Parties", stats.get('active_parties', 0)),
+                ("Pelts This Season", stats.get('pelts_this_season', 0)),
+                ("Season Value", f"${stats.get('value_this_season', 0):.2f}"),
+            ))
 
             st.success("✓ Hunting Fort API is operational")
         else:
@@ -161,6 +217,7 @@ def render_overview_tab(api_url: str):
         st.info("Make sure to start the API: `uvicorn raspberry_pi.api.hunting_fort:app --host 0.0.0.0 --port 8002 --reload`")
 
 
+@st.fragment
 def render_game_animals_tab(api_url: str):
     """Render the game animals tab."""
     st.header("🦌 Game Animals")
@@ -171,8 +228,6 @@ def render_game_animals_tab(api_url: str):
     """)
 
     try:
-        client = OutpostAPIClient(api_url)
-
         # Filters
         col1, col2 = st.columns(2)
 
@@ -191,58 +246,69 @@ def render_game_animals_tab(api_url: str):
             )
 
         # Fetch animals
-        params = {}
-        if category_filter != "All":
-            params['category'] = category_filter
-        if status_filter != "All":
-            params['status'] = status_filter
-
-        # Make request with filters
-        if params:
-            # Build endpoint with query params
-            query_string = "&".join([f"{k}={v}" for k, v in params.items()])
-            animals = client._make_request('GET', f'/animals?{query_string}')
-        else:
-            animals = client._make_request('GET', '/animals')
+        animals = _fetch_or_none(
+            _cached_animals,
+            api_url,
+            None if category_filter == "All" else category_filter,
+            None if status_filter == "All" else status_filter
+        )
 
         if animals:
             st.write(f"**Found {len(animals)} species**")
 
-            # Convert to DataFrame for display
-            df = pd.DataFrame(animals)
+            # Convert to DataFrame for display. One table is a single
+            # element for the browser, where an expander per species was
+            # several widgets each.
+            df = pd.DataFrame(animals, columns=_ANIMAL_COLS)
 
-            # Display as cards
+            st.dataframe(
+                df,
+                column_config=_ANIMAL_COLUMN_CONFIG,
+                use_container_width=True,
+                hide_index=True
+            )
+
+            # Details card for the selected species only. setdefault keeps
+            # the first record with a given name.
+            animals_by_species: Dict[str, Dict] = {}
             for animal in animals:
-                with st.expander(f"**{animal['species']}** ({animal['category']})"):
-                    col1, col2, col3 = st.columns(3)
+                animals_by_species.setdefault(animal['species'], animal)
 
-                    with col1:
-                        st.write(f"**Size:** {animal['typical_size']}")
-                        st.write(f"**Status:** {animal['population_status']}")
+            selected_species = st.selectbox(
+                "Inspect details",
+                list(animals_by_species),
+                key="ch4_animal_details"
+            )
 
-                    with col2:
-                        st.write(f"**Pelt Value:** ${animal.get('pelt_value', 0):.2f}")
-                        st.write(f"**Meat Yield:** {animal.get('meat_yield', 'N/A')}")
+            animal = animals_by_species[selected_species]
+            with st.expander(f"**{animal['species']}** ({animal['category']})", expanded=True):
+                col1, col2, col3 = st.columns(3)
 
-                    with col3:
-                        st.write(f"**Best Season:** {animal['best_season']}")
-                        st.write(f"**Habitat:** {animal.get('habitat', 'Unknown')}")
+                with col1:
+                    st.write(f"**Size:** {animal['typical_size']}")
+                    st.write(f"**Status:** {animal['population_status']}")
 
-                    if animal.get('notes'):
-                        st.info(f"📝 {animal['notes']}")
+                with col2:
+                    st.write(f"**Pelt Value:** ${animal.get('pelt_value', 0):.2f}")
+                    st.write(f"**Meat Yield:** {animal.get('meat_yield', 'N/A')}")
+
+                with col3:
+                    st.write(f"**Best Season:** {animal['best_season']}")
+                    st.write(f"**Habitat:** {animal.get('habitat', 'Unknown')}")
+
+                if animal.get('notes'):
+                    st.info(f"📝 {animal['notes']}")
 
             # Summary statistics
             st.subheader("Summary Statistics")
-            col1, col2, col3 = st.columns(3)
-
-            with col1:
-                st.metric("Total Species", len(animals))
-            with col2:
-                avg_value = sum(a.get('pelt_value', 0) or 0 for a in animals) / len(animals) if animals else 0
-                st.metric("Avg Pelt Value", f"${avg_value:.2f}")
-            with col3:
-                categories = set(a['category'] for a in animals)
-                st.metric("Categories", len(categories))
+            # Computed on the DataFrame columns, so pandas does the work
+            # instead of a Python loop over the records
+            avg_value = df['pelt_value'].fillna(0).mean()
+            render_metrics((
+                ("Total Species", len(df)),
+                ("Avg Pelt Value", f"${avg_value:.2f}"),
+                ("Categories", df['category'].nunique()),
+            ))
 
         else:
             st.info("No animals found with the selected filters")
@@ -252,6 +318,7 @@ def render_game_animals_tab(api_url: str):
         logger.error(f"Game animals error: {e}")
 
 
+@st.fragment
 def render_hunting_parties_tab(api_url: str):
     """Render the hunting parties tab."""
     st.header("👥 Hunting Parties")
@@ -261,8 +328,6 @@ def render_hunting_parties_tab(api_url: str):
     """)
 
     try:
-        client = OutpostAPIClient(api_url)
-
         # Status filter
         status_filter = st.selectbox(
             "Filter by Status",
@@ -271,34 +336,26 @@ def render_hunting_parties_tab(api_url: str):
         )
 
         # Fetch parties
-        if status_filter != "All":
-            parties = client._make_request('GET', f'/parties?status={status_filter}')
-        else:
-            parties = client._make_request('GET', '/parties')
+        parties = _fetch_or_none(
+            _cached_parties, api_url, None if status_filter == "All" else status_filter
+        )
 
         if parties:
             st.write(f"**Found {len(parties)} hunting parties**")
 
-            # Group by status
-            status_groups = {}
+            # Group by status (first-seen order, one lookup per party)
+            status_groups: Dict[str, List[Dict]] = defaultdict(list)
             for party in parties:
-                status = party['status']
-                if status not in status_groups:
-                    status_groups[status] = []
-                status_groups[status].append(party)
+                status_groups[party['status']].append(party)
 
             # Display by status
             for status, group in status_groups.items():
                 st.subheader(f"{status.capitalize()} Parties ({len(group)})")
 
-                for party in group:
-                    status_icon = {
-                        "planning": "📋",
-                        "active": "🔥",
-                        "completed": "✅",
-                        "cancelled": "❌"
-                    }.get(status, "📝")
+                # Every party in the group shares the status, so one lookup
+                status_icon = STATUS_ICONS.get(status, "📝")
 
+                for party in group:
                     with st.expander(f"{status_icon} {party['leader_name']} - {party.get('target_species', 'Mixed')} ({party['start_date']})"):
                         col1, col2, col3 = st.columns(3)
 
@@ -341,22 +398,20 @@ def render_pelt_harvests_tab(api_url: str):
     """)
 
     try:
-        client = OutpostAPIClient(api_url)
-
-        # Get harvest summary first
-        summary = client._make_request('GET', '/harvests/summary')
+        # The summary and the first page of records (the API applies the
+        # limit) are fetched together in one round of requests
+        summary, harvests = _fetch_or_none(
+            _cached_harvest_data, api_url, HARVEST_PAGE_SIZE
+        ) or (None, None)
 
         if summary:
             st.subheader("Harvest Summary")
 
-            col1, col2, col3 = st.columns(3)
-
-            with col1:
-                st.metric("Total Records", summary.get('total_records', 0))
-            with col2:
-                st.metric("Total Pelts", summary.get('total_pelts', 0))
-            with col3:
-                st.metric("Total Value", f"${summary.get('total_value', 0):.2f}")
+            render_metrics((
+                ("Total Records", summary.get('total_records', 0)),
+                ("Total Pelts", summary.get('total_pelts', 0)),
+                ("Total Value", f"${summary.get('total_value', 0):.2f}"),
+            ))
 
             # By species breakdown
             st.subheader("By Species")
@@ -377,18 +432,21 @@ def render_pelt_harvests_tab(api_url: str):
         # Recent harvests
         st.subheader("Recent Harvests")
 
-        harvests = client._make_request('GET', '/harvests')
+        # Pages loaded so far; back to one page when the fort changes
+        if st.session_state.get("ch4_harvest_source") != api_url:
+            st.session_state.ch4_harvest_source = api_url
+            st.session_state.ch4_harvest_pages = 1
 
         if harvests:
-            # Show first 20
-            for harvest in harvests[:20]:
-                quality_icon = {
-                    "exceptional": "⭐⭐⭐⭐⭐",
-                    "prime": "⭐⭐⭐⭐",
-                    "good": "⭐⭐⭐",
-                    "fair": "⭐⭐",
-                    "poor": "⭐"
-                }.get(harvest['quality'], "")
+            # Later pages are only requested once "Load more" asks for them
+            for page in range(1, st.session_state.ch4_harvest_pages):
+                more = _fetch_or_none(_cached_harvest_page, api_url, page * HARVEST_PAGE_SIZE)
+                if not more:
+                    break
+                harvests = harvests + more
+
+            for harvest in harvests:
+                quality_icon = QUALITY_ICONS.get(harvest['quality'], "")
 
                 with st.expander(f"{harvest['species']} x{harvest['quantity']} - {harvest['quality']} {quality_icon} (${harvest['estimated_value']:.2f})"):
                     col1, col2 = st.columns(2)
@@ -406,6 +464,11 @@ def render_pelt_harvests_tab(api_url: str):
                     if harvest.get('condition'):
                         st.info(f"Condition: {harvest['condition']}")
 
+            total = summary.get('total_records', 0) if summary else 0
+            if len(harvests) < total:
+                st.caption(f"Showing {len(harvests)} of {total} harvests")
+                st.button("⬇️ Load more", on_click=_load_more_harvests)
+
         else:
             st.info("No harvest records found")
 
@@ -423,9 +486,7 @@ def render_seasonal_reports_tab(api_url: str):
     """)
 
     try:
-        client = OutpostAPIClient(api_url)
-
-        reports = client._make_request('GET', '/reports')
+        reports = _fetch_or_none(_cached_reports, api_url)
 
         if reports:
             st.write(f"**Found {len(reports)} seasonal reports**")
@@ -455,17 +516,16 @@ def render_seasonal_reports_tab(api_url: str):
             if len(reports) > 1:
                 st.subheader("Trends Over Time")
 
-                df = pd.DataFrame(reports)
-                df = df.sort_values('year')
+                df = _trend_frame(reports)
 
                 col1, col2 = st.columns(2)
 
                 with col1:
-                    st.line_chart(df.set_index('season')['total_pelts'])
+                    st.line_chart(df['total_pelts'])
                     st.caption("Total Pelts by Season")
 
                 with col2:
-                    st.line_chart(df.set_index('season')['total_value'])
+                    st.line_chart(df['total_value'])
                     st.caption("Total Value by Season")
 
         else:
@@ -476,12 +536,28 @@ def render_seasonal_reports_tab(api_url: str):
         logger.error(f"Seasonal reports error: {e}")
 
 
+def _resolve_admin_client(api_url: str) -> Optional[OutpostAPIClient]:
+    """
+    Get the logged-in user's client for the fort, or prompt for login.
+
+    Educational Note:
+    A single authentication check decides the whole protected tab. A
+    logged-out user sees the warning and login form and gets None back; a
+    logged-in user gets the shared client for their token from get_api_client,
+    which is reused across reruns rather than looked up and re-checked.
+    """
+    if not require_authentication(api_url):
+        return None
+    return get_api_client(api_url, st.session_state.auth_token)
+
+
 def render_admin_dashboard_tab(api_url: str):
     """Render the admin dashboard tab (requires authentication)."""
     st.header("🔐 Admin Dashboard")
 
-    # Check authentication
-    if not require_authentication():
+    # Check authentication and get the user's client in one step
+    client = _resolve_admin_client(api_url)
+    if client is None:
         return
 
     st.markdown("""
@@ -490,12 +566,6 @@ def render_admin_dashboard_tab(api_url: str):
     """)
 
     try:
-        client = get_authenticated_client(api_url, "hunting_fort")
-
-        if not client or not client.is_authenticated:
-            st.warning("Please log in to access admin statistics")
-            return
-
         # Get admin stats
         stats = client._make_request('GET', '/admin/statistics')
 
@@ -508,17 +578,24 @@ def render_admin_dashboard_tab(api_url: str):
 
             st.metric("Total Species", animal_stats.get('total_species', 0))
 
+            # Each breakdown is one table rather than one element per row
             col1, col2 = st.columns(2)
 
             with col1:
                 st.write("**By Category:**")
-                for item in animal_stats.get('by_category', []):
-                    st.write(f"- {item['category']}: {item['count']}")
+                st.dataframe(
+                    pd.DataFrame(animal_stats.get('by_category', [])),
+                    use_container_width=True,
+                    hide_index=True
+                )
 
             with col2:
                 st.write("**By Population Status:**")
-                for item in animal_stats.get('by_status', []):
-                    st.write(f"- {item['population_status']}: {item['count']}")
+                st.dataframe(
+                    pd.DataFrame(animal_stats.get('by_status', [])),
+                    use_container_width=True,
+                    hide_index=True
+                )
 
             st.divider()
 
@@ -526,15 +603,17 @@ def render_admin_dashboard_tab(api_url: str):
             st.subheader("👥 Hunting Parties Statistics")
             party_stats = stats.get('parties', {})
 
-            col1, col2 = st.columns(2)
-            with col1:
-                st.metric("Total Parties", party_stats.get('total_parties', 0))
-            with col2:
-                st.metric("Active Parties", party_stats.get('active_parties', 0))
+            render_metrics((
+                ("Total Parties", party_stats.get('total_parties', 0)),
+                ("Active Parties", party_stats.get('active_parties', 0)),
+            ))
 
             st.write("**By Status:**")
-            for item in party_stats.get('by_status', []):
-                st.write(f"- {item['status']}: {item['count']}")
+            st.dataframe(
+                pd.DataFrame(party_stats.get('by_status', [])),
+                use_container_width=True,
+                hide_index=True
+            )
 
             st.divider()
 
@@ -542,13 +621,11 @@ def render_admin_dashboard_tab(api_url: str):
             st.subheader("🎯 Harvest Statistics")
             harvest_stats = stats.get('harvests', {})
 
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Total Records", harvest_stats.get('total_records', 0))
-            with col2:
-                st.metric("Total Pelts", harvest_stats.get('total_pelts', 0))
-            with col3:
-                st.metric("Total Value", f"${harvest_stats.get('total_value', 0):.2f}")
+            render_metrics((
+                ("Total Records", harvest_stats.get('total_records', 0)),
+                ("Total Pelts", harvest_stats.get('total_pelts', 0)),
+                ("Total Value", f"${harvest_stats.get('total_value', 0):.2f}"),
+            ))
 
         else:
             st.error("Could not retrieve admin statistics")
@@ -558,6 +635,7 @@ def render_admin_dashboard_tab(api_url: str):
         logger.error(f"Admin stats error: {e}")
 
 
+@st.fragment
 def render_multi_fort_analytics_tab():
     """Render multi-fort analytics comparing all three forts."""
     st.header("🌐 Multi-Fort Analytics")
@@ -575,71 +653,212 @@ def render_multi_fort_analytics_tab():
     """)
 
     # Fort URLs
-    col1, col2, col3 = st.columns(3)
-
-    with col1:
-        fishing_url = st.text_input("Fishing Fort URL", "http://localhost:8000")
-    with col2:
-        trading_url = st.text_input("Trading Fort URL", "http://localhost:8001")
-    with col3:
-        hunting_url = st.text_input("Hunting Fort URL", "http://localhost:8002")
+    fort_urls = [
+        col.text_input(f"{name} URL", default_url)
+        for col, (name, default_url, _) in zip(st.columns(len(_FORTS)), _FORTS)
+    ]
 
     if st.button("🔄 Aggregate Fort Data"):
         with st.spinner("Gathering data from all forts..."):
             try:
-                # Create clients
-                fishing_client = OutpostAPIClient(fishing_url)
-                trading_client = OutpostAPIClient(trading_url)
-                hunting_client = OutpostAPIClient(hunting_url)
-
-                # Get status from all forts
-                fishing_status = fishing_client.get_status()
-                trading_status = trading_client.get_status()
-                hunting_status = hunting_client.get_status()
+                # Get status from all forts at once
+                statuses = _gather_statuses({
+                    name: get_api_client(url) for (name, _, _), url in zip(_FORTS, fort_urls)
+                })
 
                 st.success("✓ Successfully connected to all three forts!")
 
                 # Display comparison
                 st.subheader("Fort Comparison")
 
-                comparison_df = pd.DataFrame([
-                    {
-                        "Fort": "Fishing Fort",
-                        "Status": "✅ Online" if fishing_status else "❌ Offline",
-                        "Primary Activity": "Fish Catch Records"
-                    },
-                    {
-                        "Fort": "Trading Fort",
-                        "Status": "✅ Online" if trading_status else "❌ Offline",
-                        "Primary Activity": "Trade Goods Management"
-                    },
-                    {
-                        "Fort": "Hunting Fort",
-                        "Status": "✅ Online" if hunting_status else "❌ Offline",
-                        "Primary Activity": "Pelt Harvests"
-                    }
-                ])
+                # Built column by column, straight from the gathered statuses
+                comparison_df = pd.DataFrame({
+                    "Fort": [name for name, _, _ in _FORTS],
+                    "Status": [
+                        "✅ Online" if statuses[name] else "❌ Offline"
+                        for name, _, _ in _FORTS
+                    ],
+                    "Primary Activity": [activity for _, _, activity in _FORTS],
+                })
 
                 st.dataframe(comparison_df, use_container_width=True)
 
                 # Show combined metrics
                 st.subheader("Combined Network Statistics")
 
-                if all([fishing_status, trading_status, hunting_status]):
-                    col1, col2, col3 = st.columns(3)
+                if all(statuses.values()):
+                    # Example: could aggregate inventory counts, etc.
+                    render_metrics((
+                        ("Total Forts", len(_FORTS)),
+                        ("Network Health", "100%"),
+                        ("Data Sources", "All Connected"),
+                    ))
+
+                    # Celebrate the network coming fully online, not every
+                    # re-check of it; the flag resets once a fort is offline
+                    if not st.session_state.get('ch4_network_celebrated'):
+                        st.balloons()
+                        st.session_state.ch4_network_celebrated = True
+                else:
+                    st.session_state.ch4_network_celebrated = False
 
-                    with col1:
-                        st.metric("Total Forts", 3)
+            except Exception as e:
+                st.error(f"Error aggregating fort data: {str(e)}")
+                logger.error(f"Multi-fort analytics error: {e}")
 
-                    with col2:
-                        # Example: could aggregate inventory counts, etc.
-                        st.metric("Network Health", "100%")
 
-                    with col3:
-                        st.metric("Data Sources", "All Connected")
+def _gather_statuses(
+    clients: Dict[str, OutpostAPIClient],
+    timeout: float = FORT_STATUS_TIMEOUT
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Fetch every fort's status concurrently.
 
-                    st.balloons()
+    Educational Note:
+    The three forts are independent machines, so there is no reason to wait
+    for one to answer before asking the next. Each request runs in its own
+    thread and the total wait is the slowest fort rather than the sum of all
+    three. A fort that fails or misses the shared deadline is reported as
+    None (offline) without holding up the others; its request finishes in
+    the background.
+
+    The threads come from the module's long-lived _STATUS_POOL, so a click
+    doesn't pay to start (and later tear down) a thread per fort.
+    """
+    futures = {name: _STATUS_POOL.submit(client.get_status) for name, client in clients.items()}
+    deadline = time.monotonic() + timeout
 
-            except Exception as e:
-                st.error(f"Error aggregating fort data: {str(e)}")
-                logger.error(f"Multi-fort analytics error: {e}")
+    statuses = {}
+    for name, future in futures.items():
+        try:
+            statuses[name] = future.result(timeout=max(0, deadline - time.monotonic()))
+        except Exception as e:
+            logger.warning("No status from %s: %r", name, e)
+            statuses[name] = None
+
+    return statuses
+
+
+# ============================================================================
+# Cached API Fetches
+# ============================================================================
+
+# Streamlit reruns the whole chapter on every widget interaction, so without
+# these wrappers changing a filter on one tab would re-fetch the data for
+# every other tab too. Each response is kept for a short TTL, keyed on the
+# API URL and the filters, and reruns read it from memory instead.
+
+def _fetch_or_none(fetch: Callable[..., Any], *args: Any) -> Optional[Any]:
+    """
+    Call a cached fetch, returning None (like the client) if it failed.
+
+    The session's refresh count (see _refresh_hunting_data) is passed
+    along as part of the cache key.
+    """
+    try:
+        return fetch(*args, refresh_count=st.session_state.get('ch4_refresh', 0))
+    except ConnectionError:
+        return None
+
+
+@st.cache_data(ttl=15, show_spinner=False)
+def _cached_status(api_url: str, refresh_count: int = 0) -> Dict:
+    """Fetch fort status (cached for 15 seconds)."""
+    return require_result(get_api_client(api_url).get_status(), "fort status")
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_animals(
+    api_url: str,
+    category: Optional[str] = None,
+    status: Optional[str] = None,
+    refresh_count: int = 0
+) -> List[Dict]:
+    """Fetch game animals matching the filters (cached for 30 seconds per filter)."""
+    return require_result(get_api_client(api_url).get_animals(category, status), "game animals")
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_parties(
+    api_url: str,
+    status: Optional[str] = None,
+    refresh_count: int = 0
+) -> List[Dict]:
+    """Fetch hunting parties, optionally by status (cached for 30 seconds)."""
+    return require_result(get_api_client(api_url).get_hunting_parties(status), "hunting parties")
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_harvest_data(
+    api_url: str,
+    limit: int,
+    refresh_count: int = 0
+) -> Tuple[Dict, List[Dict]]:
+    """
+    Fetch the harvest summary and the newest harvest records (cached for 30 seconds).
+
+    Both requests are sent at once with batch_get, so the tab waits for the
+    slower of the two rather than both in turn. Nothing is cached unless
+    both succeed.
+    """
+    results = get_api_client(api_url).batch_get(
+        ['/harvests/summary', '/harvests'],
+        params={'/harvests': {'limit': limit}}
+    )
+    return (
+        require_result(results['/harvests/summary'], "harvest summary"),
+        require_result(results['/harvests'], "pelt harvests"),
+    )
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_reports(api_url: str, refresh_count: int = 0) -> List[Dict]:
+    """Fetch seasonal reports (cached for 30 seconds)."""
+    return require_result(
+        get_api_client(api_url)._make_request('GET', '/reports'), "seasonal reports"
+    )
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _trend_frame(reports: List[Dict]) -> pd.DataFrame:
+    """
+    Build the seasonal trend chart data: charted columns only, sorted by
+    year and indexed by season.
+
+    Educational Note:
+    st.cache_data keys on a hash of the reports themselves, so reruns with
+    the same reports reuse the prepared frame instead of repeating the
+    pandas work; new or changed reports get a fresh one.
+    """
+    return (
+        pd.DataFrame(reports, columns=_TREND_COLS)
+        .sort_values('year')
+        .set_index('season')
+    )
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_harvest_page(api_url: str, offset: int, refresh_count: int = 0) -> List[Dict]:
+    """Fetch one later page of harvest records (cached for 30 seconds per page)."""
+    return require_result(
+        get_api_client(api_url).get_harvests(HARVEST_PAGE_SIZE, offset), "pelt harvests"
+    )
+
+
+def _load_more_harvests() -> None:
+    """Button callback: show one more page of harvest records."""
+    st.session_state.ch4_harvest_pages += 1
+
+
+def _refresh_hunting_data(api_url: str) -> None:
+    """
+    Button callback: change this session's cache key so the next run re-fetches.
+
+    Educational Note:
+    Every cached fetch takes the session's refresh count as an argument,
+    so bumping it misses the cache for this user alone. Calling .clear()
+    on the fetches would throw away every other session's cached data too.
+    """
+    # The shared client keeps its own short-lived /status cache
+    get_api_client(api_url).invalidate_cache()
+    st.session_state['ch4_refresh'] = st.session_state.get('ch4_refresh', 0) + 1
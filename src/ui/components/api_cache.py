@@ -0,0 +1,63 @@
+"""
+Shared API Clients for Cached Fort Fetches
+
+This module provides the pieces every chapter's cached API fetches are
+built from: one long-lived client per fort URL and token, and a check that
+keeps failed requests out of Streamlit's data cache.
+
+Educational Note:
+Streamlit reruns a chapter on every widget interaction. Chapters wrap
+their API calls in st.cache_data so reruns read responses from memory;
+these helpers make sure the client behind those calls is reused and that
+only successful responses are ever cached.
+"""
+
+import streamlit as st
+from typing import Optional, Any
+
+from src.api_client.client import OutpostAPIClient
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def get_api_client(api_url: str, token: Optional[str] = None) -> OutpostAPIClient:
+    """
+    Get the shared client for a fort's API URL and auth token.
+
+    Args:
+        api_url: Base URL of the fort's API
+        token: Auth token, or None for the public endpoints
+
+    Returns:
+        OutpostAPIClient shared by every rerun that asks for the same pair
+
+    Educational Note:
+    st.cache_resource keeps the live client object (and its requests.Session)
+    across reruns instead of pickling a copy like st.cache_data, so pooled
+    keep-alive connections are reused rather than rebuilt on every call.
+    Keying on the token gives each logged-in user their own client.
+    """
+    return OutpostAPIClient(api_url, token=token)
+
+
+def require_result(result: Optional[Any], what: str) -> Any:
+    """
+    Raise if the client reported a failed request.
+
+    Args:
+        result: Value returned by an OutpostAPIClient method
+        what: Description of the data, for the error message
+
+    Returns:
+        result, unchanged
+
+    Raises:
+        ConnectionError: If result is None
+
+    Educational Note:
+    The client returns None when a request fails. Raising instead of
+    returning it means st.cache_data never stores the failure, so the
+    next rerun tries the API again rather than showing a cached error.
+    """
+    if result is None:
+        raise ConnectionError(f"Failed to fetch {what}")
+    return result
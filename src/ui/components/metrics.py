@@ -0,0 +1,25 @@
+"""
+Metric Display Components
+
+This module provides the row-of-metrics layout the chapters use for fort
+summaries and inventory totals.
+
+Educational Note:
+A row of st.metric values is the dashboard's most common summary. Building
+it from a list of (label, value) pairs keeps each chapter's call site down
+to the numbers it wants to show.
+"""
+
+import streamlit as st
+from typing import Any, Sequence, Tuple
+
+
+def render_metrics(metrics: Sequence[Tuple[str, Any]]) -> None:
+    """
+    Render (label, value) pairs as a row of st.metric columns.
+
+    Args:
+        metrics: Label and value for each metric, left to right
+    """
+    for col, (label, value) in zip(st.columns(len(metrics)), metrics):
+        col.metric(label, value)
@@ -17,7 +17,9 @@ import sys
 from pathlib import Path
 
 # Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+_PROJECT_ROOT = str(Path(__file__).parents[3])
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
 from src.models.outpost import Outpost
 from src.ssh_module.executor import SSHExecutor, SSHResult
@@ -188,7 +190,11 @@ def execute_ssh_command(
                 st.error(f"❌ Failed to connect to {outpost.name}")
                 st.session_state[f"ssh_output_{outpost.name}"] = {
                     "success": False,
-                    "error": "Connection failed. Check credentials and network connectivity."
+                    "error": (
+                        "Connection failed. Check credentials, network connectivity, "
+                        "and that the outpost's host key has been provisioned "
+                        "(see provision_host_key)."
+                    )
                 }
                 return
 
@@ -23,13 +23,22 @@ import requests
 from datetime import datetime, timedelta
 import time
 
-from src.api_client.client import OutpostAPIClient
+from src.api_client.client import INVENTORY_IDS_PER_REQUEST, OutpostAPIClient
 
 
 # ============================================================================
 # Test Fixtures
 # ============================================================================
 
+class _PatchableClient(OutpostAPIClient):
+    """
+    OutpostAPIClient with an instance __dict__, so tests can patch its methods.
+
+    OutpostAPIClient declares __slots__; a subclass without them gets a
+    __dict__ back, leaving the production class unchanged.
+    """
+
+
 @pytest.fixture
 def api_url():
     """Base API URL for testing."""
@@ -39,13 +48,13 @@ def api_url():
 @pytest.fixture
 def client(api_url):
     """Create a basic API client for testing."""
-    return OutpostAPIClient(api_url)
+    return _PatchableClient(api_url)
 
 
 @pytest.fixture
 def authenticated_client(api_url):
     """Create an authenticated API client for testing."""
-    client = OutpostAPIClient(api_url)
+    client = _PatchableClient(api_url)
     client.set_token("test_token_12345")
     return client
 
@@ -56,7 +65,7 @@ def mock_response():
     response = Mock()
     response.status_code = 200
     response.headers = {'Content-Type': 'application/json'}
-    response.json.return_value = {"message": "success"}
+    response.content = b'{"message": "success"}'
     return response
 
 
@@ -104,6 +113,24 @@ def test_client_initialization_custom_retry_config(api_url):
     assert client.retry_backoff_factor == 1.5
 
 
+def test_shared_session_keeps_tokens_per_client():
+    """
+    Test clients sharing a Session don't leak tokens to each other.
+
+    Educational Note:
+    With a shared Session the token must travel on each request, not on
+    the session headers every client uses.
+    """
+    session = requests.Session()
+    fishing = OutpostAPIClient("http://fishing:8000", token="fish_token", session=session)
+    trading = OutpostAPIClient("http://trading:8000", session=session)
+
+    assert fishing.session is trading.session
+    assert 'Authorization' not in session.headers
+    assert fishing._request_headers() == {'Authorization': 'Bearer fish_token'}
+    assert trading._request_headers() is None
+
+
 # ============================================================================
 # Authentication Tests
 # ============================================================================
@@ -157,7 +184,8 @@ def test_login_success(client):
         assert result is True
         assert client.is_authenticated
         assert client.token == "new_token_xyz"
-        assert client._token_expires_at is not None
+        assert client._token_expires_monotonic is not None
+        assert not client.is_token_expired
 
 
 def test_login_failure(client):
@@ -286,7 +314,7 @@ def test_retry_on_connection_error(client):
     This test verifies the complete retry flow: attempt, fail,
     wait, retry, eventually succeed or give up.
     """
-    with patch.object(client.session, 'request') as mock_request:
+    with patch.object(client.session, 'send') as mock_request:
         # First two attempts fail, third succeeds
         mock_request.side_effect = [
             requests.exceptions.ConnectionError("Connection failed"),
@@ -305,6 +333,10 @@ def test_retry_on_connection_error(client):
         assert response.status_code == 200
         assert mock_request.call_count == 3
 
+        # The request is prepared once and re-sent on every attempt
+        sent = [call[0][0] for call in mock_request.call_args_list]
+        assert sent[0] is sent[1] is sent[2]
+
 
 def test_retry_exhaustion(client):
     """
@@ -314,7 +346,7 @@ def test_retry_exhaustion(client):
     Infinite retries would hang the application. After max_retries,
     the error should be raised.
     """
-    with patch.object(client.session, 'request') as mock_request:
+    with patch.object(client.session, 'send') as mock_request:
         # All attempts fail
         mock_request.side_effect = requests.exceptions.ConnectionError("Connection failed")
 
@@ -338,7 +370,7 @@ def test_no_retry_on_client_error(client):
     Client errors indicate problems with the request that won't
     be fixed by retrying, so we fail fast.
     """
-    with patch.object(client.session, 'request') as mock_request:
+    with patch.object(client.session, 'send') as mock_request:
         response = Mock()
         response.status_code = 404
         response.raise_for_status.side_effect = requests.exceptions.HTTPError(response=response)
@@ -358,7 +390,7 @@ def test_no_retry_on_client_error(client):
 
 def test_retry_disabled(client):
     """Test that retries can be disabled."""
-    with patch.object(client.session, 'request') as mock_request:
+    with patch.object(client.session, 'send') as mock_request:
         mock_request.side_effect = requests.exceptions.ConnectionError("Connection failed")
 
         with pytest.raises(requests.exceptions.ConnectionError):
@@ -381,7 +413,7 @@ def test_make_request_success(client):
     with patch.object(client, '_make_request_with_retry') as mock_retry:
         mock_response = Mock()
         mock_response.headers = {'Content-Type': 'application/json'}
-        mock_response.json.return_value = {"result": "success"}
+        mock_response.content = b'{"result": "success"}'
         mock_retry.return_value = mock_response
 
         result = client._make_request('GET', '/test')
@@ -422,6 +454,113 @@ def test_make_request_handles_connection_error(client):
         assert result is None
 
 
+def test_read_only_gets_are_cached(client):
+    """
+    Test repeated polls of read-only endpoints reuse the cached result.
+
+    Educational Note:
+    Dashboards poll /health and /status constantly. A short TTL cache
+    removes the network round trip for calls inside the window.
+    """
+    with patch.object(client, '_make_request_with_retry') as mock_retry:
+        mock_response = Mock()
+        mock_response.headers = {'Content-Type': 'application/json'}
+        mock_response.content = b'{"status": "healthy"}'
+        mock_retry.return_value = mock_response
+
+        assert client.health_check() == {"status": "healthy"}
+        assert client.health_check() == {"status": "healthy"}
+        assert mock_retry.call_count == 1
+
+        # Writes invalidate the cache
+        client._make_request('POST', '/inventory', json_data={})
+        client.health_check()
+        assert mock_retry.call_count == 3
+
+
+def test_cache_disabled_with_zero_ttl(api_url):
+    """Test cache_ttl=0 sends every request to the network."""
+    client = _PatchableClient(api_url, cache_ttl=0)
+
+    with patch.object(client, '_make_request_with_retry') as mock_retry:
+        mock_response = Mock()
+        mock_response.headers = {'Content-Type': 'application/json'}
+        mock_response.content = b'{"status": "healthy"}'
+        mock_retry.return_value = mock_response
+
+        client.health_check()
+        client.health_check()
+        assert mock_retry.call_count == 2
+
+
+def test_cached_response_is_a_fresh_copy(client):
+    """Test callers can modify a cached result without changing later hits."""
+    with patch.object(client, '_make_request_with_retry') as mock_retry:
+        mock_response = Mock()
+        mock_response.headers = {'Content-Type': 'application/json'}
+        mock_response.content = b'{"status": "healthy"}'
+        mock_retry.return_value = mock_response
+
+        first = client.health_check()
+        first['api_url'] = 'http://elsewhere'
+
+        assert client.health_check() == {"status": "healthy"}
+        assert mock_retry.call_count == 1
+
+
+def test_token_change_invalidates_cache(client):
+    """
+    Test a new or cleared token drops responses fetched with the old one.
+
+    Educational Note:
+    Endpoints like /auth/users answer differently per user, so a cached
+    body must never outlive the token that fetched it.
+    """
+    with patch.object(client, '_make_request_with_retry') as mock_retry:
+        mock_response = Mock()
+        mock_response.headers = {'Content-Type': 'application/json'}
+        mock_response.content = b'[{"username": "fort_commander"}]'
+        mock_retry.return_value = mock_response
+
+        client.set_token("first_token")
+        client._make_request('GET', '/auth/users')
+        client.clear_token()
+        client._make_request('GET', '/auth/users')
+        assert mock_retry.call_count == 2
+
+    with patch.object(client.session, 'post') as mock_post:
+        mock_post.return_value = Mock(
+            status_code=200,
+            json=Mock(return_value={'access_token': 'second_token', 'expires_in': 3600})
+        )
+        assert client.login("fort_commander", "frontier_pass123")
+
+    assert client._cache == {}
+
+
+def test_circuit_opens_after_repeated_failures(api_url):
+    """
+    Test the circuit breaker skips requests to an unreachable outpost.
+
+    Educational Note:
+    After enough consecutive connection failures the client stops
+    calling the outpost for a cool-off window, failing fast instead.
+    """
+    client = _PatchableClient(api_url, circuit_failure_threshold=2)
+
+    with patch.object(client, '_make_request_with_retry') as mock_retry:
+        mock_retry.side_effect = requests.exceptions.ConnectionError("down")
+
+        assert client._make_request('GET', '/inventory') is None
+        assert not client.is_circuit_open
+        assert client._make_request('GET', '/inventory') is None
+        assert client.is_circuit_open
+
+        # Further calls don't touch the network
+        assert client._make_request('GET', '/inventory') is None
+        assert mock_retry.call_count == 2
+
+
 # ============================================================================
 # Endpoint Method Tests
 # ============================================================================
@@ -468,6 +607,135 @@ def test_get_inventory_without_filter(client):
         mock_request.assert_called_once_with('GET', '/inventory', params=None)
 
 
+def test_get_goods_with_filters(client):
+    """Test goods filters are sent to the API as query parameters."""
+    with patch.object(client, '_make_request') as mock_request:
+        mock_request.return_value = [{"name": "test"}]
+
+        client.get_goods(category="furs", quality="excellent")
+
+        mock_request.assert_called_once_with(
+            'GET', '/goods', params={'category': 'furs', 'quality': 'excellent'}
+        )
+
+
+def test_get_traders_with_filter(client):
+    """Test trader retrieval with trader type filter."""
+    with patch.object(client, '_make_request') as mock_request:
+        mock_request.return_value = [{"name": "test"}]
+
+        result = client.get_traders(trader_type="trapper")
+
+        mock_request.assert_called_once_with('GET', '/traders', params={'trader_type': 'trapper'})
+        assert result == [{"name": "test"}]
+
+
+def test_get_animals_with_filters(client):
+    """Test animal filters are sent as query parameters, not built into the path."""
+    with patch.object(client, '_make_request') as mock_request:
+        mock_request.return_value = [{"species": "Beaver"}]
+
+        client.get_animals(category="fur_bearer", status="abundant")
+
+        mock_request.assert_called_once_with(
+            'GET', '/animals', params={'category': 'fur_bearer', 'status': 'abundant'}
+        )
+
+
+def test_get_hunting_parties_without_filter(client):
+    """Test an unfiltered party request sends no query parameters."""
+    with patch.object(client, '_make_request') as mock_request:
+        mock_request.return_value = []
+
+        client.get_hunting_parties()
+
+        mock_request.assert_called_once_with('GET', '/parties', params=None)
+
+
+def test_batch_get_fetches_every_endpoint(client):
+    """Test batch_get returns each endpoint's response with its own params."""
+    responses = {'/harvests/summary': {"total_records": 3}, '/harvests': None}
+
+    with patch.object(client, '_make_request') as mock_request:
+        mock_request.side_effect = lambda method, endpoint, params=None: responses[endpoint]
+
+        result = client.batch_get(
+            ['/harvests/summary', '/harvests'],
+            params={'/harvests': {'limit': 20}}
+        )
+
+        assert result == responses
+        mock_request.assert_any_call('GET', '/harvests/summary', params=None)
+        mock_request.assert_any_call('GET', '/harvests', params={'limit': 20})
+
+
+def test_get_inventory_items_single_request(client):
+    """
+    Test bulk item lookup uses one request instead of one per ID.
+
+    Educational Note:
+    Batching N lookups into one call saves N-1 network round trips.
+    """
+    with patch.object(client, '_make_request') as mock_request:
+        mock_request.return_value = [{"item_id": 1}, {"item_id": 3}, {"item_id": 9}]
+
+        result = client.get_inventory_items([1, 3])
+
+        mock_request.assert_called_once_with(
+            'GET', '/inventory', params={'ids': '1,3', 'limit': 2}
+        )
+        # Items the outpost returned but weren't asked for are dropped
+        assert result == [{"item_id": 1}, {"item_id": 3}]
+
+
+def test_get_inventory_items_batches_past_server_limit(client):
+    """Test lookups of more IDs than the server accepts at once are split."""
+    with patch.object(client, '_make_request') as mock_request:
+        mock_request.side_effect = lambda method, endpoint, params: [
+            {"item_id": int(item_id)} for item_id in params['ids'].split(',')
+        ]
+
+        result = client.get_inventory_items(list(range(1, INVENTORY_IDS_PER_REQUEST + 501)))
+
+        assert mock_request.call_count == 2
+        limits = [call.kwargs['params']['limit'] for call in mock_request.call_args_list]
+        assert limits == [INVENTORY_IDS_PER_REQUEST, 500]
+        assert len(result) == INVENTORY_IDS_PER_REQUEST + 500
+
+
+def test_download_file_streams_to_disk(client, tmp_path):
+    """
+    Test downloads are streamed to disk chunk by chunk.
+
+    Educational Note:
+    Streaming keeps memory flat for large files - the body is never
+    loaded into a single bytes object.
+    """
+    destination = tmp_path / "fort.log"
+
+    with patch.object(client.session, 'get') as mock_get:
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.iter_content.return_value = [b"first ", b"second"]
+        mock_get.return_value = response
+
+        assert client.download_file("fort.log", str(destination)) is True
+
+        assert mock_get.call_args[1]['stream'] is True
+        assert destination.read_bytes() == b"first second"
+
+
+def test_download_file_handles_http_error(client, tmp_path):
+    """Test failed downloads return False instead of raising."""
+    with patch.object(client.session, 'get') as mock_get:
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError("404")
+        mock_get.return_value = response
+
+        assert client.download_file("missing.log", str(tmp_path / "out")) is False
+
+
 # ============================================================================
 # Protected Endpoint Tests
 # ============================================================================
@@ -522,7 +790,7 @@ def test_endpoint_leading_slash_handling(client):
     with patch.object(client, '_make_request_with_retry') as mock_retry:
         mock_response = Mock()
         mock_response.headers = {'Content-Type': 'application/json'}
-        mock_response.json.return_value = {}
+        mock_response.content = b'{}'
         mock_retry.return_value = mock_response
 
         # Both should work the same
@@ -0,0 +1,230 @@
+"""
+Unit Tests for Fishing Fort API
+
+This module tests the Fishing Fort inventory endpoints against a real
+SQLite database built from the fort's schema, covering the ids filter,
+conditional (ETag) requests and the inventory summary.
+
+Educational Note:
+These tests use a temporary database instead of mocks, so the SQL each
+endpoint builds is actually executed. The schema file's sample data
+gives every test the same known inventory.
+
+To run these tests:
+    pytest tests/test_fishing_fort_api.py -v
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import patch
+import sqlite3
+from pathlib import Path
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from raspberry_pi.api import fishing_fort
+from raspberry_pi.api.fishing_fort import MAX_IDS_PER_REQUEST, app
+from src.api_client.client import INVENTORY_IDS_PER_REQUEST
+
+
+SCHEMA_PATH = (
+    Path(__file__).parent.parent / "raspberry_pi" / "db" / "schemas" / "fishing_fort_schema.sql"
+)
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+@pytest.fixture
+def client(tmp_path):
+    """
+    Create a test client backed by a fresh copy of the sample database.
+
+    Educational Note:
+    Patching DB_PATH points the API at a throwaway file, so tests never
+    touch the fort's real data and always start from the same rows.
+    """
+    db_path = tmp_path / "fishing_fort.db"
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA_PATH.read_text())
+    conn.close()
+
+    with patch('raspberry_pi.api.fishing_fort.DB_PATH', db_path):
+        yield TestClient(app)
+
+
+# ============================================================================
+# Inventory ids Filter Tests
+# ============================================================================
+
+def test_get_inventory_by_ids(client):
+    """Test the ids filter returns only the requested items."""
+    response = client.get("/inventory", params={"ids": "1,3,5"})
+
+    assert response.status_code == 200
+    assert sorted(item["item_id"] for item in response.json()) == [1, 3, 5]
+
+
+def test_get_inventory_by_ids_ignores_unknown_ids(client):
+    """Test IDs with no matching item are simply left out."""
+    response = client.get("/inventory", params={"ids": "2,999"})
+
+    assert response.status_code == 200
+    assert [item["item_id"] for item in response.json()] == [2]
+
+
+def test_get_inventory_by_ids_combines_with_filters(client):
+    """Test the ids filter narrows the other filters rather than replacing them."""
+    response = client.get("/inventory", params={"ids": "1,2,3,4", "category": "food"})
+
+    assert response.status_code == 200
+    items = response.json()
+    assert sorted(item["item_id"] for item in items) == [1, 4]
+    assert all(item["category"] == "food" for item in items)
+
+
+def test_get_inventory_rejects_malformed_ids(client):
+    """Test non-integer IDs are a client error, not a server error."""
+    response = client.get("/inventory", params={"ids": "1,abc"})
+
+    assert response.status_code == 400
+
+
+def test_get_inventory_accepts_full_batch_of_ids(client):
+    """
+    Test the largest batch the client sends works with every filter applied.
+
+    Educational Note:
+    Each ID becomes a bound SQL variable. A full batch plus the other
+    filters and LIMIT/OFFSET must stay under SQLite's 999-variable limit
+    on older builds, or the query fails with a server error. The test
+    lowers this connection's limit to 999 to match those builds.
+    """
+    assert INVENTORY_IDS_PER_REQUEST <= MAX_IDS_PER_REQUEST
+
+    connect = fishing_fort.get_db_connection
+
+    def connect_with_old_limit():
+        conn = connect()
+        conn.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999)
+        return conn
+
+    ids = ",".join(str(item_id) for item_id in range(1, INVENTORY_IDS_PER_REQUEST + 1))
+    with patch('raspberry_pi.api.fishing_fort.get_db_connection', connect_with_old_limit):
+        response = client.get("/inventory", params={
+            "ids": ids,
+            "category": "food",
+            "min_quantity": 0,
+            "limit": INVENTORY_IDS_PER_REQUEST,
+        })
+
+    assert response.status_code == 200
+    assert all(item["category"] == "food" for item in response.json())
+
+
+def test_get_inventory_rejects_too_many_ids(client):
+    """Test a batch over the server's cap is a client error."""
+    ids = ",".join(str(item_id) for item_id in range(1, MAX_IDS_PER_REQUEST + 2))
+    response = client.get("/inventory", params={"ids": ids})
+
+    assert response.status_code == 400
+
+
+def test_get_inventory_rejects_limit_above_cap(client):
+    """Test limit is capped at 1000 items per request."""
+    response = client.get("/inventory", params={"limit": 1001})
+
+    assert response.status_code == 422
+
+
+# ============================================================================
+# Conditional Request (ETag) Tests
+# ============================================================================
+
+def test_inventory_etag_not_modified(client):
+    """
+    Test a request with the current ETag gets an empty 304.
+
+    Educational Note:
+    The client sends back the ETag it last saw. If the data hasn't
+    changed, the server skips the body entirely.
+    """
+    first = client.get("/inventory")
+    etag = first.headers["etag"]
+
+    second = client.get("/inventory", headers={"If-None-Match": etag})
+
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+
+
+def test_inventory_etag_changes_with_data(client):
+    """Test a stale ETag gets the full, updated body."""
+    etag = client.get("/inventory").headers["etag"]
+
+    updated = client.put("/inventory/1", json={
+        "name": "Salted Fish",
+        "category": "food",
+        "quantity": 10,
+        "unit": "pounds",
+        "value": 5.0,
+    })
+    assert updated.status_code == 200
+
+    response = client.get("/inventory", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+def test_inventory_etag_differs_per_filter(client):
+    """Test each filtered view carries its own ETag."""
+    food = client.get("/inventory", params={"category": "food"})
+    tools = client.get("/inventory", params={"category": "tools"})
+
+    assert food.headers["etag"] != tools.headers["etag"]
+
+    response = client.get(
+        "/inventory",
+        params={"category": "tools"},
+        headers={"If-None-Match": food.headers["etag"]}
+    )
+    assert response.status_code == 200
+
+
+# ============================================================================
+# Inventory Summary Tests
+# ============================================================================
+
+def test_inventory_summary(client):
+    """Test the summary aggregates the whole sample inventory."""
+    response = client.get("/inventory/summary")
+
+    assert response.status_code == 200
+    data = response.json()
+
+    assert data["total_items"] == 10
+    assert data["total_value"] == pytest.approx(640.0)
+    assert data["categories"] == 3
+    # Salt Barrels (12), Tea (20) and Nets (6) are under the threshold of 50
+    assert data["low_stock_items"] == 3
+    assert data["low_stock_threshold"] == 50
+
+
+def test_inventory_summary_with_filters(client):
+    """Test the summary honours the same filters as /inventory."""
+    response = client.get("/inventory/summary", params={"category": "tools", "min_quantity": 10})
+
+    assert response.status_code == 200
+    data = response.json()
+
+    # Hooks (200) only; Nets (6) are below min_quantity
+    assert data["total_items"] == 1
+    assert data["total_value"] == pytest.approx(40.0)
+    assert data["categories"] == 1
+    assert data["low_stock_items"] == 0
+
@@ -401,6 +401,21 @@ def test_get_parties_with_status_filter(client, sample_hunting_party):
 # Pelt Harvests Endpoint Tests
 # ============================================================================
 
+def test_get_harvests_with_limit_and_offset(client):
+    """Test the harvest page is applied in SQL, after the ordering."""
+    with patch('raspberry_pi.api.hunting_fort.get_db_connection') as mock_get_conn:
+        mock_conn = MagicMock()
+        mock_conn.execute.return_value.fetchall.return_value = []
+        mock_get_conn.return_value = mock_conn
+
+        response = client.get("/harvests?limit=20&offset=40")
+
+        assert response.status_code == 200
+        query, params = mock_conn.execute.call_args[0]
+        assert query.endswith("ORDER BY date_harvested DESC, harvest_id DESC LIMIT ? OFFSET ?")
+        assert params == [20, 40]
+
+
 def test_get_harvest_summary(client):
     """
     Test the harvest summary endpoint.
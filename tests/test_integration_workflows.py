@@ -76,22 +76,32 @@ def hunting_fort_url():
     return "http://localhost:8002"
 
 
+class _PatchableClient(OutpostAPIClient):
+    """
+    OutpostAPIClient with an instance __dict__.
+
+    OutpostAPIClient uses __slots__, so its methods can only be patched on
+    the class. These workflows patch each fort's client separately, which
+    needs per-instance attributes; a subclass without __slots__ has them.
+    """
+
+
 @pytest.fixture
 def fishing_client(fishing_fort_url):
     """Create API client for Fishing Fort."""
-    return OutpostAPIClient(fishing_fort_url)
+    return _PatchableClient(fishing_fort_url)
 
 
 @pytest.fixture
 def trading_client(trading_fort_url):
     """Create API client for Trading Fort."""
-    return OutpostAPIClient(trading_fort_url)
+    return _PatchableClient(trading_fort_url)
 
 
 @pytest.fixture
 def hunting_client(hunting_fort_url):
     """Create API client for Hunting Fort."""
-    return OutpostAPIClient(hunting_fort_url)
+    return _PatchableClient(hunting_fort_url)
 
 
 @pytest.fixture
@@ -0,0 +1,150 @@
+"""
+Unit Tests for the User Progress Models
+
+This module tests UserProfile and ChapterProgress, focusing on the cached
+progress (current chapter and completed count) staying correct however a
+chapter's status is changed.
+
+Educational Note:
+UserProfile caches answers the UI asks for on every rerun instead of
+rescanning all chapters each time. A cache is only as good as its
+invalidation, so these tests change statuses through every route -
+helper methods, direct assignment and copies - and check the cached
+answers against what a fresh scan would say.
+
+To run these tests:
+    pytest tests/test_models.py -v
+"""
+
+import copy
+import pytest
+
+from src.models.user import ChapterProgress, ChapterStatus, UserProfile
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+@pytest.fixture
+def profile():
+    """A new learner with only chapter 1 unlocked."""
+    return UserProfile(username="voyageur", display_name="Voyageur")
+
+
+# ============================================================================
+# Chapter Progress Tests
+# ============================================================================
+
+def test_new_profile_starts_at_chapter_one(profile):
+    """Test a new profile has ten chapters and begins at the first."""
+    assert len(profile.chapters) == 10
+    assert profile.get_current_chapter() == 1
+    assert profile.get_overall_progress() == 0.0
+    assert profile.get_chapter(2).status is ChapterStatus.LOCKED
+
+
+def test_completing_chapter_advances_progress(profile):
+    """Test completing a chapter and unlocking the next moves the learner on."""
+    profile.get_chapter(1).complete_chapter()
+    assert profile.unlock_chapter(2)
+
+    assert profile.get_current_chapter() == 2
+    assert profile.get_overall_progress() == 10.0
+
+
+def test_unlock_requires_previous_chapter(profile):
+    """Test a chapter stays locked until the one before it is completed."""
+    assert not profile.unlock_chapter(3)
+    assert profile.get_chapter(3).status is ChapterStatus.LOCKED
+
+
+def test_direct_status_assignment_updates_profile(profile):
+    """
+    Test assigning status directly keeps the cached progress in sync.
+
+    Educational Note:
+    status is a public attribute, so callers will assign it. The
+    profile has to hear about those changes just like the ones made by
+    complete_chapter().
+    """
+    profile.chapters[0].status = ChapterStatus.COMPLETED
+    profile.chapters[1].status = ChapterStatus.NOT_STARTED
+
+    assert profile.get_current_chapter() == 2
+    assert profile.get_overall_progress() == 10.0
+
+    profile.chapters[0].status = ChapterStatus.IN_PROGRESS
+
+    assert profile.get_current_chapter() == 1
+    assert profile.get_overall_progress() == 0.0
+
+
+def test_repeated_status_assignment_counts_once(profile):
+    """Test setting the same status twice doesn't double-count a chapter."""
+    chapter = profile.get_chapter(1)
+    chapter.complete_chapter()
+    chapter.status = ChapterStatus.COMPLETED
+
+    assert profile.get_overall_progress() == 10.0
+
+
+def test_all_chapters_completed(profile):
+    """Test a learner who finished everything has no current chapter."""
+    for chapter in profile.chapters:
+        chapter.status = ChapterStatus.COMPLETED
+
+    assert profile.get_current_chapter() is None
+    assert profile.get_overall_progress() == 100.0
+
+
+def test_profile_counts_chapters_passed_in():
+    """Test progress is counted for chapters supplied at construction."""
+    chapters = [
+        ChapterProgress(
+            chapter_number=i,
+            status=ChapterStatus.COMPLETED if i <= 3 else ChapterStatus.NOT_STARTED
+        )
+        for i in range(1, 11)
+    ]
+    profile = UserProfile(username="trader", display_name="Trader", chapters=chapters)
+
+    assert profile.get_overall_progress() == 30.0
+    assert profile.get_current_chapter() == 4
+
+
+def test_copied_profile_tracks_its_own_progress(profile):
+    """Test a deep copy's chapters report to the copy, not the original."""
+    profile.get_chapter(1).complete_chapter()
+    clone = copy.deepcopy(profile)
+
+    clone.chapters[0].status = ChapterStatus.IN_PROGRESS
+
+    assert clone.get_overall_progress() == 0.0
+    assert profile.get_overall_progress() == 10.0
+
+
+def test_complete_task_starts_chapter(profile):
+    """Test finishing a task marks a not-yet-started chapter as in progress."""
+    chapter = profile.get_chapter(1)
+    chapter.complete_task("first_ssh_login")
+
+    assert chapter.status is ChapterStatus.IN_PROGRESS
+    assert chapter.started_at is not None
+    assert chapter.get_progress_percentage(4) == 25.0
+    assert profile.get_current_chapter() == 1
+
+
+# ============================================================================
+# Serialization Tests
+# ============================================================================
+
+def test_profile_to_dict(profile):
+    """Test to_dict() renders statuses as values and includes progress."""
+    profile.chapters[0].status = ChapterStatus.COMPLETED
+    data = profile.to_dict()
+
+    assert data["chapters"][1]["status"] == "completed"
+    assert data["chapters"][2]["status"] == "locked"
+    assert data["overall_progress"] == 10.0
+    assert "_completed_count" not in data
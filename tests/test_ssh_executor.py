@@ -0,0 +1,326 @@
+"""
+Unit Tests for the SSH Executor
+
+This module tests the SSH helpers that don't need a live Raspberry Pi:
+the connection pool behind execute_remote_command(), batched commands
+and host key provisioning.
+
+Educational Note:
+SSH needs a real server on the other end, so these tests replace
+SSHExecutor.connect() with a stub that hands back a fake paramiko
+client. That keeps them fast and lets each test decide whether a
+connection succeeds, fails or drops.
+
+To run these tests:
+    pytest tests/test_ssh_executor.py -v
+"""
+
+import subprocess
+import threading
+import paramiko
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.ssh_module.executor import (
+    SSHExecutor,
+    SSHResult,
+    _POOL,
+    _get_or_connect,
+    _system_host_keys,
+    close_all_connections,
+    provision_host_key,
+)
+
+# A known_hosts line paramiko can't parse but OpenSSH accepts
+CERT_AUTHORITY_LINE = (
+    "@cert-authority *.frontier.example ssh-ed25519 "
+    "AAAAC3NzaC1lZDI1NTE5AAAAIOMqqnkVzrm0SdG6UOoqKLsabgH5C9okWi0dh2l9GKJl"
+)
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+def _fake_connect(self):
+    """Stand-in for SSHExecutor.connect() that attaches a live fake client."""
+    self.client = MagicMock()
+    self.client.get_transport.return_value.is_active.return_value = True
+    return True
+
+
+@pytest.fixture(autouse=True)
+def empty_pool():
+    """Start and finish every test with no pooled connections."""
+    close_all_connections()
+    yield
+    close_all_connections()
+
+
+@pytest.fixture(scope="module")
+def host_key():
+    """A generated host key standing in for an outpost's."""
+    return paramiko.ECDSAKey.generate()
+
+
+@pytest.fixture
+def outpost_presenting(host_key):
+    """Patch the network so provision_host_key() is offered host_key."""
+    with patch('src.ssh_module.executor.socket.create_connection'), \
+         patch('src.ssh_module.executor.paramiko.Transport') as mock_transport:
+        mock_transport.return_value.get_remote_server_key.return_value = host_key
+        yield mock_transport
+
+
+@pytest.fixture
+def connect():
+    """Patch SSHExecutor.connect with the fake above and expose the mock."""
+    with patch.object(SSHExecutor, 'connect', autospec=True, side_effect=_fake_connect) as mock_connect:
+        yield mock_connect
+
+
+def _run_locally(self, command, timeout=None):
+    """Stand-in for SSHExecutor.execute_command() that runs a local sh."""
+    proc = subprocess.run(['sh', '-c', command], capture_output=True, timeout=timeout)
+    success = proc.returncode == 0
+    return SSHResult(
+        success=success,
+        stdout_bytes=proc.stdout,
+        stderr_bytes=proc.stderr,
+        exit_code=proc.returncode,
+        error_message=None if success else "Command failed"
+    )
+
+
+@pytest.fixture
+def local_shell():
+    """Run execute_batch() scripts through a local shell instead of SSH."""
+    with patch.object(SSHExecutor, 'execute_command', autospec=True, side_effect=_run_locally):
+        yield SSHExecutor('pi-1', 'pi', password='secret')
+
+
+# ============================================================================
+# Connection Pool Tests
+# ============================================================================
+
+def test_pool_reuses_live_connection(connect):
+    """
+    Test a second call for the same host and credentials skips the handshake.
+
+    Educational Note:
+    Reusing the authenticated connection is the point of the pool:
+    only the first call pays for the SSH handshake.
+    """
+    first = _get_or_connect('pi-1', 'pi', 'secret', None, 22)
+    second = _get_or_connect('pi-1', 'pi', 'secret', None, 22)
+
+    assert first is second
+    assert connect.call_count == 1
+
+
+def test_pool_separates_credentials(connect):
+    """Test a caller with different credentials never gets another's connection."""
+    right = _get_or_connect('pi-1', 'pi', 'secret', None, 22)
+    wrong = _get_or_connect('pi-1', 'pi', 'guess', None, 22)
+    keyed = _get_or_connect('pi-1', 'pi', None, '/home/pi/.ssh/id_ed25519', 22)
+
+    assert len({id(right), id(wrong), id(keyed)}) == 3
+    assert connect.call_count == 3
+
+
+def test_pool_rebuilds_dropped_connection(connect):
+    """Test a connection whose transport died is replaced, not reused."""
+    first = _get_or_connect('pi-1', 'pi', 'secret', None, 22)
+    old_client = first.client
+    old_client.get_transport.return_value.is_active.return_value = False
+
+    second = _get_or_connect('pi-1', 'pi', 'secret', None, 22)
+
+    assert second is not first
+    old_client.close.assert_called_once()
+    assert connect.call_count == 2
+
+
+def test_pool_does_not_keep_failed_connection():
+    """Test a failed connect returns None and leaves nothing in the pool."""
+    with patch.object(SSHExecutor, 'connect', return_value=False):
+        assert _get_or_connect('pi-down', 'pi', 'secret', None, 22) is None
+
+    assert _POOL == {}
+
+
+def test_slow_connect_does_not_block_other_hosts():
+    """
+    Test connecting to one outpost doesn't hold up commands to the others.
+
+    Educational Note:
+    An unreachable Pi can take the whole SSH timeout to fail. If that
+    wait held a pool-wide lock, fanout_execute would stall every host
+    behind it.
+    """
+    slow_started = threading.Event()
+    release_slow = threading.Event()
+
+    def connect(self):
+        if self.hostname == 'pi-slow':
+            slow_started.set()
+            release_slow.wait(timeout=5)
+        return _fake_connect(self)
+
+    with patch.object(SSHExecutor, 'connect', autospec=True, side_effect=connect):
+        slow = threading.Thread(
+            target=_get_or_connect, args=('pi-slow', 'pi', 'secret', None, 22)
+        )
+        slow.start()
+        assert slow_started.wait(timeout=5)
+
+        fast = threading.Thread(
+            target=_get_or_connect, args=('pi-fast', 'pi', 'secret', None, 22)
+        )
+        fast.start()
+        fast.join(timeout=2)
+        fast_finished = not fast.is_alive()
+
+        release_slow.set()
+        slow.join(timeout=5)
+
+    assert fast_finished
+    assert {key[0] for key in _POOL} == {'pi-slow', 'pi-fast'}
+
+
+def test_close_all_connections_disconnects_and_empties_pool(connect):
+    """Test close_all_connections() closes every pooled client and evicts it."""
+    first = _get_or_connect('pi-1', 'pi', 'secret', None, 22)
+    second = _get_or_connect('pi-2', 'pi', 'secret', None, 22)
+    clients = [first.client, second.client]
+
+    close_all_connections()
+
+    assert _POOL == {}
+    for client in clients:
+        client.close.assert_called_once()
+    assert first.client is None and second.client is None
+
+    # The next call opens a fresh connection
+    assert _get_or_connect('pi-1', 'pi', 'secret', None, 22) is not first
+
+
+# ============================================================================
+# Batch Execution Tests
+# ============================================================================
+
+def test_batch_splits_output_per_command(local_shell):
+    """
+    Test each command in a batch gets its own output and exit code.
+
+    Educational Note:
+    The whole batch is one remote script; the separators printed after
+    each command are what let us hand every caller its own result.
+    """
+    results = local_shell.execute_batch(['echo one', 'echo two >&2; false', 'echo three'])
+
+    assert [r.exit_code for r in results] == [0, 1, 0]
+    assert [r.stdout for r in results] == ['one\n', '', 'three\n']
+    assert results[1].stderr == 'two\n'
+    assert not results[1].success
+
+
+def test_batch_keeps_exit_status_of_command_that_exits(local_shell):
+    """Test a command that calls `exit` keeps its own exit code and output."""
+    results = local_shell.execute_batch(['echo one', 'echo bye; echo oops >&2; exit 3', 'echo three'])
+
+    assert results[0].success
+    assert results[1].exit_code == 3
+    assert results[1].stdout == 'bye\n'
+    assert results[1].stderr == 'oops\n'
+    assert results[2].exit_code == -1
+    assert results[2].error_message == "Command did not run"
+
+
+def test_batch_reports_syntax_error_on_its_command(local_shell):
+    """Test a syntax error is blamed on its own command, not the whole batch."""
+    results = local_shell.execute_batch(['echo one', 'if then', 'echo three'])
+
+    assert results[0].success
+    assert results[0].stdout == 'one\n'
+    assert results[1].exit_code == 2
+    assert 'then' in results[1].stderr
+    assert results[2].error_message == "Command did not run"
+
+
+def test_batch_commands_share_one_shell(local_shell, tmp_path):
+    """Test a `cd` or exported variable carries over to later commands."""
+    results = local_shell.execute_batch([
+        f'cd {tmp_path}',
+        'export FORT=fishing',
+        'pwd; echo $FORT',
+    ])
+
+    assert results[2].stdout == f'{tmp_path}\nfishing\n'
+
+
+def test_batch_connection_failure_fails_every_command():
+    """Test every command carries the error when the batch never ran."""
+    failed = SSHResult(
+        success=False,
+        stdout_bytes=b"",
+        stderr_bytes=b"",
+        exit_code=-1,
+        error_message="Not connected to SSH host"
+    )
+    with patch.object(SSHExecutor, 'execute_command', return_value=failed):
+        results = SSHExecutor('pi-1', 'pi').execute_batch(['uptime', 'df -h'])
+
+    assert [r.exit_code for r in results] == [-1, -1]
+    assert all(r.error_message == "Not connected to SSH host" for r in results)
+
+
+# ============================================================================
+# Host Key Provisioning Tests
+# ============================================================================
+
+def test_provision_appends_without_rewriting_known_hosts(tmp_path, host_key, outpost_presenting):
+    """
+    Test enrolling an outpost leaves the user's existing known_hosts intact.
+
+    Educational Note:
+    known_hosts belongs to the user. Comments and entries paramiko can't
+    parse must survive; enrolling one outpost only adds one line.
+    """
+    known_hosts = tmp_path / "known_hosts"
+    original = f"# fleet hosts\n{CERT_AUTHORITY_LINE}"  # no trailing newline
+    known_hosts.write_text(original)
+
+    assert provision_host_key('fishing-fort.local', known_hosts_path=str(known_hosts))
+
+    lines = known_hosts.read_text().splitlines()
+    assert lines[:2] == original.splitlines()
+    assert lines[2] == f"fishing-fort.local {host_key.get_name()} {host_key.get_base64()}"
+
+
+def test_provision_skips_known_key(tmp_path, host_key, outpost_presenting):
+    """Test provisioning the same outpost twice writes its key once."""
+    known_hosts = tmp_path / "known_hosts"
+
+    assert provision_host_key('fishing-fort.local', port=2222, known_hosts_path=str(known_hosts))
+    first = known_hosts.read_text()
+    assert provision_host_key('fishing-fort.local', port=2222, known_hosts_path=str(known_hosts))
+
+    assert known_hosts.read_text() == first
+    assert first.startswith("[fishing-fort.local]:2222 ")
+
+
+def test_system_host_keys_parsed_once_until_file_changes(tmp_path, host_key, outpost_presenting):
+    """Test connect() reuses the parsed known_hosts until a key is added."""
+    known_hosts = tmp_path / "known_hosts"
+    known_hosts.write_text(CERT_AUTHORITY_LINE + "\n")
+
+    before = _system_host_keys(str(known_hosts))
+    assert _system_host_keys(str(known_hosts)) is before
+    assert before.lookup('trading-fort.local') is None
+
+    provision_host_key('trading-fort.local', known_hosts_path=str(known_hosts))
+
+    after = _system_host_keys(str(known_hosts))
+    assert after is not before
+    assert after.check('trading-fort.local', host_key)